@@ -1,5 +1,8 @@
 import os
 from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
 
 # 기본 디렉토리 설정
 BASE_DIR = Path(__file__).resolve().parent
@@ -16,4 +19,95 @@ os.makedirs(PROFILE_IMAGES_DIR, exist_ok=True)
 ALLOWED_IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".gif"]
 
 # 최대 이미지 크기 (5MB)
-MAX_IMAGE_SIZE = 5 * 1024 * 1024 
\ No newline at end of file
+MAX_IMAGE_SIZE = 5 * 1024 * 1024
+
+# 팔로워 수가 이 값을 넘는 작성자의 포스트는 타임라인에 펼치지 않고 조회 시 가져옴
+TIMELINE_FANOUT_MAX_FOLLOWERS = int(os.getenv("TIMELINE_FANOUT_MAX_FOLLOWERS", "5000"))
+
+# 새로 팔로우할 때 타임라인에 채워 넣을 최근 포스트 수
+TIMELINE_BACKFILL_LIMIT = int(os.getenv("TIMELINE_BACKFILL_LIMIT", "100"))
+
+# 참여 카운터 버퍼를 DB에 반영하는 주기 (초)
+COUNTER_FLUSH_INTERVAL_SECONDS = float(os.getenv("COUNTER_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+# 참여 카운터를 실제 행 수와 대조해 바로잡는 주기 (초)
+COUNTER_RECONCILE_INTERVAL_SECONDS = float(os.getenv("COUNTER_RECONCILE_INTERVAL_SECONDS", "3600"))
+
+# PostDetail 캐시 최대 항목 수와 만료 시간 (초)
+POST_CACHE_MAX_ENTRIES = int(os.getenv("POST_CACHE_MAX_ENTRIES", "10000"))
+POST_CACHE_TTL_SECONDS = float(os.getenv("POST_CACHE_TTL_SECONDS", "60"))
+
+# /posts/viewer-state 한 번에 조회할 수 있는 최대 포스트 수
+VIEWER_STATE_MAX_IDS = int(os.getenv("VIEWER_STATE_MAX_IDS", "500"))
+
+# 트렌딩 논문을 계산하는 구간 (시간 버킷 수)
+TRENDING_WINDOW_HOURS = int(os.getenv("TRENDING_WINDOW_HOURS", "168"))
+
+# 트렌딩 점수에 반영할 신호별 가중치
+TRENDING_WEIGHTS = {
+    "post_count": float(os.getenv("TRENDING_WEIGHT_POST", "1.0")),
+    "like_count": float(os.getenv("TRENDING_WEIGHT_LIKE", "0.2")),
+    "scrap_count": float(os.getenv("TRENDING_WEIGHT_SCRAP", "0.5")),
+}
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+# 데이터베이스 연결 풀 설정 (배포 환경별로 조정)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# 풀이 가득 찼을 때 연결을 기다리는 최대 시간 (초)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# 연결을 꺼낼 때마다 살아 있는지 확인
+DB_POOL_PRE_PING = _env_flag("DB_POOL_PRE_PING", "true")
+# 이 시간(초)보다 오래된 연결은 새로 맺음 (-1이면 사용 안 함)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# 쿼리 하나의 최대 실행 시간 (밀리초, 0이면 제한 없음)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+# 실행되는 모든 SQL을 로그로 남김 (개발용)
+DB_ECHO = _env_flag("DB_ECHO", "false")
+
+# 한 요청에서 같은 SQL이 이 횟수 이상 실행되면 N+1로 의심해 경고
+QUERY_N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", "10"))
+
+# eager load하지 않은 관계에 접근하면 예외를 냄 (테스트/개발용)
+DB_STRICT_LOADING = _env_flag("DB_STRICT_LOADING", "false")
+
+# 검증한 JWT 클레임 캐시 (토큰 문자열 기준, 토큰 만료 시각을 넘기지 않음)
+AUTH_CLAIMS_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CLAIMS_CACHE_MAX_ENTRIES", "20000"))
+AUTH_CLAIMS_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CLAIMS_CACHE_TTL_SECONDS", "300"))
+
+# 인증된 사용자 정보 캐시 (사용자 ID 기준)
+AUTH_PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+AUTH_PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+
+# bcrypt 비용 (2^rounds). 바꾸면 다음 로그인 때 기존 해시가 새 비용으로 다시 저장됨
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# 비밀번호 해싱 전용 스레드 수와 대기 가능한 최대 요청 수 (넘으면 503)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# arXiv 검색: 동시에 보낼 수 있는 요청 수, 디스크 응답 캐시 위치와 유효 시간
+ARXIV_MAX_CONCURRENCY = int(os.getenv("ARXIV_MAX_CONCURRENCY", "2"))
+ARXIV_CACHE_DIR = os.getenv("ARXIV_CACHE_DIR", os.path.join(BASE_DIR, "cache", "arxiv"))
+ARXIV_CACHE_TTL_SECONDS = float(os.getenv("ARXIV_CACHE_TTL_SECONDS", str(6 * 60 * 60)))
+# 만료된 항목을 원격 호출 실패 시 대체용으로 보관하는 최대 기간과 최대 파일 수
+ARXIV_CACHE_MAX_STALE_SECONDS = float(os.getenv("ARXIV_CACHE_MAX_STALE_SECONDS", str(7 * 24 * 60 * 60)))
+ARXIV_CACHE_MAX_ENTRIES = int(os.getenv("ARXIV_CACHE_MAX_ENTRIES", "10000"))
+
+# 로컬 논문 카탈로그: 수집 배치 크기, 검색 결과가 이 개수보다 적으면 arXiv 실시간 검색으로 대체
+ARXIV_INGEST_BATCH_SIZE = int(os.getenv("ARXIV_INGEST_BATCH_SIZE", "1000"))
+PAPER_CATALOG_MIN_RESULTS = int(os.getenv("PAPER_CATALOG_MIN_RESULTS", "1"))
+
+# GPT 논문 분석: DB에 저장한 결과 앞에 두는 인메모리 캐시 크기와 유효 시간
+PAPER_ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("PAPER_ANALYSIS_CACHE_MAX_ENTRIES", "1000"))
+PAPER_ANALYSIS_CACHE_TTL_SECONDS = float(os.getenv("PAPER_ANALYSIS_CACHE_TTL_SECONDS", str(24 * 60 * 60)))
+
+# 워크스페이스 추천: 후보 출처(팔로우한 사용자, 연구 분야, 관심 주제, 전체 활성도)마다 가져오는 최대 후보 수
+WORKSPACE_RECOMMENDATION_CANDIDATES = int(os.getenv("WORKSPACE_RECOMMENDATION_CANDIDATES", "100"))
+
+# /diagnostics/* 를 조회할 수 있는 운영자 이메일 (쉼표로 구분). 비어 있으면 아무도 조회할 수 없음
+DIAGNOSTICS_ALLOWED_EMAILS = frozenset(
+    email.strip().lower() for email in os.getenv("DIAGNOSTICS_ALLOWED_EMAILS", "").split(",") if email.strip()
+)
@@ -1,9 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from .routers import papers, auth, scraps, groups, comments, profile, workspaces, posts, users
-from .models.database import init_db, engine, Base
-from .config import MEDIA_DIR
+from .routers import papers, auth, scraps, groups, comments, profile, workspaces, posts, users, diagnostics
+from .models.database import engine
+from .models.migrate import check_schema_version
+from .models.async_database import async_engine
+from .config import MEDIA_DIR, DB_STRICT_LOADING
+from .utils.query_stats import QueryStatsMiddleware, instrument_engine, enable_strict_loading
+from .services.counter_service import run_counter_jobs, shutdown_counter_jobs
+from .utils.password_hasher import password_hasher
+from .services.arxiv_service import arxiv_service
+import asyncio
 import uvicorn
 import os
 
@@ -23,15 +30,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 앱 시작 시 데이터베이스 초기화
+# 요청별 쿼리 수/DB 시간 집계 및 N+1 경고
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+app.add_middleware(QueryStatsMiddleware)
+
+if DB_STRICT_LOADING:
+    enable_strict_loading()
+
+# 앱 시작 시 스키마 버전만 확인 (마이그레이션/시드는 app.manage로 별도 실행)
 @app.on_event("startup")
 async def startup_event():
-    try:
-        from .models.database import init_db
-        init_db()
-        Base.metadata.create_all(bind=engine)
-    except Exception as e:
-        print(f"Database initialization error: {e}")
+    check_schema_version()
+
+    # 참여 카운터 버퍼 flush 및 drift 보정 작업 시작
+    app.state.counter_jobs = asyncio.create_task(run_counter_jobs())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.counter_jobs.cancel()
+    await shutdown_counter_jobs()
+    await async_engine.dispose()
+    password_hasher.shutdown()
+    arxiv_service.shutdown()
 
 app.include_router(auth.router)
 app.include_router(papers.router)
@@ -42,6 +63,7 @@ app.include_router(profile.router)
 app.include_router(workspaces.router)
 app.include_router(posts.router)
 app.include_router(users.router)
+app.include_router(diagnostics.router)
 
 # 정적 파일 제공 설정
 # 미디어 디렉토리가 없으면 생성
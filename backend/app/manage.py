@@ -0,0 +1,66 @@
+"""데이터베이스 관리 명령.
+
+    python -m app.manage migrate          # 대기 중인 스키마 마이그레이션 적용
+    python -m app.manage version          # 현재/최신 스키마 버전 출력
+    python -m app.manage seed             # 개발용 시드 데이터 삽입 (멱등)
+    python -m app.manage ingest-arxiv PATH  # arXiv 메타데이터 덤프(JSONL/OAI-PMH XML)를 papers로 수집
+"""
+import argparse
+from typing import List, Optional
+
+from .config import ARXIV_INGEST_BATCH_SIZE
+from .models.database import SessionLocal, engine
+from .models.migrate import current_version, latest_version, migrate
+from .models.seed import seed_demo_data
+from .services.arxiv_ingest import FORMATS, ingest
+
+def _migrate(args) -> None:
+    applied = migrate(target=args.target)
+    for migration in applied:
+        print(f"Applied {migration.version:04d} {migration.name}")
+    if not applied:
+        print("Database schema is up to date")
+
+def _version(args) -> None:
+    with engine.connect() as connection:
+        print(f"current: {current_version(connection)}, latest: {latest_version()}")
+
+def _seed(args) -> None:
+    db = SessionLocal()
+    try:
+        created = seed_demo_data(db)
+    finally:
+        db.close()
+    print(", ".join(f"{name}: {count}" for name, count in created.items()))
+
+def _ingest_arxiv(args) -> None:
+    for result in ingest(SessionLocal, args.path, fmt=args.format, batch_size=args.batch_size, restart=args.restart):
+        if result.batches == 0:
+            print(f"{result.source}: already ingested")
+            continue
+        print(f"{result.source}: {result.upserted} papers upserted, {result.skipped} skipped "
+              f"(resumed from {result.resumed_from})")
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.manage")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="스키마 마이그레이션 적용")
+    migrate_parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    migrate_parser.set_defaults(func=_migrate)
+
+    subparsers.add_parser("version", help="스키마 버전 확인").set_defaults(func=_version)
+    subparsers.add_parser("seed", help="개발용 시드 데이터 삽입").set_defaults(func=_seed)
+
+    ingest_parser = subparsers.add_parser("ingest-arxiv", help="arXiv 메타데이터 덤프 수집")
+    ingest_parser.add_argument("path", help="JSONL 파일, OAI-PMH XML 파일 또는 XML 파일 디렉토리")
+    ingest_parser.add_argument("--format", choices=FORMATS, default=None, help="기본값: 확장자로 판단")
+    ingest_parser.add_argument("--batch-size", type=int, default=ARXIV_INGEST_BATCH_SIZE)
+    ingest_parser.add_argument("--restart", action="store_true", help="재개 지점을 무시하고 처음부터 수집")
+    ingest_parser.set_defaults(func=_ingest_arxiv)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from .database import DATABASE_URL, engine_options
+from ..config import DB_STATEMENT_TIMEOUT_MS
+from ..utils.db_pool import InstrumentedAsyncQueuePool
+
+def _to_async_url(url: str) -> str:
+    """동기 드라이버 URL을 asyncpg 드라이버 URL로 바꿉니다."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+ASYNC_DATABASE_URL = _to_async_url(DATABASE_URL)
+
+def _connect_args() -> dict:
+    # asyncpg는 server_settings로 세션 설정을 전달
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        return {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+    return {}
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    connect_args=_connect_args(),
+    **engine_options()
+)
+
+# 커밋 후에도 로드된 속성을 그대로 쓸 수 있도록 expire_on_commit=False
+# (비동기 세션에서는 만료된 속성을 다시 읽는 암묵적 IO가 불가능함)
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
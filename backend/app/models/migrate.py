@@ -0,0 +1,95 @@
+import importlib
+import pkgutil
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import List, Optional
+
+from sqlalchemy import text
+
+from .database import engine
+
+# 마이그레이션은 migrations/mNNNN_<이름>.py 모듈로 작성하며, 번호 순서대로 한 번씩 적용됨
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+_MODULE_PATTERN = re.compile(r"^m(\d{4})_\w+$")
+
+# 여러 워커가 동시에 마이그레이션하지 않도록 잡는 advisory lock 키
+MIGRATION_LOCK_KEY = 73112024
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    module: ModuleType
+
+    @property
+    def description(self) -> str:
+        return getattr(self.module, "DESCRIPTION", self.name)
+
+def load_migrations() -> List[Migration]:
+    migrations = []
+    for module_info in pkgutil.iter_modules([str(MIGRATIONS_DIR)]):
+        match = _MODULE_PATTERN.match(module_info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{__package__}.migrations.{module_info.name}")
+        migrations.append(Migration(int(match.group(1)), module_info.name, module))
+    migrations.sort(key=lambda migration: migration.version)
+
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions: {versions}")
+    return migrations
+
+def latest_version() -> int:
+    migrations = load_migrations()
+    return migrations[-1].version if migrations else 0
+
+def _ensure_version_table(connection) -> None:
+    connection.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        " version INTEGER PRIMARY KEY,"
+        " description VARCHAR NOT NULL,"
+        " applied_at TIMESTAMP NOT NULL DEFAULT (now() at time zone 'utc'))"
+    ))
+
+def current_version(connection) -> int:
+    """적용된 마지막 마이그레이션 번호. 버전 테이블이 없으면 0."""
+    if connection.execute(text("SELECT to_regclass('schema_version')")).scalar() is None:
+        return 0
+    return connection.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar()
+
+def migrate(target: Optional[int] = None) -> List[Migration]:
+    """아직 적용되지 않은 마이그레이션을 한 트랜잭션에서 순서대로 적용하고, 적용한 목록을 반환합니다."""
+    migrations = load_migrations()
+    with engine.begin() as connection:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        _ensure_version_table(connection)
+        current = current_version(connection)
+
+        applied = []
+        for migration in migrations:
+            if migration.version <= current or (target is not None and migration.version > target):
+                continue
+            migration.module.upgrade(connection)
+            connection.execute(
+                text("INSERT INTO schema_version (version, description) VALUES (:version, :description)"),
+                {"version": migration.version, "description": migration.description}
+            )
+            applied.append(migration)
+    return applied
+
+def check_schema_version() -> int:
+    """DB 스키마가 코드가 기대하는 버전인지 확인합니다. 서버 시작 시 호출합니다."""
+    expected = latest_version()
+    with engine.connect() as connection:
+        current = current_version(connection)
+    if current < expected:
+        raise RuntimeError(
+            f"Database schema is at version {current}, expected {expected}. "
+            f"Run `python -m app.manage migrate` first."
+        )
+    if current > expected:
+        print(f"Database schema version {current} is newer than this code ({expected})")
+    return current
@@ -0,0 +1,14 @@
+"""초기 스키마.
+
+빠진 테이블만 checkfirst로 만듭니다. 이미 있는 테이블은 바꾸지 않으므로, 마이그레이션 도입 전의
+create_all로 만든 데이터베이스에 필요한 컬럼/제약/인덱스는 0010에서 추가합니다.
+이후 마이그레이션은 이 단계가 최신 모델로 만든 새 데이터베이스에도 적용되므로
+IF NOT EXISTS 같은 멱등 DDL로 작성해야 합니다.
+"""
+from ..database import Base
+from .. import models  # noqa: F401 (모든 테이블을 메타데이터에 등록)
+
+DESCRIPTION = "baseline schema"
+
+def upgrade(connection) -> None:
+    Base.metadata.create_all(bind=connection, checkfirst=True)
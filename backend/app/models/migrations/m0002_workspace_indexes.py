@@ -0,0 +1,18 @@
+"""워크스페이스 추천 집계 쿼리용 인덱스."""
+from sqlalchemy import text
+
+DESCRIPTION = "workspace member/paper indexes"
+
+def upgrade(connection) -> None:
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_workspace_members_workspace_user"
+        " ON workspace_members (workspace_id, user_id)"
+    ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_workspace_members_user_workspace"
+        " ON workspace_members (user_id, workspace_id)"
+    ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_workspace_papers_workspace"
+        " ON workspace_papers (workspace_id)"
+    ))
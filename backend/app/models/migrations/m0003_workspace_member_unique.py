@@ -0,0 +1,31 @@
+"""워크스페이스 멤버 중복 방지와 member_count 보정.
+
+가입 시 member_count를 SQL 증분으로 유지하므로, 기존 중복 멤버를 정리하고 유니크 제약을 건 뒤
+실제 멤버 수로 카운터를 한 번 맞춥니다. 유니크 제약의 인덱스가 0002의 (workspace_id, user_id)
+인덱스를 대신합니다.
+"""
+from sqlalchemy import text
+
+DESCRIPTION = "unique workspace members and member_count backfill"
+
+def upgrade(connection) -> None:
+    connection.execute(text(
+        "DELETE FROM workspace_members a USING workspace_members b"
+        " WHERE a.workspace_id = b.workspace_id AND a.user_id = b.user_id AND a.id > b.id"
+    ))
+    connection.execute(text(
+        "DO $$ BEGIN"
+        " IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_workspace_members_workspace_user') THEN"
+        " ALTER TABLE workspace_members"
+        " ADD CONSTRAINT uq_workspace_members_workspace_user UNIQUE (workspace_id, user_id);"
+        " END IF;"
+        " END $$"
+    ))
+    connection.execute(text("DROP INDEX IF EXISTS ix_workspace_members_workspace_user"))
+    connection.execute(text(
+        "UPDATE workspaces w SET member_count = counts.member_count"
+        " FROM (SELECT ws.id, count(m.id) AS member_count"
+        "       FROM workspaces ws LEFT JOIN workspace_members m ON m.workspace_id = ws.id"
+        "       GROUP BY ws.id) counts"
+        " WHERE counts.id = w.id AND w.member_count IS DISTINCT FROM counts.member_count"
+    ))
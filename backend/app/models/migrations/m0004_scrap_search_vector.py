@@ -0,0 +1,27 @@
+"""스크랩 전문 검색.
+
+한 번도 채워지지 않던 Text 타입 search_vector를 본문/메모로 만드는 tsvector 생성 컬럼으로 바꾸고
+GIN 인덱스를 추가합니다. 생성 컬럼이므로 생성/수정 시 DB가 자동으로 갱신합니다.
+"""
+from sqlalchemy import text
+
+from ..models import SCRAP_SEARCH_VECTOR_SQL
+
+DESCRIPTION = "scrap full-text search vector"
+
+def upgrade(connection) -> None:
+    connection.execute(text(
+        "DO $$ BEGIN"
+        " IF EXISTS (SELECT 1 FROM information_schema.columns"
+        "            WHERE table_name = 'scraps' AND column_name = 'search_vector' AND data_type <> 'tsvector') THEN"
+        " ALTER TABLE scraps DROP COLUMN search_vector;"
+        " END IF;"
+        " END $$"
+    ))
+    connection.execute(text(
+        "ALTER TABLE scraps ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        f" GENERATED ALWAYS AS ({SCRAP_SEARCH_VECTOR_SQL}) STORED"
+    ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_scraps_search_vector ON scraps USING gin (search_vector)"
+    ))
@@ -0,0 +1,13 @@
+"""사용자 검색용 pg_trgm 확장과 트라이그램 GIN 인덱스."""
+from sqlalchemy import text
+
+from ..models import USER_SEARCH_COLUMNS
+
+DESCRIPTION = "trigram indexes for user search"
+
+def upgrade(connection) -> None:
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for column in USER_SEARCH_COLUMNS:
+        connection.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_users_{column}_trgm ON users USING gin ({column} gin_trgm_ops)"
+        ))
@@ -0,0 +1,19 @@
+"""워크스페이스 전문 검색.
+
+트리거가 유지하는 tsvector 컬럼과 GIN 인덱스를 추가하고 기존 행을 채웁니다.
+"""
+from sqlalchemy import text
+
+from ..models import WORKSPACE_SEARCH_TRIGGER_DDL
+
+DESCRIPTION = "workspace full-text search vector"
+
+def upgrade(connection) -> None:
+    connection.execute(text("ALTER TABLE workspaces ADD COLUMN IF NOT EXISTS search_vector tsvector"))
+    for statement in WORKSPACE_SEARCH_TRIGGER_DDL:
+        connection.execute(text(statement))
+    # 트리거를 거치도록 검색 대상 컬럼을 그대로 다시 써서 기존 행을 채움
+    connection.execute(text("UPDATE workspaces SET name = name WHERE search_vector IS NULL"))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_workspaces_search_vector ON workspaces USING gin (search_vector)"
+    ))
@@ -0,0 +1,75 @@
+"""로컬 논문 카탈로그.
+
+arXiv 메타데이터를 대량으로 넣어 검색하기 위해 papers에 전문 검색 생성 컬럼과 GIN 인덱스를,
+수집 재개 지점을 저장하는 ingestion_checkpoints 테이블을 추가합니다.
+
+카탈로그와 실시간 검색은 버전 없는 arXiv ID('2101.00001')를 쓰므로, 기존 행에 남아 있는
+'http://arxiv.org/abs/2101.00001v2' 형식도 같은 형태로 바꿉니다. 바꾼 ID가 겹치는 행은 이미
+정규화된 행(없으면 가장 오래된 행)으로 합치고, 그 행을 참조하던 데이터도 옮깁니다.
+"""
+from sqlalchemy import text
+
+from ..models import PAPER_SEARCH_VECTOR_SQL, IngestionCheckpoint
+
+DESCRIPTION = "paper catalog search vector and ingestion checkpoints"
+
+# arxiv_ingest.canonical_arxiv_id와 같은 규칙
+CANONICAL_ARXIV_ID_SQL = (
+    r"regexp_replace(regexp_replace(btrim(arxiv_id),"
+    r" '^(https?://arxiv\.org/abs/|oai:arXiv\.org:|arXiv:)', ''), 'v[0-9]+$', '')"
+)
+
+# 중복 행의 paper_id를 남길 행으로 옮기기만 하면 되는 테이블
+_PAPER_REFERENCES = ("posts", "scraps", "group_shared_papers", "workspace_papers")
+
+def _canonicalize_arxiv_ids(connection) -> None:
+    connection.execute(text("DROP TABLE IF EXISTS paper_merge"))
+    connection.execute(text(
+        "CREATE TEMPORARY TABLE paper_merge AS"
+        " SELECT id, canonical,"
+        "        first_value(id) OVER (PARTITION BY canonical ORDER BY arxiv_id = canonical DESC, id) AS keep_id"
+        f" FROM (SELECT id, arxiv_id, {CANONICAL_ARXIV_ID_SQL} AS canonical"
+        "       FROM papers WHERE arxiv_id IS NOT NULL) p"
+    ))
+
+    for table in _PAPER_REFERENCES:
+        connection.execute(text(
+            f"UPDATE {table} t SET paper_id = m.keep_id FROM paper_merge m"
+            " WHERE t.paper_id = m.id AND m.id <> m.keep_id"
+        ))
+    # 합친 뒤 같은 워크스페이스에 같은 논문이 두 번 담긴 경우 먼저 추가한 것만 남김
+    connection.execute(text(
+        "DELETE FROM workspace_papers a USING workspace_papers b"
+        " WHERE a.workspace_id = b.workspace_id AND a.paper_id = b.paper_id AND a.id > b.id"
+    ))
+    # 트렌딩 롤업은 (paper_id, bucket)이 키라서 더해서 합침
+    connection.execute(text(
+        "INSERT INTO paper_engagement_hourly (paper_id, bucket, post_count, like_count, scrap_count)"
+        " SELECT m.keep_id, e.bucket, sum(e.post_count), sum(e.like_count), sum(e.scrap_count)"
+        " FROM paper_engagement_hourly e JOIN paper_merge m ON m.id = e.paper_id AND m.id <> m.keep_id"
+        " GROUP BY m.keep_id, e.bucket"
+        " ON CONFLICT (paper_id, bucket) DO UPDATE SET"
+        " post_count = paper_engagement_hourly.post_count + excluded.post_count,"
+        " like_count = paper_engagement_hourly.like_count + excluded.like_count,"
+        " scrap_count = paper_engagement_hourly.scrap_count + excluded.scrap_count"
+    ))
+    # 중복 행의 롤업은 ON DELETE CASCADE로 함께 지워짐
+    connection.execute(text(
+        "DELETE FROM papers p USING paper_merge m WHERE p.id = m.id AND m.id <> m.keep_id"
+    ))
+    connection.execute(text(
+        "UPDATE papers p SET arxiv_id = m.canonical FROM paper_merge m"
+        " WHERE p.id = m.id AND p.arxiv_id IS DISTINCT FROM m.canonical"
+    ))
+    connection.execute(text("DROP TABLE paper_merge"))
+
+def upgrade(connection) -> None:
+    _canonicalize_arxiv_ids(connection)
+    connection.execute(text(
+        "ALTER TABLE papers ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        f" GENERATED ALWAYS AS ({PAPER_SEARCH_VECTOR_SQL}) STORED"
+    ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_papers_search_vector ON papers USING gin (search_vector)"
+    ))
+    IngestionCheckpoint.__table__.create(bind=connection, checkfirst=True)
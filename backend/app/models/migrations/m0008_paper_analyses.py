@@ -0,0 +1,11 @@
+"""GPT 논문 분석 결과 저장소.
+
+같은 논문을 같은 모델과 프롬프트로 다시 분석하지 않도록 입력 해시를 키로 결과를 저장하는
+paper_analyses 테이블을 추가합니다.
+"""
+from ..models import PaperAnalysis
+
+DESCRIPTION = "paper analysis store keyed by prompt input hash"
+
+def upgrade(connection) -> None:
+    PaperAnalysis.__table__.create(bind=connection, checkfirst=True)
@@ -0,0 +1,32 @@
+"""워크스페이스 추천 후보 인덱스.
+
+추천이 전체 워크스페이스를 훑지 않고 인덱스로 후보만 고를 수 있도록, 트리거가 유지하는 paper_count
+컬럼과 활성도/연구 분야/연구 주제 인덱스를 추가합니다.
+"""
+from sqlalchemy import text
+
+from ..models import WORKSPACE_PAPER_COUNT_TRIGGER_DDL, Workspace
+
+DESCRIPTION = "workspace paper_count and recommendation candidate indexes"
+
+def upgrade(connection) -> None:
+    connection.execute(text(
+        "ALTER TABLE workspaces ADD COLUMN IF NOT EXISTS paper_count integer NOT NULL DEFAULT 0"
+    ))
+    # 트리거를 만든 뒤 같은 트랜잭션에서 실제 개수로 맞춤
+    for statement in WORKSPACE_PAPER_COUNT_TRIGGER_DDL:
+        connection.execute(text(statement))
+    connection.execute(text(
+        "UPDATE workspaces w SET paper_count = counts.paper_count"
+        " FROM (SELECT ws.id, count(p.id) AS paper_count"
+        "       FROM workspaces ws LEFT JOIN workspace_papers p ON p.workspace_id = ws.id"
+        "       GROUP BY ws.id) counts"
+        " WHERE counts.id = w.id AND w.paper_count IS DISTINCT FROM counts.paper_count"
+    ))
+    for index in Workspace.__table__.indexes:
+        if index.name in (
+            "ix_workspaces_public_activity",
+            "ix_workspaces_public_field_activity",
+            "ix_workspaces_research_topics",
+        ):
+            index.create(bind=connection, checkfirst=True)
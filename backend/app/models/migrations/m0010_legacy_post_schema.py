@@ -0,0 +1,83 @@
+"""이전에 create_all로 만든 데이터베이스 보정.
+
+0001은 빠진 테이블만 만들고 기존 테이블은 바꾸지 않으므로, 마이그레이션 도입 전의 create_all로 만든
+데이터베이스에는 posts의 타임라인/카운터 컬럼, 좋아요/저장 유니크 제약, 조회용 인덱스가 없습니다.
+이를 멱등 DDL로 추가하고, 컬럼을 새로 추가한 경우에는 카운터, 홈 타임라인, 트렌딩 롤업을 원본에서 채웁니다.
+새로 만든 데이터베이스에서는 아무것도 바꾸지 않습니다.
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ...config import TIMELINE_FANOUT_MAX_FOLLOWERS
+from ...services.timeline_service import TimelineService
+from ...services.trending_service import TrendingService
+from ..models import Comment, Follow, Post, PostComment, Scrap
+
+DESCRIPTION = "upgrade legacy create_all posts schema"
+
+_POST_COLUMNS = (
+    "timeline_pull boolean NOT NULL DEFAULT false",
+    "like_count integer NOT NULL DEFAULT 0",
+    "save_count integer NOT NULL DEFAULT 0",
+    "comment_count integer NOT NULL DEFAULT 0",
+)
+
+# (테이블, 제약 이름): 중복 행을 지운 뒤 (user_id, post_id) 유니크 제약을 검
+_UNIQUE_CONSTRAINTS = (
+    ("post_likes", "uq_post_likes_user_post"),
+    ("post_saves", "uq_post_saves_user_post"),
+)
+
+def _has_column(connection, table: str, column: str) -> bool:
+    return connection.execute(text(
+        "SELECT 1 FROM information_schema.columns"
+        " WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column"
+    ), {"table": table, "column": column}).first() is not None
+
+def upgrade(connection) -> None:
+    legacy = not _has_column(connection, "posts", "like_count")
+
+    for column in _POST_COLUMNS:
+        connection.execute(text(f"ALTER TABLE posts ADD COLUMN IF NOT EXISTS {column}"))
+
+    for table, constraint in _UNIQUE_CONSTRAINTS:
+        connection.execute(text(
+            f"DELETE FROM {table} a USING {table} b"
+            " WHERE a.user_id = b.user_id AND a.post_id = b.post_id AND a.id > b.id"
+        ))
+        connection.execute(text(
+            "DO $$ BEGIN"
+            f" IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{constraint}') THEN"
+            f" ALTER TABLE {table} ADD CONSTRAINT {constraint} UNIQUE (user_id, post_id);"
+            " END IF;"
+            " END $$"
+        ))
+
+    for model in (Post, PostComment, Scrap, Comment, Follow):
+        for index in model.__table__.indexes:
+            index.create(bind=connection, checkfirst=True)
+
+    if not legacy:
+        return
+
+    # 기존 포스트의 카운터를 실제 행 수로 채움
+    connection.execute(text(
+        "UPDATE posts p SET"
+        " like_count = (SELECT count(*) FROM post_likes l WHERE l.post_id = p.id),"
+        " save_count = (SELECT count(*) FROM post_saves s WHERE s.post_id = p.id),"
+        " comment_count = (SELECT count(*) FROM post_comments c WHERE c.post_id = p.id)"
+    ))
+    # 팔로워가 많은 작성자의 포스트는 조회 시 가져오도록 표시
+    connection.execute(text(
+        "UPDATE posts p SET timeline_pull = true"
+        " WHERE (SELECT count(*) FROM follows f WHERE f.following_id = p.author_id) > :max_followers"
+    ), {"max_followers": TIMELINE_FANOUT_MAX_FOLLOWERS})
+
+    # 0001에서 빈 테이블로 만들어진 홈 타임라인과 트렌딩 롤업을 원본에서 채움
+    db = Session(bind=connection)
+    try:
+        TimelineService.rebuild(db)
+        TrendingService.rebuild(db)
+        db.flush()
+    finally:
+        db.close()
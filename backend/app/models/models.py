@@ -1,10 +1,21 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, JSON, Boolean, ARRAY
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import BigInteger, Column, Integer, String, ForeignKey, DateTime, Text, JSON, Boolean, ARRAY, Index, UniqueConstraint, Computed, DDL, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, backref, deferred
 from .database import Base
 from datetime import datetime
 
+# 트라이그램 인덱스(gin_trgm_ops)를 만들기 전에 확장이 있어야 함
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+# 사용자 검색 대상 컬럼. 각 컬럼에 트라이그램 GIN 인덱스가 있음
+USER_SEARCH_COLUMNS = ("full_name", "institution", "department", "research_field")
+
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = tuple(
+        Index(f"ix_users_{column}_trgm", column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+        for column in USER_SEARCH_COLUMNS
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True)
@@ -33,8 +44,18 @@ class User(Base):
     post_likes = relationship("PostLike", back_populates="user")
     post_saves = relationship("PostSave", back_populates="user")
 
+# 로컬 논문 카탈로그 검색 벡터 (제목 A, 초록 B). arXiv 메타데이터가 영어이므로 english 설정 사용
+PAPER_SEARCH_CONFIG = "english"
+PAPER_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{PAPER_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{PAPER_SEARCH_CONFIG}', coalesce(abstract, '')), 'B')"
+)
+
 class Paper(Base):
     __tablename__ = "papers"
+    __table_args__ = (
+        Index("ix_papers_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String)
@@ -47,6 +68,7 @@ class Paper(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     user_id = Column(Integer, ForeignKey("users.id"))
+    search_vector = deferred(Column(TSVECTOR, Computed(PAPER_SEARCH_VECTOR_SQL, persisted=True)))
 
     # Relationships
     user = relationship("User", back_populates="papers")
@@ -57,6 +79,10 @@ class Paper(Base):
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_author_created", "author_id", "created_at", "id"),
+        Index("ix_posts_pull_created", "created_at", "id", postgresql_where=text("timeline_pull")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String)
@@ -67,6 +93,13 @@ class Post(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     author_id = Column(Integer, ForeignKey("users.id"))
     paper_id = Column(Integer, ForeignKey("papers.id"), nullable=True)
+    # 팔로워가 많은 작성자의 포스트는 타임라인에 펼치지 않고 조회 시 가져옴
+    timeline_pull = Column(Boolean, default=False, nullable=False)
+
+    # 비정규화된 참여 카운터 (증감분은 counter_service에서 모아서 반영)
+    like_count = Column(Integer, default=0, server_default="0", nullable=False)
+    save_count = Column(Integer, default=0, server_default="0", nullable=False)
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     author = relationship("User", back_populates="posts")
     paper = relationship("Paper", foreign_keys=[paper_id], back_populates="posts")
@@ -76,6 +109,9 @@ class Post(Base):
 
 class PostLike(Base):
     __tablename__ = "post_likes"
+    __table_args__ = (
+        UniqueConstraint("user_id", "post_id", name="uq_post_likes_user_post"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"))
@@ -87,6 +123,9 @@ class PostLike(Base):
 
 class PostSave(Base):
     __tablename__ = "post_saves"
+    __table_args__ = (
+        UniqueConstraint("user_id", "post_id", name="uq_post_saves_user_post"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"))
@@ -98,6 +137,10 @@ class PostSave(Base):
 
 class PostComment(Base):
     __tablename__ = "post_comments"
+    __table_args__ = (
+        Index("ix_post_comments_post_created", "post_id", "created_at", "id"),
+        Index("ix_post_comments_parent_created", "parent_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text)
@@ -113,8 +156,19 @@ class PostComment(Base):
     user = relationship("User")
     replies = relationship("PostComment", backref=backref("parent", remote_side=[id]))
 
+# 한국어 형태소 분석 설정이 없으므로 언어 중립적인 simple 설정 사용
+SCRAP_SEARCH_CONFIG = "simple"
+SCRAP_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SCRAP_SEARCH_CONFIG}', coalesce(content, '')), 'A') || "
+    f"setweight(to_tsvector('{SCRAP_SEARCH_CONFIG}', coalesce(note, '')), 'B')"
+)
+
 class Scrap(Base):
     __tablename__ = "scraps"
+    __table_args__ = (
+        Index("ix_scraps_user_created", "user_id", "created_at", "id"),
+        Index("ix_scraps_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text)  # 텍스트 내용
@@ -125,7 +179,8 @@ class Scrap(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_public = Column(Boolean, default=False)  # 공개 여부
-    search_vector = Column(Text)  # 검색을 위한 필드
+    # 본문(A)과 메모(B)로 만든 전문 검색 벡터. DB가 생성 컬럼으로 직접 유지함
+    search_vector = Column(TSVECTOR, Computed(SCRAP_SEARCH_VECTOR_SQL, persisted=True))
     
     user_id = Column(Integer, ForeignKey("users.id"))
     paper_id = Column(Integer, ForeignKey("papers.id"))
@@ -223,6 +278,9 @@ class GroupSharedScrap(Base):
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_target_created", "target_type", "target_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text)
@@ -245,16 +303,89 @@ class Follow(Base):
     __tablename__ = "follows"
 
     id = Column(Integer, primary_key=True, index=True)
-    follower_id = Column(Integer, ForeignKey("users.id"))
-    following_id = Column(Integer, ForeignKey("users.id"))
+    follower_id = Column(Integer, ForeignKey("users.id"), index=True)
+    following_id = Column(Integer, ForeignKey("users.id"), index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # 관계 설정
     follower = relationship("User", foreign_keys=[follower_id], backref="following")
     following = relationship("User", foreign_keys=[following_id], backref="followers")
 
+class TimelineEntry(Base):
+    """팔로워별로 미리 펼쳐 둔 홈 타임라인 (fan-out-on-write)"""
+    __tablename__ = "home_timelines"
+    __table_args__ = (
+        Index("ix_home_timelines_user_created", "user_id", "created_at", "post_id"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    author_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    created_at = Column(DateTime, nullable=False)
+
+class PaperEngagementHourly(Base):
+    """논문별 참여 신호의 시간 단위 롤업 (트렌딩 계산용)"""
+    __tablename__ = "paper_engagement_hourly"
+    __table_args__ = (
+        Index("ix_paper_engagement_hourly_bucket", "bucket", "paper_id"),
+    )
+
+    paper_id = Column(Integer, ForeignKey("papers.id", ondelete="CASCADE"), primary_key=True)
+    bucket = Column(DateTime, primary_key=True)  # 시간 버킷 시작 시각 (UTC)
+    post_count = Column(Integer, default=0, nullable=False)
+    like_count = Column(Integer, default=0, nullable=False)
+    scrap_count = Column(Integer, default=0, nullable=False)
+
+# 워크스페이스 검색 벡터 (이름 A, 연구 주제/분야 B, 설명 C).
+# research_topics 배열을 펼치는 함수가 IMMUTABLE이 아니라 생성 컬럼 대신 트리거로 유지함
+WORKSPACE_SEARCH_CONFIG = "simple"
+WORKSPACE_SEARCH_TRIGGER_DDL = (
+    "CREATE OR REPLACE FUNCTION workspaces_search_vector_update() RETURNS trigger AS $$ BEGIN"
+    " NEW.search_vector :="
+    f" setweight(to_tsvector('{WORKSPACE_SEARCH_CONFIG}', coalesce(NEW.name, '')), 'A') ||"
+    f" setweight(to_tsvector('{WORKSPACE_SEARCH_CONFIG}', coalesce(array_to_string(NEW.research_topics, ' '), '')), 'B') ||"
+    f" setweight(to_tsvector('{WORKSPACE_SEARCH_CONFIG}', coalesce(NEW.research_field, '')), 'B') ||"
+    f" setweight(to_tsvector('{WORKSPACE_SEARCH_CONFIG}', coalesce(NEW.description, '')), 'C');"
+    " RETURN NEW;"
+    " END $$ LANGUAGE plpgsql",
+    "DROP TRIGGER IF EXISTS workspaces_search_vector_trigger ON workspaces",
+    "CREATE TRIGGER workspaces_search_vector_trigger"
+    " BEFORE INSERT OR UPDATE OF name, description, research_field, research_topics ON workspaces"
+    " FOR EACH ROW EXECUTE FUNCTION workspaces_search_vector_update()",
+)
+
+# 추천 점수의 활성도 항목: 멤버 5명당 1점(최대 3점), 논문 3편당 1점(최대 2점).
+# 같은 식으로 만든 인덱스로 후보를 고르므로 쿼리에서도 이 문자열을 그대로 씀
+WORKSPACE_ACTIVITY_SQL = "least(coalesce(member_count, 0) / 5, 3) + least(paper_count / 3, 2)"
+
+# paper_count는 workspace_papers 행 추가/삭제 시 트리거가 유지함
+WORKSPACE_PAPER_COUNT_TRIGGER_DDL = (
+    "CREATE OR REPLACE FUNCTION workspace_papers_count_update() RETURNS trigger AS $$ BEGIN"
+    " IF TG_OP IN ('DELETE', 'UPDATE') THEN"
+    " UPDATE workspaces SET paper_count = paper_count - 1 WHERE id = OLD.workspace_id;"
+    " END IF;"
+    " IF TG_OP IN ('INSERT', 'UPDATE') THEN"
+    " UPDATE workspaces SET paper_count = paper_count + 1 WHERE id = NEW.workspace_id;"
+    " END IF;"
+    " RETURN NULL;"
+    " END $$ LANGUAGE plpgsql",
+    "DROP TRIGGER IF EXISTS workspace_papers_count_trigger ON workspace_papers",
+    "CREATE TRIGGER workspace_papers_count_trigger"
+    " AFTER INSERT OR DELETE OR UPDATE OF workspace_id ON workspace_papers"
+    " FOR EACH ROW EXECUTE FUNCTION workspace_papers_count_update()",
+)
+
 class Workspace(Base):
     __tablename__ = "workspaces"
+    __table_args__ = (
+        Index("ix_workspaces_search_vector", "search_vector", postgresql_using="gin"),
+        # 추천 후보: 활성도 상위, 연구 분야별 활성도 상위, 연구 주제 겹침
+        Index("ix_workspaces_public_activity", text(f"({WORKSPACE_ACTIVITY_SQL}) DESC"), "id",
+              postgresql_where=text("is_public IS TRUE")),
+        Index("ix_workspaces_public_field_activity", "research_field", text(f"({WORKSPACE_ACTIVITY_SQL}) DESC"), "id",
+              postgresql_where=text("is_public IS TRUE")),
+        Index("ix_workspaces_research_topics", "research_topics", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String)
@@ -266,13 +397,22 @@ class Workspace(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     member_count = Column(Integer, default=1)
+    paper_count = Column(Integer, default=0, server_default="0", nullable=False)
+    search_vector = deferred(Column(TSVECTOR))  # 트리거가 채움. 응답에는 쓰지 않으므로 기본으로 읽지 않음
     
     owner = relationship("User", back_populates="owned_workspaces")
     members = relationship("WorkspaceMember", back_populates="workspace")
     papers = relationship("WorkspacePaper", back_populates="workspace")
 
+for statement in WORKSPACE_SEARCH_TRIGGER_DDL:
+    event.listen(Workspace.__table__, "after_create", DDL(statement))
+
 class WorkspaceMember(Base):
     __tablename__ = "workspace_members"
+    __table_args__ = (
+        UniqueConstraint("workspace_id", "user_id", name="uq_workspace_members_workspace_user"),
+        Index("ix_workspace_members_user_workspace", "user_id", "workspace_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"))
@@ -285,6 +425,9 @@ class WorkspaceMember(Base):
 
 class WorkspacePaper(Base):
     __tablename__ = "workspace_papers"
+    __table_args__ = (
+        Index("ix_workspace_papers_workspace", "workspace_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"))
@@ -295,4 +438,28 @@ class WorkspacePaper(Base):
 
     workspace = relationship("Workspace", back_populates="papers")
     paper = relationship("Paper")
-    added_by_user = relationship("User") 
\ No newline at end of file
+    added_by_user = relationship("User")
+
+for statement in WORKSPACE_PAPER_COUNT_TRIGGER_DDL:
+    event.listen(WorkspacePaper.__table__, "after_create", DDL(statement))
+
+class IngestionCheckpoint(Base):
+    """대량 메타데이터 수집의 재개 지점. 배치를 저장하는 트랜잭션에서 함께 갱신됩니다."""
+    __tablename__ = "ingestion_checkpoints"
+
+    source = Column(String, primary_key=True)  # "<형식>:<파일 절대 경로>"
+    position = Column(BigInteger, default=0, nullable=False)  # JSONL은 바이트 오프셋, OAI XML은 처리한 레코드 수
+    records = Column(BigInteger, default=0, nullable=False)  # 저장한 논문 수
+    completed = Column(Boolean, default=False, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class PaperAnalysis(Base):
+    """GPT 논문 분석 결과. 프롬프트 입력, 모델, 프롬프트 버전의 해시를 키로 저장합니다."""
+    __tablename__ = "paper_analyses"
+
+    input_hash = Column(String(64), primary_key=True)
+    paper_id = Column(Integer, ForeignKey("papers.id", ondelete="SET NULL"), nullable=True, index=True)
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,18 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from typing import Any
-from ..models.database import get_db
+from ..models.async_database import get_async_db
 from ..models import models
 from ..schemas import user_schemas
 from ..utils.auth import (
-    verify_password,
     create_access_token,
-    get_password_hash,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     get_current_user
 )
+from ..utils.password_hasher import password_hasher, PasswordHasherBusy
+from ..services.principal_cache import invalidate_principal
 import logging
 
 router = APIRouter(
@@ -22,18 +23,25 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": "1"},
+    )
+
 @router.post("/signup", response_model=user_schemas.User)
 async def signup(
     user: user_schemas.UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         logger.info(f"Signup attempt for email: {user.email}")
         
         # 이메일 중복 체크
-        db_user = db.query(models.User).filter(
-            models.User.email == user.email
-        ).first()
+        db_user = await db.scalar(
+            select(models.User).where(models.User.email == user.email)
+        )
         
         if db_user:
             raise HTTPException(
@@ -42,7 +50,10 @@ async def signup(
             )
         
         # 새 사용자 생성
-        hashed_password = get_password_hash(user.password)
+        try:
+            hashed_password = await password_hasher.hash(user.password)
+        except PasswordHasherBusy:
+            raise _hasher_busy()
         
         db_user = models.User(
             email=user.email,
@@ -59,8 +70,8 @@ async def signup(
         logger.info(f"Creating new user: {db_user.email}")
         
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         
         logger.info(f"Successfully created user: {db_user.email}")
         return db_user
@@ -70,31 +81,43 @@ async def signup(
         raise he
     except Exception as e:
         logger.error(f"Error during signup: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"회원가입 처리 중 오류가 발생했습니다: {str(e)}"
         )
 
 @router.post("/login", response_model=user_schemas.Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """사용자 로그인을 처리합니다."""
     # 사용자 확인
-    user = db.query(models.User).filter(models.User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await db.scalar(select(models.User).where(models.User.email == form_data.username))
+    verified, new_hash = False, None
+    if user:
+        try:
+            verified, new_hash = await password_hasher.verify_and_update(form_data.password, user.hashed_password)
+        except PasswordHasherBusy:
+            raise _hasher_busy()
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # bcrypt 비용 설정이 바뀌었으면 현재 비용으로 다시 해싱한 값을 저장
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+        invalidate_principal(user.id)
     
     # 액세스 토큰 생성
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email, "uid": user.id}, expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.database import get_db
 from ..models import models
 from ..schemas import comment_schemas
 from ..utils.auth import get_current_user
+from ..utils.pagination import decode_time_cursor, keyset_after, set_next_cursor
 
 router = APIRouter(
     prefix="/comments",
@@ -41,15 +42,30 @@ async def create_comment(
 async def get_comments(
     target_type: str,
     target_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    """특정 대상의 댓글들을 조회합니다."""
-    comments = db.query(models.Comment).filter(
+    """특정 대상의 댓글들을 오래된 순으로 조회합니다. 다음 커서는 X-Next-Cursor 헤더로 전달됩니다."""
+    query = db.query(models.Comment).filter(
         models.Comment.target_type == target_type,
         models.Comment.target_id == target_id,
         models.Comment.parent_id == None  # 최상위 댓글만 가져옴
-    ).all()
+    )
+
+    after = decode_time_cursor(cursor)
+    if after:
+        query = query.filter(keyset_after(models.Comment.created_at, models.Comment.id, after, descending=False))
+
+    query = query.order_by(models.Comment.created_at, models.Comment.id)
+    if limit:
+        query = query.limit(limit)
+
+    comments = query.all()
+    if limit:
+        set_next_cursor(response, comments, limit, key=lambda comment: (comment.created_at, comment.id))
     return comments
 
 @router.put("/{comment_id}", response_model=comment_schemas.Comment)
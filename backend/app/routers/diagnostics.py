@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends
+from ..models import models
+from ..utils.auth import get_diagnostics_user
+from ..services.post_cache import post_detail_cache
+from ..services.principal_cache import claims_cache, principal_cache
+from ..models.database import engine
+from ..models.async_database import async_engine
+from ..utils.db_pool import pool_stats
+from ..utils.query_stats import query_metrics
+from ..utils.password_hasher import password_hasher
+from ..services.arxiv_service import arxiv_service
+from ..services.paper_analysis_service import paper_analysis_service
+
+router = APIRouter(
+    prefix="/diagnostics",
+    tags=["diagnostics"]
+)
+
+@router.get("/cache")
+async def get_cache_stats(
+    current_user: models.User = Depends(get_diagnostics_user)
+):
+    """인메모리 캐시의 적중/미스/축출 통계를 반환합니다."""
+    return {
+        "post_detail": post_detail_cache.stats(),
+        "auth_claims": claims_cache.stats(),
+        "auth_principal": principal_cache.stats(),
+    }
+
+@router.get("/db-pool")
+async def get_db_pool_stats(
+    current_user: models.User = Depends(get_diagnostics_user)
+):
+    """동기/비동기 엔진 연결 풀의 사용량과 연결 대기 통계를 반환합니다."""
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.sync_engine.pool),
+    }
+
+@router.get("/queries")
+async def get_query_stats(
+    current_user: models.User = Depends(get_diagnostics_user)
+):
+    """라우트별 요청당 쿼리 수, DB 시간, N+1 의심 요청 수를 반환합니다."""
+    return query_metrics.snapshot()
+
+@router.get("/password-hasher")
+async def get_password_hasher_stats(
+    current_user: models.User = Depends(get_diagnostics_user)
+):
+    """비밀번호 해싱 스레드풀의 대기열 길이와 처리 시간을 반환합니다."""
+    return password_hasher.stats()
+
+@router.get("/arxiv")
+async def get_arxiv_stats(
+    current_user: models.User = Depends(get_diagnostics_user)
+):
+    """arXiv 검색의 원격 호출 수, 동시 요청 합치기, 디스크 캐시 적중 통계를 반환합니다."""
+    return arxiv_service.stats()
+
+@router.get("/paper-analysis")
+async def get_paper_analysis_stats(
+    current_user: models.User = Depends(get_diagnostics_user)
+):
+    """GPT 논문 분석의 저장소/캐시 적중, GPT 호출 수, 동시 요청 합치기 통계를 반환합니다."""
+    return paper_analysis_service.stats()
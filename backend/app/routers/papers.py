@@ -1,80 +1,78 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from ..services.ieee_service import IEEEService
 from ..models.database import get_db
+from ..models.async_database import get_async_db
 from ..models import models
 from ..schemas import paper_schemas
-from ..services.gpt_service import GPTService
+from ..services.paper_analysis_service import paper_analysis_service
+from ..services.arxiv_ingest import canonical_arxiv_id
 from ..utils.auth import get_current_user
-from ..services.arxiv_service import ArxivService
-from datetime import datetime, timedelta
-from sqlalchemy import func
+from ..services.arxiv_service import arxiv_service
+from ..services.paper_catalog import PaperCatalogService
+from ..config import PAPER_CATALOG_MIN_RESULTS
+from ..services.trending_service import TrendingService
 
 router = APIRouter(
     prefix="/papers",
     tags=["papers"]
 )
 
-ieee_service = IEEEService()
-gpt_service = GPTService()
-arxiv_service = ArxivService()
-
 @router.get("/search")
 async def search_papers(
     query: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    papers = await arxiv_service.search_papers(query)
+    # 수집해 둔 로컬 카탈로그에서 먼저 찾음
+    papers = await db.run_sync(PaperCatalogService.search, query=query, limit=10)
+    if len(papers) >= PAPER_CATALOG_MIN_RESULTS:
+        return papers
+
+    # 카탈로그에 없으면 arXiv 실시간 검색 (디스크 캐시와 동시 요청 합치기로 호출을 줄임)
+    try:
+        papers = await arxiv_service.search_papers(query)
+    except Exception as e:
+        print(f"Error searching arXiv: {e}")
+        raise HTTPException(status_code=502, detail="arXiv 검색에 실패했습니다. 잠시 후 다시 시도해주세요.")
     return papers
 
 @router.get("/analyze/{paper_id}")
 async def analyze_paper(
     paper_id: str,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    try:
-        # 1. IEEE API에서 논문 전체 데이터 가져오기
-        paper_data = await ieee_service.get_paper_details(paper_id)
-        
-        # 2. GPT로 논문 분석
-        analysis = await gpt_service.analyze_paper(paper_data)
-        
-        # 3. 분석 결과를 DB에 저장
-        paper = db.query(models.Paper).filter(models.Paper.ieee_id == paper_id).first()
-        if paper:
-            paper.ai_summary = analysis
-            db.commit()
-        
-        return analysis
+    """
+    논문을 GPT로 분석한 구조화된 요약을 반환합니다.
+    paper_id는 papers 테이블의 ID 또는 arXiv ID입니다. 같은 입력의 분석 결과는 저장해 두고 다시 쓰며,
+    결과 출처(cache/store/gpt)는 X-Analysis-Source 헤더로 전달됩니다.
+    """
+    if paper_id.isdigit():
+        paper = await db.get(models.Paper, int(paper_id))
+    else:
+        paper = (await db.execute(
+            select(models.Paper).where(models.Paper.arxiv_id == canonical_arxiv_id(paper_id))
+        )).scalar_one_or_none()
+    if paper is None:
+        raise HTTPException(status_code=404, detail="논문을 찾을 수 없습니다.")
 
+    try:
+        analysis, source = await paper_analysis_service.analyze(db, paper)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        print(f"Error analyzing paper {paper_id}: {e}")
+        raise HTTPException(status_code=502, detail="논문 분석에 실패했습니다. 잠시 후 다시 시도해주세요.")
+
+    response.headers["X-Analysis-Source"] = source
+    return analysis
 
 @router.get("/trending")
 async def get_trending_papers(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    # 최근 일주일 동안의 포스트 수를 기준으로 트렌딩 논문 선정
-    trending_papers = (
-        db.query(models.Paper)
-        .join(models.Post)
-        .filter(
-            models.Post.created_at >= datetime.utcnow() - timedelta(days=7)
-        )
-        .group_by(models.Paper.id)
-        .order_by(func.count(models.Post.id).desc())
-        .limit(3)
-        .all()
-    )
-    
-    # 각 논문의 포스트 수도 함께 반환
-    return [{
-        **paper.to_dict(),
-        'post_count': db.query(models.Post)
-            .filter(models.Post.paper_id == paper.id)
-            .count()
-    } for paper in trending_papers] 
\ No newline at end of file
+    # 최근 일주일(시간 버킷 롤업)의 포스트/좋아요/스크랩 가중 합을 기준으로 트렌딩 논문 선정
+    return TrendingService.get_trending(db, limit=3)
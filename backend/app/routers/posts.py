@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from sqlalchemy.sql import desc, func
 
 from ..utils.auth import get_current_user
-from ..models.database import get_db
-from ..models.models import User, Post as PostModel, PostLike, PostSave, PostComment
-from ..schemas.post_schemas import Post, PostDetail, PostCreate, PostUpdate, PostComment as PostCommentSchema, PostCommentCreate
+from ..models.async_database import get_async_db
+from ..models.models import User, PostComment
+from ..schemas.post_schemas import Post, PostDetail, PostCreate, PostUpdate, PostComment as PostCommentSchema, PostCommentCreate, PostViewerState, PostCommentThread
 from ..services.post_service import PostService
+from ..schemas.user_schemas import UserCard
+from ..utils.pagination import decode_time_cursor, set_next_cursor, NEXT_CURSOR_HEADER
+from ..utils.normalize import FORMAT_DESCRIPTION, Included, ResponseFormat, normalized_response
+from ..config import VIEWER_STATE_MAX_IDS
 
 router = APIRouter(
     prefix="/posts",
@@ -15,66 +18,67 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+def _author_card(included: Included, user_id: Optional[int], name: Optional[str], profile_image: Optional[str]) -> None:
+    included.add(
+        "users",
+        user_id,
+        lambda: UserCard(id=user_id, full_name=name or "Unknown", profile_image_url=profile_image).dict(exclude_unset=True)
+    )
+
+def _normalize_posts(posts: List[dict], included: Included) -> List[dict]:
+    """작성자 이름/이미지를 빼고 author_id로만 참조하도록 바꿉니다."""
+    data = []
+    for post in posts:
+        post = dict(post)
+        _author_card(included, post["author_id"], post.pop("author_name", None), post.pop("author_profile_image", None))
+        data.append(post)
+    return data
+
+def _normalize_comments(comments: List[dict], included: Included) -> List[dict]:
+    """댓글 트리의 작성자 정보를 user_id 참조로 바꿉니다."""
+    data = []
+    for comment in comments:
+        comment = dict(comment)
+        _author_card(included, comment["user_id"], comment.pop("user_name", None), comment.pop("user_profile_image", None))
+        comment["replies"] = _normalize_comments(comment["replies"], included)
+        data.append(comment)
+    return data
+
 @router.post("/", response_model=Post, status_code=status.HTTP_201_CREATED)
-def create_post(
+async def create_post(
     post: PostCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """새 포스트를 생성합니다."""
-    return PostService.create_post(db=db, post=post, user_id=current_user.id)
+    return await db.run_sync(PostService.create_post, post=post, user_id=current_user.id)
 
 @router.get("/", response_model=List[PostDetail])
-def get_posts(
+async def get_posts(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     user_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    response_format: ResponseFormat = Query("full", alias="format", description=FORMAT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """포스트 목록을 조회합니다. user_id가 제공되면 해당 사용자의 포스트만 조회합니다."""
+    """포스트 목록을 조회합니다. user_id가 제공되면 해당 사용자의 포스트만 조회합니다.
+
+    cursor가 주어지면 skip 대신 커서 이후의 포스트를 조회하며, 다음 커서는 X-Next-Cursor 헤더로 전달됩니다.
+    """
     if user_id:
-        # 직접 PostDetail 객체를 생성하여 반환
-        from ..schemas.post_schemas import PostDetail
-        
-        posts = db.query(PostModel).filter(PostModel.author_id == user_id).order_by(desc(PostModel.created_at)).offset(skip).limit(limit).all()
-        
-        # 포스트 작성자 정보 추가
-        result = []
-        for post in posts:
-            author = db.query(User).filter(User.id == post.author_id).first()
-            
-            # 좋아요, 저장, 댓글 수 계산
-            like_count = db.query(func.count(PostLike.id)).filter(PostLike.post_id == post.id).scalar()
-            save_count = db.query(func.count(PostSave.id)).filter(PostSave.post_id == post.id).scalar()
-            comment_count = db.query(func.count(PostComment.id)).filter(PostComment.post_id == post.id).scalar()
-            
-            # 현재 사용자가 좋아요/저장했는지 확인
-            is_liked = db.query(PostLike).filter(PostLike.post_id == post.id, PostLike.user_id == current_user.id).first() is not None
-            is_saved = db.query(PostSave).filter(PostSave.post_id == post.id, PostSave.user_id == current_user.id).first() is not None
-            
-            # PostDetail 객체 생성
-            post_detail = PostDetail(
-                id=post.id,
-                title=post.title,
-                content=post.content,
-                paper_title=post.paper_title,
-                key_insights=post.key_insights,
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                author_id=post.author_id,
-                paper_id=post.paper_id,
-                author_name=author.full_name if author else "Unknown",
-                author_profile_image=author.profile_image_url,
-                like_count=like_count,
-                save_count=save_count,
-                comment_count=comment_count,
-                is_liked=is_liked,
-                is_saved=is_saved
-            )
-            result.append(post_detail)
-        
-        return result
+        posts = await db.run_sync(
+            PostService.get_posts_by_user,
+            user_id=user_id, skip=skip, limit=limit, viewer_id=current_user.id,
+            cursor=decode_time_cursor(cursor)
+        )
+        set_next_cursor(response, posts, limit, key=lambda post: (post["created_at"], post["id"]))
+        if response_format == "normalized":
+            included = Included()
+            return normalized_response(_normalize_posts(posts, included), included, response)
+        return posts
     else:
         # 모든 포스트 조회 로직 (필요시 구현)
         raise HTTPException(
@@ -83,50 +87,76 @@ def get_posts(
         )
 
 @router.get("/feed", response_model=List[PostDetail])
-def get_feed_posts(
+async def get_feed_posts(
+    response: Response,
     skip: Optional[int] = Query(0, ge=0),
     limit: Optional[int] = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    response_format: ResponseFormat = Query("full", alias="format", description=FORMAT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """팔로우하는 사용자들의 포스트를 조회합니다."""
-    return PostService.get_feed_posts(db=db, user_id=current_user.id, skip=skip, limit=limit)
+    posts = await db.run_sync(
+        PostService.get_feed_posts,
+        user_id=current_user.id, skip=skip, limit=limit, cursor=decode_time_cursor(cursor)
+    )
+    set_next_cursor(response, posts, limit, key=lambda post: (post["created_at"], post["id"]))
+    if response_format == "normalized":
+        included = Included()
+        return normalized_response(_normalize_posts(posts, included), included, response)
+    return posts
+
+@router.get("/viewer-state", response_model=List[PostViewerState])
+async def get_viewer_state(
+    ids: str = Query(..., description="쉼표로 구분된 포스트 ID 목록 (예: 1,2,3)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """여러 포스트에 대한 현재 사용자의 좋아요/저장 여부를 한 번에 조회합니다."""
+    try:
+        post_ids = list(dict.fromkeys(int(id_) for id_ in ids.split(",") if id_.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="포스트 ID는 쉼표로 구분된 정수여야 합니다."
+        )
+
+    if len(post_ids) > VIEWER_STATE_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {VIEWER_STATE_MAX_IDS}개의 포스트만 조회할 수 있습니다."
+        )
+
+    viewer_state = await db.run_sync(PostService.get_viewer_state, current_user.id, post_ids)
+    return [{"post_id": post_id, **viewer_state[post_id]} for post_id in post_ids]
 
 @router.get("/{post_id}", response_model=PostDetail)
-def get_post(
+async def get_post(
     post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """특정 포스트를 조회합니다."""
-    post = PostService.get_post(db=db, post_id=post_id)
-    if post is None:
+    # 작성자 정보, 좋아요/저장/댓글 수, 조회자 플래그를 함께 채워서 반환
+    posts = await db.run_sync(PostService.get_post_details, [post_id], current_user.id)
+    if not posts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="포스트를 찾을 수 없습니다."
         )
-    
-    # 포스트 상세 정보 조회 로직 (작성자 정보, 좋아요/저장 수 등)
-    author = db.query(User).filter(User.id == post.author_id).first()
-    
-    # 포스트 상세 정보 반환
-    return {
-        **post.__dict__,
-        "author_name": author.full_name if author else "Unknown",
-        "author_profile_image": author.profile_image_url,
-        # 추가 정보는 서비스에서 계산
-    }
+    return posts[0]
 
 @router.put("/{post_id}", response_model=Post)
-def update_post(
+async def update_post(
     post_id: int,
     post_update: PostUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """포스트를 업데이트합니다."""
-    updated_post = PostService.update_post(
-        db=db, post_id=post_id, post_update=post_update, user_id=current_user.id
+    updated_post = await db.run_sync(
+        PostService.update_post, post_id=post_id, post_update=post_update, user_id=current_user.id
     )
     if updated_post is None:
         raise HTTPException(
@@ -136,13 +166,13 @@ def update_post(
     return updated_post
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_post(
+async def delete_post(
     post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """포스트를 삭제합니다."""
-    success = PostService.delete_post(db=db, post_id=post_id, user_id=current_user.id)
+    success = await db.run_sync(PostService.delete_post, post_id=post_id, user_id=current_user.id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -151,30 +181,30 @@ def delete_post(
     return {"detail": "포스트가 삭제되었습니다."}
 
 @router.post("/{post_id}/like", status_code=status.HTTP_201_CREATED)
-def like_post(
+async def like_post(
     post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """포스트에 좋아요를 추가합니다."""
-    post = PostService.get_post(db=db, post_id=post_id)
+    post = await db.run_sync(PostService.get_post, post_id=post_id)
     if post is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="포스트를 찾을 수 없습니다."
         )
     
-    like = PostService.like_post(db=db, post_id=post_id, user_id=current_user.id)
+    like = await db.run_sync(PostService.like_post, post_id=post_id, user_id=current_user.id)
     return {"detail": "포스트에 좋아요를 추가했습니다."}
 
 @router.delete("/{post_id}/like", status_code=status.HTTP_204_NO_CONTENT)
-def unlike_post(
+async def unlike_post(
     post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """포스트 좋아요를 취소합니다."""
-    success = PostService.unlike_post(db=db, post_id=post_id, user_id=current_user.id)
+    success = await db.run_sync(PostService.unlike_post, post_id=post_id, user_id=current_user.id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -183,30 +213,30 @@ def unlike_post(
     return {"detail": "포스트 좋아요를 취소했습니다."}
 
 @router.post("/{post_id}/save", status_code=status.HTTP_201_CREATED)
-def save_post(
+async def save_post(
     post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """포스트를 저장합니다."""
-    post = PostService.get_post(db=db, post_id=post_id)
+    post = await db.run_sync(PostService.get_post, post_id=post_id)
     if post is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="포스트를 찾을 수 없습니다."
         )
     
-    save = PostService.save_post(db=db, post_id=post_id, user_id=current_user.id)
+    save = await db.run_sync(PostService.save_post, post_id=post_id, user_id=current_user.id)
     return {"detail": "포스트를 저장했습니다."}
 
 @router.delete("/{post_id}/save", status_code=status.HTTP_204_NO_CONTENT)
-def unsave_post(
+async def unsave_post(
     post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """포스트 저장을 취소합니다."""
-    success = PostService.unsave_post(db=db, post_id=post_id, user_id=current_user.id)
+    success = await db.run_sync(PostService.unsave_post, post_id=post_id, user_id=current_user.id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -215,14 +245,14 @@ def unsave_post(
     return {"detail": "포스트 저장을 취소했습니다."}
 
 @router.post("/{post_id}/comments", response_model=PostCommentSchema, status_code=status.HTTP_201_CREATED)
-def add_comment(
+async def add_comment(
     post_id: int,
     comment: PostCommentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """포스트에 댓글을 추가합니다."""
-    post = PostService.get_post(db=db, post_id=post_id)
+    post = await db.run_sync(PostService.get_post, post_id=post_id)
     if post is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -231,16 +261,16 @@ def add_comment(
     
     # 부모 댓글이 있는 경우 존재 여부 확인
     if comment.parent_id:
-        parent_comment = db.query(PostComment).filter(PostComment.id == comment.parent_id).first()
+        parent_comment = await db.get(PostComment, comment.parent_id)
         if not parent_comment or parent_comment.post_id != post_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="유효하지 않은 부모 댓글입니다."
             )
     
-    new_comment = PostService.add_comment(
-        db=db, 
-        post_id=post_id, 
+    new_comment = await db.run_sync(
+        PostService.add_comment,
+        post_id=post_id,
         user_id=current_user.id, 
         content=comment.content, 
         parent_id=comment.parent_id
@@ -252,27 +282,64 @@ def add_comment(
     
     return new_comment
 
-@router.get("/{post_id}/comments", response_model=List[PostCommentSchema])
-def get_comments(
+@router.get("/{post_id}/comments", response_model=List[PostCommentThread])
+async def get_comments(
     post_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    depth: int = Query(5, ge=0, le=20),
+    replies_limit: int = Query(20, ge=1, le=100),
+    response_format: ResponseFormat = Query("full", alias="format", description=FORMAT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """포스트의 댓글을 조회합니다."""
-    post = PostService.get_post(db=db, post_id=post_id)
+    """포스트의 댓글을 답글이 중첩된 트리로 조회합니다.
+
+    최상위 댓글의 다음 페이지 커서는 X-Next-Cursor 헤더로, 잘린 답글의 커서는
+    각 댓글의 replies_cursor로 전달됩니다.
+    """
+    post = await db.run_sync(PostService.get_post, post_id=post_id)
     if post is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="포스트를 찾을 수 없습니다."
         )
     
-    comments = PostService.get_comments(db=db, post_id=post_id)
-    
-    # 댓글 작성자 정보 추가
-    for comment in comments:
-        user = db.query(User).filter(User.id == comment.user_id).first()
-        if user:
-            comment.user_name = user.full_name
-            comment.user_profile_image = user.profile_image_url
-    
-    return comments 
\ No newline at end of file
+    comments, next_cursor = await db.run_sync(
+        PostService.get_comment_thread,
+        post_id=post_id, limit=limit, cursor=decode_time_cursor(cursor),
+        max_depth=depth, replies_limit=replies_limit
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if response_format == "normalized":
+        included = Included()
+        return normalized_response(_normalize_comments(comments, included), included, response)
+    return comments
+
+@router.get("/{post_id}/comments/{comment_id}/replies", response_model=List[PostCommentThread])
+async def get_comment_replies(
+    post_id: int,
+    comment_id: int,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    depth: int = Query(5, ge=0, le=20),
+    replies_limit: int = Query(20, ge=1, le=100),
+    response_format: ResponseFormat = Query("full", alias="format", description=FORMAT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """댓글의 답글 트리를 이어서 조회합니다. cursor에는 상위 댓글의 replies_cursor를 사용합니다."""
+    replies, next_cursor = await db.run_sync(
+        PostService.get_comment_thread,
+        post_id=post_id, parent_id=comment_id, limit=limit, cursor=decode_time_cursor(cursor),
+        max_depth=depth, replies_limit=replies_limit
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if response_format == "normalized":
+        included = Included()
+        return normalized_response(_normalize_comments(replies, included), included, response)
+    return replies
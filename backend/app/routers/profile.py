@@ -1,9 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from ..models.database import get_db
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.async_database import get_async_db
 from ..models import models
 from ..schemas import user_schemas
 from ..utils.auth import get_current_user
+from ..services.timeline_service import TimelineService
+from ..services.post_cache import invalidate_author
+from ..services.principal_cache import invalidate_principal
 import os
 import uuid
 import shutil
@@ -26,10 +30,10 @@ async def get_my_profile(
 @router.get("/{user_id}", response_model=user_schemas.User)
 async def get_user_profile(
     user_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 사용자의 프로필 정보를 반환합니다."""
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = await db.get(models.User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -37,30 +41,32 @@ async def get_user_profile(
 @router.put("/me", response_model=user_schemas.User)
 async def update_my_profile(
     profile_update: user_schemas.UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """현재 로그인한 사용자의 프로필 정보를 수정합니다."""
     for field, value in profile_update.dict(exclude_unset=True).items():
         setattr(current_user, field, value)
     
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
+    invalidate_author(current_user.id)
+    invalidate_principal(current_user.id)
     return current_user
 
 @router.get("/me/stats", response_model=dict)
 async def get_profile_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """현재 사용자의 팔로워/팔로잉 수를 반환합니다."""
-    followers_count = db.query(models.Follow).filter(
-        models.Follow.following_id == current_user.id
-    ).count()
+    followers_count = await db.scalar(
+        select(func.count(models.Follow.id)).where(models.Follow.following_id == current_user.id)
+    )
     
-    following_count = db.query(models.Follow).filter(
-        models.Follow.follower_id == current_user.id
-    ).count()
+    following_count = await db.scalar(
+        select(func.count(models.Follow.id)).where(models.Follow.follower_id == current_user.id)
+    )
     
     return {
         "followers_count": followers_count,
@@ -70,7 +76,7 @@ async def get_profile_stats(
 @router.post("/{user_id}/follow")
 async def follow_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """다른 사용자를 팔로우합니다."""
@@ -82,45 +88,53 @@ async def follow_user(
         following_id=user_id
     )
     db.add(follow)
-    db.commit()
+    await db.run_sync(TimelineService.add_author, user_id=current_user.id, author_id=user_id)
+    await db.commit()
     return {"message": "Successfully followed"}
 
 @router.delete("/{user_id}/follow")
 async def unfollow_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """팔로우를 취소합니다."""
-    follow = db.query(models.Follow).filter(
-        models.Follow.follower_id == current_user.id,
-        models.Follow.following_id == user_id
-    ).first()
+    result = await db.execute(
+        select(models.Follow).where(
+            models.Follow.follower_id == current_user.id,
+            models.Follow.following_id == user_id
+        )
+    )
+    follow = result.scalars().first()
     
     if follow:
-        db.delete(follow)
-        db.commit()
+        await db.delete(follow)
+        await db.run_sync(TimelineService.remove_author, user_id=current_user.id, author_id=user_id)
+        await db.commit()
     return {"message": "Successfully unfollowed"}
 
 @router.get("/me/following")
 async def get_following(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """현재 사용자가 팔로우하는 사용자 목록을 반환합니다."""
-    following = db.query(models.User).join(
-        models.Follow,
-        models.Follow.following_id == models.User.id
-    ).filter(
-        models.Follow.follower_id == current_user.id
-    ).all()
+    result = await db.execute(
+        select(models.User).join(
+            models.Follow,
+            models.Follow.following_id == models.User.id
+        ).where(
+            models.Follow.follower_id == current_user.id
+        )
+    )
+    following = result.scalars().all()
     
     return following or []  # 팔로잉이 없으면 빈 리스트 반환 
 
 @router.post("/me/upload")
 async def upload_profile_image(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """프로필 사진을 업로드합니다."""
@@ -163,8 +177,10 @@ async def upload_profile_image(
     # 프로필 사진 URL 설정 (정적 파일 경로로 수정)
     profile_image_url = f"/media/profile_images/{filename}"
     current_user.profile_image_url = profile_image_url
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
+    invalidate_author(current_user.id)
+    invalidate_principal(current_user.id)
     
     print(f"Profile image URL: {profile_image_url}")
     
@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Response, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.database import get_db
 from ..models import models
 from ..schemas import scrap_schemas
 from ..utils.auth import get_current_user
+from ..utils.pagination import decode_time_cursor, decode_score_cursor, keyset_after, set_next_cursor
+from ..services.scrap_service import ScrapService
+from ..services.trending_service import trending_deltas
 import os
 from datetime import datetime
-from sqlalchemy import or_, text
+from sqlalchemy import text
 
 router = APIRouter(
     prefix="/scraps",
@@ -26,29 +29,48 @@ async def create_scrap(
     if not paper:
         raise HTTPException(status_code=404, detail="논문을 찾을 수 없습니다")
 
-    # 스크랩 생성
+    # 스크랩 생성 (tag_ids는 컬럼이 아니므로 따로 연결)
+    scrap_data = scrap_in.dict()
+    tag_ids = scrap_data.pop("tag_ids", None)
     db_scrap = models.Scrap(
-        **scrap_in.dict(),
-        user_id=current_user.id
+        **scrap_data,
+        user_id=current_user.id,
+        created_at=datetime.utcnow()
     )
     db.add(db_scrap)
+    db.flush()
+    ScrapService.set_tags(db, db_scrap, current_user.id, tag_ids)
     db.commit()
     db.refresh(db_scrap)
+    trending_deltas.add(db_scrap.paper_id, "scrap_count", 1, at=db_scrap.created_at)
     return db_scrap
 
 @router.get("/", response_model=List[scrap_schemas.Scrap])
 async def read_scraps(
+    response: Response,
     paper_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    """사용자의 스크랩 목록을 가져옵니다."""
+    """사용자의 스크랩 목록을 최신순으로 가져옵니다. cursor가 주어지면 skip 대신 커서 이후부터 조회합니다."""
     query = db.query(models.Scrap).filter(models.Scrap.user_id == current_user.id)
     if paper_id:
         query = query.filter(models.Scrap.paper_id == paper_id)
-    return query.offset(skip).limit(limit).all()
+
+    after = decode_time_cursor(cursor)
+    if after:
+        query = query.filter(keyset_after(models.Scrap.created_at, models.Scrap.id, after))
+
+    # offset은 order_by 뒤에 적용해야 함
+    query = query.order_by(models.Scrap.created_at.desc(), models.Scrap.id.desc())
+    if not after:
+        query = query.offset(skip)
+    scraps = query.limit(limit).all()
+    set_next_cursor(response, scraps, limit, key=lambda scrap: (scrap.created_at, scrap.id))
+    return scraps
 
 @router.put("/{scrap_id}", response_model=scrap_schemas.Scrap)
 async def update_scrap(
@@ -66,7 +88,10 @@ async def update_scrap(
     if not scrap:
         raise HTTPException(status_code=404, detail="스크랩을 찾을 수 없습니다")
 
-    for field, value in scrap_in.dict(exclude_unset=True).items():
+    update_data = scrap_in.dict(exclude_unset=True)
+    if "tag_ids" in update_data:
+        ScrapService.set_tags(db, scrap, current_user.id, update_data.pop("tag_ids"))
+    for field, value in update_data.items():
         setattr(scrap, field, value)
     
     scrap.updated_at = datetime.utcnow()
@@ -89,8 +114,10 @@ async def delete_scrap(
     if not scrap:
         raise HTTPException(status_code=404, detail="스크랩을 찾을 수 없습니다")
     
+    paper_id, scrapped_at = scrap.paper_id, scrap.created_at
     db.delete(scrap)
     db.commit()
+    trending_deltas.add(paper_id, "scrap_count", -1, at=scrapped_at)
     return {"message": "스크랩이 삭제되었습니다"}
 
 @router.post("/tags", response_model=scrap_schemas.Tag)
@@ -150,33 +177,30 @@ async def get_shared_scraps(
         models.SharedScrap.shared_with_user_id == current_user.id
     ).all()
 
-@router.get("/search", response_model=List[scrap_schemas.Scrap])
+@router.get("/search", response_model=List[scrap_schemas.ScrapSearchResult])
 async def search_scraps(
+    response: Response,
     query: str,
-    tag_ids: Optional[List[int]] = None,
+    tag_ids: Optional[List[int]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    """스크랩을 검색합니다."""
-    search_query = db.query(models.Scrap).filter(
-        models.Scrap.user_id == current_user.id
+    """스크랩을 전문 검색합니다.
+
+    본문과 메모에서 검색어와 관련도가 높은 순으로 반환하며, 일치한 부분은 content_highlight,
+    note_highlight에 <b> 태그로 표시됩니다. 강조 조각은 HTML 이스케이프되어 있으므로 그대로 HTML로 렌더링합니다.
+    tag_ids를 주면 해당 태그 중 하나가 붙은 스크랩만 찾습니다.
+    다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.
+    """
+    scraps = ScrapService.search(
+        db,
+        user_id=current_user.id,
+        query=query,
+        tag_ids=tag_ids,
+        limit=limit,
+        cursor=decode_score_cursor(cursor)
     )
-    
-    # 텍스트 검색
-    if query:
-        search_query = search_query.filter(
-            or_(
-                models.Scrap.content.ilike(f"%{query}%"),
-                models.Scrap.note.ilike(f"%{query}%")
-            )
-        )
-    
-    # 태그 필터링
-    if tag_ids:
-        search_query = search_query.join(
-            models.ScrapTag
-        ).filter(
-            models.ScrapTag.tag_id.in_(tag_ids)
-        )
-    
-    return search_query.all() 
\ No newline at end of file
+    set_next_cursor(response, scraps, limit, key=lambda scrap: (scrap.rank, scrap.id))
+    return scraps
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.database import get_db
 from ..models import models
 from ..schemas import user_schemas
 from ..utils.auth import get_current_user
-from sqlalchemy import or_
+from ..utils.pagination import decode_score_cursor, set_next_cursor
+from ..services.user_search_service import UserSearchService
 
 router = APIRouter(
     prefix="/users",
@@ -15,25 +16,20 @@ router = APIRouter(
 
 @router.get("/search", response_model=List[user_schemas.User])
 async def search_users(
+    response: Response,
     query: str,
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """
     사용자 검색 엔드포인트
     이름, 소속, 부서, 연구 분야로 사용자를 검색합니다.
+    유사도 순으로 limit명까지 반환하며, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.
     """
-    users = db.query(models.User)\
-        .filter(
-            or_(
-                models.User.full_name.ilike(f"%{query}%"),
-                models.User.institution.ilike(f"%{query}%"),
-                models.User.department.ilike(f"%{query}%"),
-                models.User.research_field.ilike(f"%{query}%")
-            )
-        )\
-        .all()
-    
+    users = UserSearchService.search(db, query=query, limit=limit, cursor=decode_score_cursor(cursor))
+    set_next_cursor(response, users, limit, key=lambda user: (user.search_score, user.id))
     return users
 
 @router.get("/", response_model=List[user_schemas.User])
@@ -1,13 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from ..models.database import get_db
+from ..models.async_database import get_async_db
 from ..models import models
-from ..schemas import workspace_schemas, user_schemas
+from ..schemas import workspace_schemas, user_schemas, paper_schemas
+from ..services.user_search_service import UserSearchService
+from ..services.workspace_service import WorkspaceService
+from ..services.arxiv_ingest import canonical_arxiv_id
+from ..utils.pagination import cursor_headers, decode_score_cursor, set_next_cursor
+from ..utils.projection import Projection, parse_projection
+from ..utils.normalize import FORMAT_DESCRIPTION, Included, ResponseFormat, normalized_response
 from ..utils.auth import get_current_user
 import random
 from datetime import datetime
-from sqlalchemy import or_
+from sqlalchemy import select
 from pydantic import BaseModel
 
 router = APIRouter(
@@ -33,123 +42,250 @@ class WorkspaceCreate(BaseModel):
     creator_role: str = "maintainer"  # 기본값은 maintainer
     members: List[dict] = []
 
+def _workspace_detail_options():
+    """Workspace 응답 스키마가 읽는 관계(소유자, 멤버, 논문)를 함께 로드하는 옵션.
+
+    비동기 세션에서는 지연 로딩을 할 수 없으므로 응답 직렬화 전에 모두 로드해 두어야 합니다.
+    """
+    return (
+        joinedload(models.Workspace.owner),
+        joinedload(models.Workspace.members).joinedload(models.WorkspaceMember.user),
+        joinedload(models.Workspace.papers).joinedload(models.WorkspacePaper.paper),
+    )
+
+FIELDS_DESCRIPTION = "쉼표로 구분한 워크스페이스 필드. 지정하면 요약 카드 형식으로 응답합니다."
+INCLUDE_DESCRIPTION = "함께 포함할 관계 (owner, members, papers). 지정하면 요약 카드 형식으로 응답합니다."
+
+def _parse_workspace_projection(
+    fields: Optional[str],
+    include: Optional[str],
+    response_format: ResponseFormat = "full"
+) -> Optional[Projection]:
+    projection = parse_projection(
+        fields,
+        include,
+        allowed_fields=workspace_schemas.WORKSPACE_FIELDS,
+        default_fields=workspace_schemas.WORKSPACE_CARD_FIELDS,
+        allowed_include=workspace_schemas.WORKSPACE_INCLUDES
+    )
+    if projection is None and response_format == "normalized":
+        # 정규화 형식만 요청하면 전체 응답과 같은 필드와 관계를 내려줌
+        projection = Projection(
+            workspace_schemas.WORKSPACE_FIELDS,
+            frozenset(workspace_schemas.WORKSPACE_INCLUDES)
+        )
+    return projection
+
+def _workspace_card_options(projection: Projection):
+    """프로젝션에 필요한 컬럼과 관계만 로드하는 옵션. 초록 등 큰 컬럼은 읽지 않습니다."""
+    columns = set(projection.fields)
+    if projection.includes("owner") or projection.includes("members"):
+        columns.add("owner_id")  # owner 조회와 멤버의 is_owner 계산에 필요
+    options = [load_only(*(getattr(models.Workspace, name) for name in sorted(columns)))]
+
+    user_card_columns = (models.User.id, models.User.full_name, models.User.institution, models.User.profile_image_url)
+    if projection.includes("owner"):
+        options.append(selectinload(models.Workspace.owner).load_only(*user_card_columns))
+    if projection.includes("members"):
+        options.append(
+            selectinload(models.Workspace.members)
+            .load_only(
+                models.WorkspaceMember.workspace_id,
+                models.WorkspaceMember.user_id,
+                models.WorkspaceMember.role,
+                models.WorkspaceMember.joined_at
+            )
+            .selectinload(models.WorkspaceMember.user).load_only(*user_card_columns)
+        )
+    if projection.includes("papers"):
+        options.append(
+            selectinload(models.Workspace.papers)
+            .load_only(
+                models.WorkspacePaper.workspace_id,
+                models.WorkspacePaper.paper_id,
+                models.WorkspacePaper.added_at,
+                models.WorkspacePaper.status
+            )
+            .selectinload(models.WorkspacePaper.paper)
+            .load_only(
+                models.Paper.id,
+                models.Paper.title,
+                models.Paper.authors,
+                models.Paper.published_date,
+                models.Paper.arxiv_id,
+                models.Paper.url
+            )
+        )
+    return options
+
+def _workspace_list_options(projection: Optional[Projection]):
+    if projection is None:
+        return _workspace_detail_options()
+    return _workspace_card_options(projection)
+
+def _workspace_card(
+    workspace: models.Workspace,
+    projection: Projection,
+    included: Optional[Included] = None
+) -> dict:
+    """요약 카드를 만듭니다. included가 주어지면 사용자/논문은 id로만 참조하고 included에 모읍니다."""
+    # 로드하지 않은 컬럼에 접근하면 지연 로딩이 일어나므로 요청한 필드만 읽음
+    data = {name: getattr(workspace, name) for name in projection.fields}
+
+    def user_card(user: Optional[models.User]) -> Optional[user_schemas.UserCard]:
+        if user is None:
+            return None
+        if included is None:
+            return user_schemas.UserCard.from_orm(user)
+        included.add("users", user.id, lambda: user_schemas.UserCard.from_orm(user).dict())
+        return None
+
+    if projection.includes("owner"):
+        owner = user_card(workspace.owner)
+        if included is None:
+            data["owner"] = owner
+        else:
+            data["owner_id"] = workspace.owner_id
+    if projection.includes("members"):
+        members = []
+        for member in workspace.members:
+            card = workspace_schemas.WorkspaceMemberCard(
+                user_id=member.user_id,
+                role=member.role,
+                joined_at=member.joined_at,
+                is_owner=member.user_id == workspace.owner_id
+            )
+            user = user_card(member.user)
+            if user is not None:
+                card.user = user
+            members.append(card)
+        data["members"] = members
+    if projection.includes("papers"):
+        papers = []
+        for workspace_paper in workspace.papers:
+            card = workspace_schemas.WorkspacePaperCard(
+                id=workspace_paper.id,
+                paper_id=workspace_paper.paper_id,
+                added_at=workspace_paper.added_at,
+                status=workspace_paper.status
+            )
+            paper = workspace_paper.paper
+            if paper is not None:
+                if included is None:
+                    card.paper = paper_schemas.PaperCard.from_orm(paper)
+                else:
+                    included.add("papers", paper.id, lambda: paper_schemas.PaperCard.from_orm(paper).dict())
+            papers.append(card)
+        data["papers"] = papers
+    return workspace_schemas.WorkspaceCard(**data).dict(exclude_unset=True)
+
+def _workspace_cards_response(
+    workspaces: List[models.Workspace],
+    projection: Projection,
+    response_format: ResponseFormat = "full",
+    response: Optional[Response] = None
+) -> JSONResponse:
+    """요약 카드 응답. 필드 구성이 요청마다 달라 response_model 검증을 거치지 않고 바로 직렬화합니다."""
+    if response_format == "normalized":
+        included = Included()
+        data = [_workspace_card(workspace, projection, included) for workspace in workspaces]
+        return normalized_response(data, included, response)
+    return JSONResponse(
+        jsonable_encoder([_workspace_card(workspace, projection) for workspace in workspaces]),
+        headers=cursor_headers(response)
+    )
+
+async def _load_workspaces(
+    db: AsyncSession,
+    workspace_ids: List[int],
+    projection: Optional[Projection]
+) -> List[models.Workspace]:
+    """주어진 id의 워크스페이스만 응답에 필요한 관계와 함께 로드하고 id 순서를 유지합니다."""
+    if not workspace_ids:
+        return []
+    result = await db.execute(
+        select(models.Workspace)
+        .options(*_workspace_list_options(projection))
+        .where(models.Workspace.id.in_(workspace_ids))
+    )
+    loaded = {workspace.id: workspace for workspace in result.unique().scalars().all()}
+    return [loaded[workspace_id] for workspace_id in workspace_ids if workspace_id in loaded]
+
+async def _get_workspace_detail(db: AsyncSession, workspace_id: int) -> Optional[models.Workspace]:
+    result = await db.execute(
+        select(models.Workspace)
+        .options(*_workspace_detail_options())
+        .where(models.Workspace.id == workspace_id)
+        # 이미 세션에 있는 객체라도 방금 커밋한 멤버/논문을 다시 채움
+        .execution_options(populate_existing=True)
+    )
+    return result.unique().scalars().first()
+
 @router.get("/recommended", response_model=List[workspace_schemas.Workspace])
 async def get_recommended_workspaces(
     research_field: Optional[str] = None,
     interests: Optional[List[str]] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    response_format: ResponseFormat = Query("full", alias="format", description=FORMAT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    # 사용자가 팔로우하는 사람들의 ID 목록 가져오기
-    following_ids = [f.following_id for f in current_user.following]
-    
-    # 사용자가 이미 가입한 워크스페이스 ID 목록 가져오기
-    joined_workspace_ids = [
-        member.workspace_id 
-        for member in db.query(models.WorkspaceMember)
-        .filter(models.WorkspaceMember.user_id == current_user.id)
-        .all()
-    ]
-    
-    # 가입하지 않은 public 워크스페이스만 필터링
-    query = db.query(models.Workspace).filter(
-        models.Workspace.is_public == True,
-        ~models.Workspace.id.in_(joined_workspace_ids)  # 가입하지 않은 워크스페이스만
+    projection = _parse_workspace_projection(fields, include, response_format)
+
+    # 점수 계산(팔로우 멤버, 연구 분야, 관심사, 활성도)은 DB에서 한 번의 집계 쿼리로 처리
+    top_ten_ids = await db.run_sync(
+        WorkspaceService.get_recommended_workspace_ids,
+        user_id=current_user.id,
+        research_field=research_field,
+        interests=interests,
+        limit=10
     )
-    workspaces = query.all()
-    scored_workspaces = []
-    
-    for workspace in workspaces:
-        score = 0
-        
-        # 1. 팔로우한 사람이 워크스페이스 멤버인 경우 (가장 높은 가중치)
-        workspace_member_ids = [member.user_id for member in workspace.members]
-        following_members = set(following_ids) & set(workspace_member_ids)
-        score += len(following_members) * 5  # 팔로우한 멤버 한 명당 5점
-        
-        # 2. 연구 분야 매칭
-        if workspace.research_field == research_field:
-            score += 3
-        
-        # 3. 관심사 매칭
-        if interests:
-            common_topics = set(workspace.research_topics) & set(interests)
-            score += len(common_topics)
-        
-        # 4. 활성도 (멤버 수, 논문 수 등 고려)
-        score += min(workspace.member_count // 5, 3)  # 최대 3점
-        score += min(len(workspace.papers) // 3, 2)   # 최대 2점
-        
-        scored_workspaces.append((workspace, score))
-    
-    # 점수 기준으로 정렬
-    scored_workspaces.sort(key=lambda x: x[1], reverse=True)
-    
+
     # 상위 10개 중에서 랜덤으로 8개 선택
-    top_ten = scored_workspaces[:10]
-    if len(top_ten) > 8:
-        selected_workspaces = random.sample(top_ten, 8)
-        return [w[0] for w in selected_workspaces]
-    
-    return [w[0] for w in top_ten]
+    if len(top_ten_ids) > 8:
+        top_ten_ids = random.sample(top_ten_ids, 8)
+
+    # 선택된 워크스페이스만 상세 정보와 함께 로드
+    workspaces = await _load_workspaces(db, top_ten_ids, projection)
+    if projection is not None:
+        return _workspace_cards_response(workspaces, projection, response_format)
+    return workspaces
 
 @router.post("/{workspace_id}/join")
 async def join_workspace(
     workspace_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     try:
         # 워크스페이스 조회 시 관련 데이터도 함께 로드
-        workspace = db.query(models.Workspace)\
-            .options(
-                joinedload(models.Workspace.members).joinedload(models.WorkspaceMember.user),
-                joinedload(models.Workspace.papers).joinedload(models.WorkspacePaper.paper)
-            )\
-            .filter(models.Workspace.id == workspace_id)\
-            .first()
+        workspace = await db.get(models.Workspace, workspace_id)
             
         if not workspace:
             raise HTTPException(status_code=404, detail="Workspace not found")
             
-        # 이미 멤버인지 확인
-        existing_member = db.query(models.WorkspaceMember).filter(
-            models.WorkspaceMember.workspace_id == workspace_id,
-            models.WorkspaceMember.user_id == current_user.id
-        ).first()
-        
-        if existing_member:
-            raise HTTPException(status_code=400, detail="Already a member of this workspace")
-        
-        # 새 멤버 추가
-        new_member = models.WorkspaceMember(
+        # 새 멤버 추가와 멤버 카운트 증가를 DB에서 원자적으로 처리
+        joined = await db.run_sync(
+            WorkspaceService.add_member,
             workspace_id=workspace_id,
             user_id=current_user.id,
-            role="member",
-            joined_at=datetime.utcnow()
+            role="member"
         )
         
-        db.add(new_member)
-        
-        # 멤버 카운트 업데이트
-        workspace.member_count += 1
+        if not joined:
+            raise HTTPException(status_code=400, detail="Already a member of this workspace")
         
-        db.commit()
+        await db.commit()
         
         # 워크스페이스 다시 로드
-        workspace = db.query(models.Workspace)\
-            .options(
-                joinedload(models.Workspace.members).joinedload(models.WorkspaceMember.user),
-                joinedload(models.Workspace.papers).joinedload(models.WorkspacePaper.paper)
-            )\
-            .filter(models.Workspace.id == workspace_id)\
-            .first()
+        workspace = await _get_workspace_detail(db, workspace_id)
         
         # 업데이트된 워크스페이스 정보 반환
         return workspace_schemas.Workspace.from_orm(workspace)
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         import traceback
         print(f"Error in join_workspace: {str(e)}")
         print(traceback.format_exc())
@@ -157,24 +293,27 @@ async def join_workspace(
 
 @router.get("/my", response_model=List[workspace_schemas.Workspace])
 async def get_my_workspaces(
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    response_format: ResponseFormat = Query("full", alias="format", description=FORMAT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
+    projection = _parse_workspace_projection(fields, include, response_format)
     try:
-        workspaces = (
-            db.query(models.Workspace)
+        result = await db.execute(
+            select(models.Workspace)
             .join(
                 models.WorkspaceMember,
                 models.Workspace.id == models.WorkspaceMember.workspace_id
             )
-            .filter(models.WorkspaceMember.user_id == current_user.id)
-            .options(
-                joinedload(models.Workspace.owner),
-                joinedload(models.Workspace.members).joinedload(models.WorkspaceMember.user),
-                joinedload(models.Workspace.papers).joinedload(models.WorkspacePaper.paper)
-            )
-            .all()
+            .where(models.WorkspaceMember.user_id == current_user.id)
+            .options(*_workspace_list_options(projection))
         )
+        workspaces = result.unique().scalars().all()
+
+        if projection is not None:
+            return _workspace_cards_response(workspaces, projection, response_format)
 
         # 상세 디버그 로그
         print("\n=== Workspace Data Debug ===")
@@ -198,76 +337,82 @@ async def get_my_workspaces(
 
     except Exception as e:
         print(f"Error getting workspaces: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/search", response_model=List[workspace_schemas.Workspace])
 async def search_workspaces(
+    response: Response,
     query: str,
-    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    response_format: ResponseFormat = Query("full", alias="format", description=FORMAT_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    # ilike를 사용하여 대소문자 구분 없이 검색
-    workspaces = db.query(models.Workspace)\
-        .options(
-            joinedload(models.Workspace.members).joinedload(models.WorkspaceMember.user),
-            joinedload(models.Workspace.papers).joinedload(models.WorkspacePaper.paper)
-        )\
-        .filter(
-            models.Workspace.is_public == True,
-            or_(
-                models.Workspace.name.ilike(f"%{query}%"),
-                models.Workspace.description.ilike(f"%{query}%"),
-                models.Workspace.research_field.ilike(f"%{query}%")
-            )
-        )\
-        .all()
-    
+    """공개 워크스페이스를 이름, 연구 주제/분야, 설명에서 검색해 관련도 순으로 반환합니다.
+
+    한 페이지에 limit개까지 반환하며 다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.
+    fields=/include=를 주면 요약 카드로 응답합니다.
+    """
+    projection = _parse_workspace_projection(fields, include, response_format)
+
+    # 인덱스로 순위와 페이지를 먼저 정하고, 반환할 페이지만 관계를 로드
+    ranked = await db.run_sync(
+        WorkspaceService.search_workspace_ids, query=query, limit=limit, cursor=decode_score_cursor(cursor)
+    )
+    set_next_cursor(response, ranked, limit, key=lambda row: (row[1], row[0]))
+    workspaces = await _load_workspaces(db, [workspace_id for workspace_id, _ in ranked], projection)
+
+    if projection is not None:
+        return _workspace_cards_response(workspaces, projection, response_format, response)
     return workspaces
 
 @router.get("/users/search", response_model=List[user_schemas.User])
 async def search_users(
+    response: Response,
     query: str,
-    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    users = db.query(models.User)\
-        .filter(
-            or_(
-                models.User.full_name.ilike(f"%{query}%"),
-                models.User.institution.ilike(f"%{query}%"),
-                models.User.department.ilike(f"%{query}%"),
-                models.User.research_field.ilike(f"%{query}%")
-            )
-        )\
-        .all()
-    
+    """/users/search와 같은 검색입니다. 다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다."""
+    users = await db.run_sync(
+        UserSearchService.search, query=query, limit=limit, cursor=decode_score_cursor(cursor)
+    )
+    set_next_cursor(response, users, limit, key=lambda user: (user.search_score, user.id))
     return users
 
 @router.post("/{workspace_id}/papers")
 async def add_paper_to_workspace(
     workspace_id: int,
     paper_data: PaperData,  # 타입 명시
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     try:
-        workspace = db.query(models.Workspace).filter(models.Workspace.id == workspace_id).first()
+        workspace = await db.get(models.Workspace, workspace_id)
         if not workspace:
             raise HTTPException(status_code=404, detail="Workspace not found")
         
         # 워크스페이스 멤버인지 확인
-        member = db.query(models.WorkspaceMember).filter(
-            models.WorkspaceMember.workspace_id == workspace_id,
-            models.WorkspaceMember.user_id == current_user.id
-        ).first()
+        member = await db.scalar(
+            select(models.WorkspaceMember).where(
+                models.WorkspaceMember.workspace_id == workspace_id,
+                models.WorkspaceMember.user_id == current_user.id
+            )
+        )
         if not member:
             raise HTTPException(status_code=403, detail="Not a member of this workspace")
 
-        # 논문이 이미 존재하는지 확인
-        existing_paper = db.query(models.Paper).filter(
-            models.Paper.arxiv_id == paper_data.arxiv_id
-        ).first()
+        # 논문이 이미 존재하는지 확인 (카탈로그와 같은 버전 없는 ID 기준)
+        arxiv_id = canonical_arxiv_id(paper_data.arxiv_id)
+        existing_paper = await db.scalar(
+            select(models.Paper).where(models.Paper.arxiv_id == arxiv_id)
+        )
 
         if not existing_paper:
             # 새 논문 생성
@@ -276,20 +421,22 @@ async def add_paper_to_workspace(
                 authors=paper_data.authors,
                 abstract=paper_data.summary,
                 published_date=paper_data.published_date,
-                arxiv_id=paper_data.arxiv_id,
+                arxiv_id=arxiv_id,
                 url=paper_data.url,
                 categories=paper_data.categories
             )
             db.add(paper)
-            db.flush()
+            await db.flush()
         else:
             paper = existing_paper
 
         # 이미 워크스페이스에 추가된 논문인지 확인
-        existing_workspace_paper = db.query(models.WorkspacePaper).filter(
-            models.WorkspacePaper.workspace_id == workspace_id,
-            models.WorkspacePaper.paper_id == paper.id
-        ).first()
+        existing_workspace_paper = await db.scalar(
+            select(models.WorkspacePaper).where(
+                models.WorkspacePaper.workspace_id == workspace_id,
+                models.WorkspacePaper.paper_id == paper.id
+            )
+        )
 
         if existing_workspace_paper:
             return {"message": "Paper already exists in workspace"}
@@ -302,43 +449,28 @@ async def add_paper_to_workspace(
             status='active'
         )
         db.add(workspace_paper)
-        db.commit()
+        await db.commit()
 
         return {"message": "Paper added to workspace successfully"}
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error adding paper to workspace: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{workspace_id}", response_model=workspace_schemas.Workspace)
 async def get_workspace(
     workspace_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     try:
         # 워크스페이스와 관련 데이터를 함께 로드
-        workspace = (
-            db.query(models.Workspace)
-            .options(
-                joinedload(models.Workspace.owner),
-                joinedload(models.Workspace.members).joinedload(models.WorkspaceMember.user),
-                joinedload(models.Workspace.papers).joinedload(models.WorkspacePaper.paper)
-            )
-            .filter(models.Workspace.id == workspace_id)
-            .first()
-        )
+        workspace = await _get_workspace_detail(db, workspace_id)
 
         if not workspace:
             raise HTTPException(status_code=404, detail="Workspace not found")
 
-        # 멤버 수 업데이트
-        member_count = len(workspace.members)
-        if workspace.member_count != member_count:
-            workspace.member_count = member_count
-            db.commit()
-
         # 각 멤버의 owner 여부 설정
         for member in workspace.members:
             member.is_owner = (member.user_id == workspace.owner_id)
@@ -352,31 +484,32 @@ async def get_workspace(
 @router.get("/{workspace_id}/papers")
 async def get_workspace_papers(
     workspace_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     try:
         # 워크스페이스 존재 확인
-        workspace = db.query(models.Workspace).filter(models.Workspace.id == workspace_id).first()
+        workspace = await db.get(models.Workspace, workspace_id)
         if not workspace:
             raise HTTPException(status_code=404, detail="Workspace not found")
         
         # 워크스페이스 멤버인지 확인
-        member = db.query(models.WorkspaceMember).filter(
-            models.WorkspaceMember.workspace_id == workspace_id,
-            models.WorkspaceMember.user_id == current_user.id
-        ).first()
+        member = await db.scalar(
+            select(models.WorkspaceMember).where(
+                models.WorkspaceMember.workspace_id == workspace_id,
+                models.WorkspaceMember.user_id == current_user.id
+            )
+        )
         if not member:
             raise HTTPException(status_code=403, detail="Not a member of this workspace")
 
         # 워크스페이스의 논문 목록 조회 (Paper 정보 포함)
-        workspace_papers = (
-            db.query(models.WorkspacePaper)
-            .filter(models.WorkspacePaper.workspace_id == workspace_id)
+        workspace_papers = (await db.scalars(
+            select(models.WorkspacePaper)
+            .where(models.WorkspacePaper.workspace_id == workspace_id)
             .join(models.Paper)
             .options(joinedload(models.WorkspacePaper.paper))  # Paper 정보를 함께 로드
-            .all()
-        )
+        )).all()
 
         # 응답 데이터 구조화
         return [
@@ -409,7 +542,7 @@ async def get_workspace_papers(
 @router.post("/new", response_model=workspace_schemas.Workspace)
 async def create_new_workspace(
     workspace_data: WorkspaceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     """
@@ -427,11 +560,11 @@ async def create_new_workspace(
             owner_id=current_user.id,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
-            member_count=1 + len(workspace_data.members)  # 생성자 + 초대된 멤버
+            member_count=1  # 생성자. 초대된 멤버는 실제로 추가된 수만큼 아래에서 더함
         )
         
         db.add(new_workspace)
-        db.flush()  # ID 생성을 위해 flush
+        await db.flush()  # ID 생성을 위해 flush
         
         # 생성자를 멤버로 추가
         creator_member = models.WorkspaceMember(
@@ -443,16 +576,18 @@ async def create_new_workspace(
         db.add(creator_member)
         
         # 초대된 멤버 추가
+        added_user_ids = {current_user.id}
         for member_data in workspace_data.members:
             # 사용자 존재 확인
             user_id = member_data.get('user_id')
-            user = db.query(models.User).filter(models.User.id == user_id).first()
+            user = await db.get(models.User, user_id)
             if not user:
                 continue  # 사용자가 없으면 건너뜀
                 
             # 이미 멤버인지 확인 (중복 방지)
-            if user_id == current_user.id:
-                continue  # 생성자는 이미 추가됨
+            if user_id in added_user_ids:
+                continue  # 생성자나 중복 초대는 건너뜀
+            added_user_ids.add(user_id)
                 
             # 멤버 추가
             member = models.WorkspaceMember(
@@ -463,22 +598,16 @@ async def create_new_workspace(
             )
             db.add(member)
         
-        db.commit()
+        # 아직 커밋 전이라 다른 요청이 볼 수 없으므로 실제 추가된 멤버 수로 바로 설정
+        new_workspace.member_count = len(added_user_ids)
+        await db.commit()
         
         # 생성된 워크스페이스 조회 (관련 데이터 포함)
-        created_workspace = (
-            db.query(models.Workspace)
-            .options(
-                joinedload(models.Workspace.owner),
-                joinedload(models.Workspace.members).joinedload(models.WorkspaceMember.user)
-            )
-            .filter(models.Workspace.id == new_workspace.id)
-            .first()
-        )
+        created_workspace = await _get_workspace_detail(db, new_workspace.id)
         
         return created_workspace
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error creating workspace: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to create workspace: {str(e)}") 
\ No newline at end of file
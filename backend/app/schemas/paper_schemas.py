@@ -34,6 +34,18 @@ class Paper(BaseModel):
     class Config:
         from_attributes = True
 
+# 초록 없이 목록에 표시할 정보만 담은 요약 스키마
+class PaperCard(BaseModel):
+    id: int
+    title: str
+    authors: List[str] = []
+    published_date: Optional[str] = None
+    arxiv_id: Optional[str] = None
+    url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 class PaperInWorkspace(BaseModel):
     id: int
     paper_id: int
@@ -23,6 +23,15 @@ class PostComment(PostCommentBase):
     class Config:
         orm_mode = True
 
+# 답글이 중첩된 댓글 트리 스키마
+class PostCommentThread(PostComment):
+    depth: int = 0
+    replies: List["PostCommentThread"] = []
+    has_more_replies: bool = False
+    replies_cursor: Optional[str] = None
+
+PostCommentThread.update_forward_refs()
+
 # 포스트 스키마
 class PostBase(BaseModel):
     title: str
@@ -62,6 +71,12 @@ class PostDetail(Post):
     class Config:
         orm_mode = True
 
+# 여러 포스트에 대한 조회자 상태 (좋아요/저장 여부)
+class PostViewerState(BaseModel):
+    post_id: int
+    is_liked: bool = False
+    is_saved: bool = False
+
 # 포스트 좋아요 스키마
 class PostLikeCreate(BaseModel):
     post_id: int
@@ -43,4 +43,14 @@ class Scrap(ScrapBase):
     shared_with: List[int] = []
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+# 전문 검색 결과 (관련도와 강조 표시된 조각 포함)
+class ScrapSearchResult(Scrap):
+    rank: float = 0.0
+    # HTML 이스케이프된 조각이며 일치한 부분만 <b> 태그로 감쌈 (content, note는 이스케이프하지 않은 원문)
+    content_highlight: Optional[str] = None
+    note_highlight: Optional[str] = None
+
+    class Config:
+        orm_mode = True
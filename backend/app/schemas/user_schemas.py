@@ -33,6 +33,16 @@ class User(BaseModel):
     class Config:
         from_attributes = True
 
+# 목록 화면에서 작성자/멤버를 표시할 때 쓰는 요약 스키마
+class UserCard(BaseModel):
+    id: int
+    full_name: str
+    institution: Optional[str] = None
+    profile_image_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -1,8 +1,8 @@
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
-from .user_schemas import User
-from .paper_schemas import Paper, PaperInWorkspace
+from .user_schemas import User, UserCard
+from .paper_schemas import Paper, PaperCard, PaperInWorkspace
 
 class WorkspaceMember(BaseModel):
     id: int
@@ -51,4 +51,45 @@ class Workspace(BaseModel):
     papers: List[PaperInWorkspace]
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+# 목록 화면용 요약 스키마 (fields=/include= 지정 시 사용)
+WORKSPACE_CARD_FIELDS = ("id", "name", "research_field", "research_topics", "is_public", "owner_id", "member_count")
+WORKSPACE_FIELDS = WORKSPACE_CARD_FIELDS + ("description", "created_at", "updated_at")
+WORKSPACE_INCLUDES = ("owner", "members", "papers")
+
+class WorkspaceMemberCard(BaseModel):
+    user_id: int
+    role: str
+    joined_at: datetime
+    is_owner: bool = False
+    user: Optional[UserCard] = None  # format=normalized이면 included.users로 분리
+
+    class Config:
+        from_attributes = True
+
+class WorkspacePaperCard(BaseModel):
+    id: int
+    paper_id: int
+    added_at: datetime
+    status: str
+    paper: Optional[PaperCard] = None  # format=normalized이면 included.papers로 분리
+
+    class Config:
+        from_attributes = True
+
+class WorkspaceCard(BaseModel):
+    """요청한 필드만 채워지며, 응답에서는 설정되지 않은 필드를 제외합니다."""
+    id: int
+    name: Optional[str] = None
+    research_field: Optional[str] = None
+    research_topics: Optional[List[str]] = None
+    is_public: Optional[bool] = None
+    owner_id: Optional[int] = None
+    member_count: Optional[int] = None
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    owner: Optional[UserCard] = None
+    members: Optional[List[WorkspaceMemberCard]] = None
+    papers: Optional[List[WorkspacePaperCard]] = None
@@ -0,0 +1,271 @@
+"""arXiv 메타데이터 덤프를 papers 테이블로 수집합니다.
+
+지원하는 입력
+- jsonl: Kaggle arXiv 메타데이터 스냅샷처럼 한 줄에 논문 하나인 JSON lines 파일
+- oai:   OAI-PMH ListRecords 응답(metadataPrefix=arXiv)을 저장한 XML 파일 또는 그 디렉토리
+
+파일을 앞에서부터 스트리밍하며 batch_size개씩 arxiv_id 기준으로 upsert하므로 메모리 사용량은
+파일 크기와 무관합니다. 배치를 저장하는 트랜잭션에서 재개 지점(ingestion_checkpoints)도 함께
+갱신하므로, 중단된 뒤 다시 실행하면 마지막으로 커밋한 배치 다음부터 이어서 수집합니다.
+"""
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..config import ARXIV_INGEST_BATCH_SIZE
+from ..models.models import IngestionCheckpoint, Paper
+
+FORMATS = ("jsonl", "oai")
+
+_VERSION_SUFFIX = re.compile(r"v\d+$")
+_OAI_NS = "{http://www.openarchives.org/OAI/2.0/}"
+_ARXIV_NS = "{http://arxiv.org/OAI/arXiv/}"
+
+def canonical_arxiv_id(value: str) -> str:
+    """'http://arxiv.org/abs/2101.00001v2', '2101.00001v2' 등을 버전 없는 ID('2101.00001')로 맞춥니다."""
+    value = value.strip()
+    for prefix in ("http://arxiv.org/abs/", "https://arxiv.org/abs/", "oai:arXiv.org:", "arXiv:"):
+        if value.startswith(prefix):
+            value = value[len(prefix):]
+    return _VERSION_SUFFIX.sub("", value)
+
+def _clean(text: Optional[str]) -> str:
+    # 덤프의 제목/초록에는 줄바꿈과 들여쓰기가 섞여 있음
+    return " ".join((text or "").split())
+
+def _paper_row(arxiv_id: str, title: str, abstract: str, authors: List[str],
+               categories: List[str], published: Optional[str]) -> Dict:
+    arxiv_id = canonical_arxiv_id(arxiv_id)
+    return {
+        "arxiv_id": arxiv_id,
+        "title": _clean(title),
+        "abstract": _clean(abstract),
+        "authors": authors,
+        "categories": categories,
+        "published_date": published,
+        "url": f"http://arxiv.org/pdf/{arxiv_id}",
+    }
+
+def parse_jsonl_record(raw: Dict) -> Optional[Dict]:
+    """스냅샷 한 줄을 papers 행으로 바꿉니다. ID나 제목이 없으면 None."""
+    if not raw.get("id") or not raw.get("title"):
+        return None
+
+    if raw.get("authors_parsed"):
+        authors = []
+        for entry in raw["authors_parsed"]:
+            # [성, 이름, 접미사]
+            last, first, suffix = (list(entry) + ["", "", ""])[:3]
+            authors.append(" ".join(part.strip() for part in (first, last, suffix) if part))
+    else:
+        authors = [name.strip() for name in re.split(r",| and ", _clean(raw.get("authors"))) if name.strip()]
+
+    published = None
+    versions = raw.get("versions") or []
+    if versions and versions[0].get("created"):
+        try:
+            published = parsedate_to_datetime(versions[0]["created"]).strftime("%Y-%m-%d")
+        except (TypeError, ValueError):
+            published = None
+    if published is None and raw.get("update_date"):
+        published = raw["update_date"]
+
+    return _paper_row(raw["id"], raw["title"], raw.get("abstract"), authors,
+                      (raw.get("categories") or "").split(), published)
+
+def iter_jsonl(path: str, offset: int = 0) -> Iterator[Tuple[Optional[Dict], int]]:
+    """offset 바이트부터 한 줄씩 읽어 (논문 행 또는 None, 그 줄 다음 위치)를 내보냅니다."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        position = offset
+        for line in f:
+            position += len(line)
+            line = line.strip()
+            if not line:
+                yield None, position
+                continue
+            try:
+                yield parse_jsonl_record(json.loads(line)), position
+            except (ValueError, TypeError, AttributeError):
+                print(f"Skipping malformed record ending at byte {position} in {path}")
+                yield None, position
+
+def _oai_text(element: ET.Element, tag: str) -> Optional[str]:
+    child = element.find(_ARXIV_NS + tag)
+    return child.text if child is not None else None
+
+def parse_oai_record(record: ET.Element) -> Optional[Dict]:
+    """OAI-PMH <record>(metadataPrefix=arXiv)를 papers 행으로 바꿉니다. 삭제된 레코드는 None."""
+    header = record.find(_OAI_NS + "header")
+    if header is not None and header.get("status") == "deleted":
+        return None
+    metadata = record.find(f"{_OAI_NS}metadata/{_ARXIV_NS}arXiv")
+    if metadata is None or not _oai_text(metadata, "id") or not _oai_text(metadata, "title"):
+        return None
+
+    authors = []
+    for author in metadata.iter(_ARXIV_NS + "author"):
+        parts = [_oai_text(author, "forenames"), _oai_text(author, "keyname"), _oai_text(author, "suffix")]
+        authors.append(" ".join(part.strip() for part in parts if part))
+
+    return _paper_row(
+        _oai_text(metadata, "id"),
+        _oai_text(metadata, "title"),
+        _oai_text(metadata, "abstract"),
+        authors,
+        (_oai_text(metadata, "categories") or "").split(),
+        _oai_text(metadata, "created"),
+    )
+
+def iter_oai(path: str, skip: int = 0) -> Iterator[Tuple[Optional[Dict], int]]:
+    """<record>를 하나씩 파싱해 (논문 행 또는 None, 처리한 레코드 수)를 내보냅니다.
+
+    처리한 요소는 바로 비워 메모리를 일정하게 유지합니다. 앞의 skip개 레코드는 파싱하지 않고 건너뜁니다.
+    """
+    count = 0
+    open_elements: List[ET.Element] = []
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            continue
+        open_elements.pop()
+        if element.tag != _OAI_NS + "record":
+            continue
+        count += 1
+        row = parse_oai_record(element) if count > skip else None
+        # 처리한 레코드를 부모(ListRecords)에서 떼어 내 트리가 커지지 않게 함
+        element.clear()
+        if open_elements:
+            open_elements[-1].remove(element)
+        if count > skip:
+            yield row, count
+
+@dataclass
+class IngestResult:
+    source: str
+    upserted: int = 0
+    skipped: int = 0
+    batches: int = 0
+    resumed_from: int = 0
+    completed: bool = False
+
+def upsert_papers(db: Session, rows: List[Dict]) -> None:
+    """arxiv_id 기준으로 논문을 넣거나 메타데이터를 갱신합니다. 내용이 같으면 행을 다시 쓰지 않습니다."""
+    # 한 배치 안에 같은 ID가 두 번 있으면 ON CONFLICT DO UPDATE가 실패하므로 마지막 것만 남김
+    unique_rows = list({row["arxiv_id"]: row for row in rows}.values())
+    now = datetime.utcnow()
+    stmt = pg_insert(Paper).values([{**row, "created_at": now, "updated_at": now} for row in unique_rows])
+    excluded = stmt.excluded
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[Paper.arxiv_id],
+            set_={
+                "title": excluded.title,
+                "abstract": excluded.abstract,
+                "authors": excluded.authors,
+                "categories": excluded.categories,
+                "published_date": excluded.published_date,
+                "url": excluded.url,
+                "updated_at": excluded.updated_at,
+            },
+            where=or_(
+                Paper.title.is_distinct_from(excluded.title),
+                Paper.abstract.is_distinct_from(excluded.abstract),
+                Paper.authors.is_distinct_from(excluded.authors),
+                Paper.categories.is_distinct_from(excluded.categories),
+            )
+        )
+    )
+
+def _source_key(fmt: str, path: str) -> str:
+    return f"{fmt}:{os.path.abspath(path)}"
+
+def _iter_files(path: str) -> List[str]:
+    if os.path.isdir(path):
+        return sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if os.path.isfile(os.path.join(path, name)) and not name.startswith(".")
+        )
+    return [path]
+
+def detect_format(path: str) -> str:
+    return "oai" if path.lower().endswith(".xml") or os.path.isdir(path) else "jsonl"
+
+def ingest_file(
+    session_factory: Callable[[], Session],
+    path: str,
+    fmt: str,
+    batch_size: int = ARXIV_INGEST_BATCH_SIZE,
+    restart: bool = False
+) -> IngestResult:
+    """파일 하나를 재개 지점부터 수집합니다."""
+    source = _source_key(fmt, path)
+    db = session_factory()
+    try:
+        checkpoint = db.get(IngestionCheckpoint, source)
+        if checkpoint is None:
+            checkpoint = IngestionCheckpoint(source=source, position=0, records=0, completed=False)
+            db.add(checkpoint)
+        elif restart:
+            checkpoint.position, checkpoint.records, checkpoint.completed = 0, 0, False
+        db.commit()
+
+        result = IngestResult(source=source, resumed_from=checkpoint.position)
+        if checkpoint.completed:
+            result.completed = True
+            return result
+
+        rows = iter_jsonl(path, checkpoint.position) if fmt == "jsonl" else iter_oai(path, checkpoint.position)
+        batch: List[Dict] = []
+        position = checkpoint.position
+
+        def flush() -> None:
+            if batch:
+                upsert_papers(db, batch)
+                result.upserted += len(batch)
+            checkpoint.position = position
+            checkpoint.records += len(batch)
+            db.commit()
+            result.batches += 1
+            batch.clear()
+
+        for row, position in rows:
+            if row is None:
+                result.skipped += 1
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush()
+                print(f"{path}: {result.upserted} papers (position {position})")
+
+        checkpoint.completed = True
+        flush()
+        result.completed = True
+        return result
+    finally:
+        db.close()
+
+def ingest(
+    session_factory: Callable[[], Session],
+    path: str,
+    fmt: Optional[str] = None,
+    batch_size: int = ARXIV_INGEST_BATCH_SIZE,
+    restart: bool = False
+) -> List[IngestResult]:
+    """파일 또는 디렉토리 안의 파일들을 이름 순서대로 수집합니다. 이미 끝난 파일은 건너뜁니다."""
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format {fmt!r}, expected one of {FORMATS}")
+    return [
+        ingest_file(session_factory, file_path, fmt, batch_size=batch_size, restart=restart)
+        for file_path in _iter_files(path)
+    ]
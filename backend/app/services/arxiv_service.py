@@ -1,23 +1,121 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
 import arxiv
 
+from ..config import (
+    ARXIV_MAX_CONCURRENCY, ARXIV_CACHE_DIR, ARXIV_CACHE_TTL_SECONDS, ARXIV_CACHE_MAX_STALE_SECONDS, ARXIV_CACHE_MAX_ENTRIES
+)
+from ..utils.disk_cache import JSONDiskCache
+from .arxiv_ingest import canonical_arxiv_id
+from ..utils.singleflight import SingleFlight
+
+# arXiv 검색식의 불리언 연산자는 대문자여야 하므로 소문자로 바꾸지 않음
+_QUERY_OPERATORS = {"AND", "OR", "ANDNOT"}
+
+def normalize_query(query: str) -> str:
+    """대소문자와 공백 차이만 있는 검색어가 같은 캐시 항목을 쓰도록 정규화합니다."""
+    return " ".join(
+        token if token in _QUERY_OPERATORS else token.lower()
+        for token in query.split()
+    )
+
+def _canonicalize(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """ID 정규화 이전에 저장된 캐시 항목('http://arxiv.org/abs/...v1')도 버전 없는 ID로 돌려줍니다."""
+    for paper in papers:
+        if paper.get('arxiv_id'):
+            paper['arxiv_id'] = canonical_arxiv_id(paper['arxiv_id'])
+    return papers
+
 class ArxivService:
-    async def search_papers(self, query: str, max_results: int = 10):
+    """arXiv 검색 어댑터.
+
+    동기 라이브러리 호출은 전용 스레드풀에서 실행하고 동시에 max_concurrency개까지만 보냅니다.
+    결과는 정규화한 검색어 기준으로 디스크에 TTL 동안 캐시하며, 같은 검색이 동시에 들어오면
+    한 번만 호출해 결과를 나눠 씁니다. 호출이 실패하면 만료된 캐시라도 있으면 그것을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        cache_dir: str,
+        cache_ttl: float,
+        cache_max_stale: float,
+        cache_max_entries: int
+    ):
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="arxiv")
+        self._cache = JSONDiskCache(cache_dir, cache_ttl, cache_max_stale, cache_max_entries)
+        self._flights = SingleFlight()
+        self._client = arxiv.Client()
+        self._lock = threading.Lock()
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+
+    def _fetch(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         search = arxiv.Search(
             query=query,
             max_results=max_results,
             sort_by=arxiv.SortCriterion.Relevance
         )
-        
+
         papers = []
-        for result in search.results():
+        for result in self._client.results(search):
             papers.append({
                 'title': result.title,
                 'authors': [author.name for author in result.authors],
                 'summary': result.summary,
                 'published_date': result.published.strftime('%Y-%m-%d'),
                 'url': result.pdf_url,
-                'arxiv_id': result.entry_id,
+                # 로컬 카탈로그와 같은 버전 없는 ID로 저장해 같은 논문이 중복되지 않게 함
+                'arxiv_id': canonical_arxiv_id(result.entry_id),
                 'categories': result.categories
             })
-        
-        return papers 
\ No newline at end of file
+
+        return papers
+
+    async def _search_upstream(self, key: str, query: str, max_results: int) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.upstream_calls += 1
+        try:
+            papers = await loop.run_in_executor(self._executor, self._fetch, query, max_results)
+        except Exception:
+            with self._lock:
+                self.upstream_errors += 1
+            stale = await loop.run_in_executor(None, lambda: self._cache.get(key, allow_stale=True))
+            if stale is not None:
+                return _canonicalize(stale)
+            raise
+        await loop.run_in_executor(None, self._cache.set, key, papers)
+        return papers
+
+    async def search_papers(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        query = normalize_query(query)
+        key = f"{max_results}:{query}"
+        loop = asyncio.get_running_loop()
+
+        cached = await loop.run_in_executor(None, self._cache.get, key)
+        if cached is not None:
+            return _canonicalize(cached)
+
+        return await self._flights.do(key, lambda: self._search_upstream(key, query, max_results))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            upstream = {"calls": self.upstream_calls, "errors": self.upstream_errors}
+        return {
+            "max_concurrency": self.max_concurrency,
+            "upstream": upstream,
+            "single_flight": self._flights.stats(),
+            "disk_cache": self._cache.stats(),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+arxiv_service = ArxivService(
+    ARXIV_MAX_CONCURRENCY, ARXIV_CACHE_DIR, ARXIV_CACHE_TTL_SECONDS, ARXIV_CACHE_MAX_STALE_SECONDS, ARXIV_CACHE_MAX_ENTRIES
+)
@@ -0,0 +1,277 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..models.database import SessionLocal
+from ..models.models import Post, PostLike, PostSave, PostComment
+from ..config import COUNTER_FLUSH_INTERVAL_SECONDS, COUNTER_RECONCILE_INTERVAL_SECONDS
+from .post_cache import invalidate_posts, invalidate_all
+from .trending_service import TrendingService, trending_deltas
+
+logger = logging.getLogger(__name__)
+
+# Post에 비정규화해 둔 참여 카운터 컬럼
+COUNTER_FIELDS = ("like_count", "save_count", "comment_count")
+
+class EngagementCounterBuffer:
+    """포스트 참여 카운터의 증감분을 프로세스 메모리에 모았다가 일괄 UPDATE로 반영합니다.
+
+    인기 포스트에 좋아요가 몰려도 같은 행을 매번 잠그지 않고,
+    주기적인 flush 한 번에 포스트당 UPDATE 한 건으로 합쳐서 기록합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Dict[str, int]] = {}
+        # drift 보정 중에 증감이 일어난 포스트 (watch() 이후에만 기록)
+        self._touched: Optional[Set[int]] = None
+
+    def increment(self, post_id: int, field: str, delta: int = 1) -> None:
+        """카운터 증감분을 버퍼에 더합니다."""
+        if field not in COUNTER_FIELDS:
+            raise ValueError(f"Unknown counter field: {field}")
+        with self._lock:
+            deltas = self._pending.setdefault(post_id, dict.fromkeys(COUNTER_FIELDS, 0))
+            deltas[field] += delta
+            if self._touched is not None:
+                self._touched.add(post_id)
+
+    def watch(self) -> Dict[int, Dict[str, int]]:
+        """지금부터 증감이 일어난 포스트를 기록하기 시작하고, 이 시점의 미반영 증감분 전체를 반환합니다."""
+        with self._lock:
+            self._touched = set()
+            return {post_id: dict(deltas) for post_id, deltas in self._pending.items()}
+
+    def touched(self) -> Set[int]:
+        """watch() 이후 증감이 일어난 포스트를 반환하고 기록을 멈춥니다."""
+        with self._lock:
+            touched, self._touched = self._touched or set(), None
+        return touched
+
+    def pending(self, post_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+        """아직 DB에 반영되지 않은 증감분을 반환합니다. 조회 시 컬럼 값에 더해 사용합니다."""
+        with self._lock:
+            return {
+                post_id: dict(self._pending[post_id])
+                for post_id in post_ids
+                if post_id in self._pending
+            }
+
+    def _drain(self) -> Dict[int, Dict[str, int]]:
+        with self._lock:
+            drained, self._pending = self._pending, {}
+        return drained
+
+    def _restore(self, drained: Dict[int, Dict[str, int]]) -> None:
+        with self._lock:
+            for post_id, deltas in drained.items():
+                current = self._pending.setdefault(post_id, dict.fromkeys(COUNTER_FIELDS, 0))
+                for field, delta in deltas.items():
+                    current[field] += delta
+
+    def flush(self, db: Session) -> int:
+        """버퍼에 쌓인 증감분을 executemany UPDATE 한 번으로 반영하고, 반영한 포스트 수를 반환합니다."""
+        drained = self._drain()
+        params = [
+            {"b_id": post_id, **{f"b_{field}": delta for field, delta in deltas.items()}}
+            for post_id, deltas in drained.items()
+            if any(deltas.values())
+        ]
+        if not params:
+            return 0
+
+        posts = Post.__table__
+        stmt = (
+            update(posts)
+            .where(posts.c.id == bindparam("b_id"))
+            .values({field: posts.c[field] + bindparam(f"b_{field}") for field in COUNTER_FIELDS})
+        )
+
+        try:
+            db.execute(stmt, params)
+            db.commit()
+        except Exception:
+            db.rollback()
+            self._restore(drained)
+            raise
+
+        # 캐시된 카운트는 반영 전 값이므로 무효화
+        invalidate_posts(*(param["b_id"] for param in params))
+        return len(params)
+
+engagement_counters = EngagementCounterBuffer()
+
+def _actual_counts():
+    return {
+        "like_count": select(func.count(PostLike.id)).where(PostLike.post_id == Post.id).scalar_subquery(),
+        "save_count": select(func.count(PostSave.id)).where(PostSave.post_id == Post.id).scalar_subquery(),
+        "comment_count": select(func.count(PostComment.id)).where(PostComment.post_id == Post.id).scalar_subquery(),
+    }
+
+def reconcile_engagement_counters(db: Session) -> int:
+    """카운터를 실제 좋아요/저장/댓글 행 수로 덮어쓰고, 수정한 포스트 수를 반환합니다.
+
+    진행 중인 요청의 증감분을 고려하지 않으므로 쓰기 트래픽이 없을 때(시드, 점검 중)만 사용합니다.
+    서비스 중에는 find_counter_drift와 confirm_counter_drift를 사용합니다.
+    """
+    actual = _actual_counts()
+    repaired = (
+        db.query(Post)
+        .filter(or_(*[getattr(Post, field) != count for field, count in actual.items()]))
+        .update({getattr(Post, field): count for field, count in actual.items()}, synchronize_session=False)
+    )
+    db.commit()
+    if repaired:
+        invalidate_all()
+    return repaired
+
+# post_id -> 필드별 (컬럼 값, drift)
+CounterDrift = Dict[int, Dict[str, Tuple[int, int]]]
+
+def _find_counter_drift(
+    db: Session,
+    pending: Dict[int, Dict[str, int]],
+    post_ids: Optional[Iterable[int]] = None
+) -> CounterDrift:
+    """컬럼 값 + 이 프로세스의 미반영 증감분이 실제 행 수와 다른 포스트를 찾습니다."""
+    actual = _actual_counts()
+    query = (
+        db.query(Post.id, *[getattr(Post, field) for field in COUNTER_FIELDS],
+                 *[count.label(f"actual_{field}") for field, count in actual.items()])
+        .filter(or_(*[getattr(Post, field) != count for field, count in actual.items()]))
+    )
+    if post_ids is not None:
+        query = query.filter(Post.id.in_(list(post_ids)))
+
+    drift: CounterDrift = {}
+    for row in query.all():
+        deltas = pending.get(row.id, {})
+        fields = {}
+        for field in COUNTER_FIELDS:
+            column = getattr(row, field) or 0
+            difference = getattr(row, f"actual_{field}") - column - deltas.get(field, 0)
+            if difference:
+                fields[field] = (column, difference)
+        if fields:
+            drift[row.id] = fields
+    return drift
+
+def _read_counter_drift(db: Session, post_ids: Optional[Iterable[int]] = None) -> Tuple[CounterDrift, Set[int]]:
+    """버퍼를 flush한 뒤 drift를 읽고, 읽는 동안 이 프로세스에서 증감이 일어난 포스트와 함께 반환합니다."""
+    engagement_counters.flush(db)
+    pending = engagement_counters.watch()
+    try:
+        drift = _find_counter_drift(db, pending, post_ids)
+        db.commit()
+    finally:
+        touched = engagement_counters.touched()
+    return drift, touched
+
+def find_counter_drift(db: Session) -> Tuple[CounterDrift, Set[int]]:
+    """drift 보정의 첫 조회입니다. 결과를 confirm_counter_drift에 넘겨 다시 확인한 뒤 반영합니다."""
+    return _read_counter_drift(db)
+
+def confirm_counter_drift(db: Session, first: CounterDrift, touched: Set[int]) -> int:
+    """서비스 중에 실제 행 수와 어긋난 카운터를 바로잡고, 수정한 포스트 수를 반환합니다.
+
+    행을 커밋한 뒤 버퍼에 증감분을 더하므로, 그 사이나 아직 flush되지 않은 증감분을 drift로 오인해
+    덮어쓰면 나중에 증감분이 한 번 더 더해집니다. 이를 피하기 위해
+    - 이 프로세스의 미반영 증감분은 빼고 비교하고,
+    - find_counter_drift 후 다른 워커들이 각자 버퍼를 한 번 이상 flush할 시간이 지난 뒤 호출되어
+      다시 읽은 drift가 첫 조회(first)와 같은 포스트만,
+    - 두 번의 조회 동안 이 프로세스에서 증감이 일어나지 않았고 컬럼 값도 그대로인 경우에만
+    컬럼에 drift만큼 더합니다. 다른 워커의 미반영 증감분은 알 수 없으므로 그 사이 값이 바뀐 포스트는
+    이번에 건너뛰고 다음 보정 때 다시 확인합니다.
+    """
+    if not first:
+        return 0
+
+    second, touched_again = _read_counter_drift(db, first.keys())
+    touched = touched | touched_again
+
+    posts = Post.__table__
+    repaired = []
+    for post_id, fields in second.items():
+        if post_id in touched or first.get(post_id) != fields:
+            continue
+        result = db.execute(
+            update(posts)
+            .where(posts.c.id == post_id, *[posts.c[field] == column for field, (column, _) in fields.items()])
+            .values({field: posts.c[field] + difference for field, (_, difference) in fields.items()})
+        )
+        if result.rowcount:
+            repaired.append(post_id)
+    db.commit()
+    if repaired:
+        invalidate_posts(*repaired)
+    return len(repaired)
+
+def _flush_counters() -> None:
+    db = SessionLocal()
+    try:
+        engagement_counters.flush(db)
+        trending_deltas.flush(db)
+    finally:
+        db.close()
+
+def _prune_trending() -> None:
+    db = SessionLocal()
+    try:
+        TrendingService.prune(db)
+        db.commit()
+    finally:
+        db.close()
+
+def _find_counter_drift_candidates() -> Tuple[CounterDrift, Set[int]]:
+    db = SessionLocal()
+    try:
+        return find_counter_drift(db)
+    finally:
+        db.close()
+
+def _confirm_counter_drift(first: CounterDrift, touched: Set[int]) -> None:
+    db = SessionLocal()
+    try:
+        repaired = confirm_counter_drift(db, first, touched)
+        if repaired:
+            logger.warning(f"Reconciled engagement counters for {repaired} posts")
+    finally:
+        db.close()
+
+async def run_counter_jobs() -> None:
+    """카운터/트렌딩 버퍼를 주기적으로 flush하고, 더 긴 주기로 drift 보정과 지난 트렌딩 버킷 정리를 합니다.
+
+    drift 보정의 확인 대기 동안에도 flush가 계속되도록, 첫 조회 결과를 들고 있다가
+    flush 주기 두 번이 지난 뒤의 반복에서 다시 확인합니다.
+    """
+    last_reconcile = time.monotonic()
+    candidates: Optional[Tuple[CounterDrift, Set[int]]] = None
+    confirm_at = 0.0
+    while True:
+        await asyncio.sleep(COUNTER_FLUSH_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(_flush_counters)
+            now = time.monotonic()
+            if candidates is not None:
+                if now >= confirm_at:
+                    first, touched = candidates
+                    candidates = None
+                    await asyncio.to_thread(_confirm_counter_drift, first, touched)
+            elif now - last_reconcile >= COUNTER_RECONCILE_INTERVAL_SECONDS:
+                last_reconcile = now
+                await asyncio.to_thread(_prune_trending)
+                first, touched = await asyncio.to_thread(_find_counter_drift_candidates)
+                if first:
+                    candidates = (first, touched)
+                    confirm_at = time.monotonic() + 2 * COUNTER_FLUSH_INTERVAL_SECONDS
+        except Exception as e:
+            logger.error(f"Engagement counter job failed: {e}")
+
+async def shutdown_counter_jobs() -> None:
+    """종료 전에 남은 증감분을 반영합니다."""
+    await asyncio.to_thread(_flush_counters)
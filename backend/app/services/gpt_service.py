@@ -1,10 +1,57 @@
 import openai
+import hashlib
+import json
 from typing import Dict, List, Optional
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+ANALYSIS_MODEL = "gpt-4"
+ANALYSIS_TEMPERATURE = 0.3
+ANALYSIS_MAX_TOKENS = 2000
+
+# 응답 파싱(_parse_gpt_response) 결과 형식을 바꾸면 올림. 프롬프트 문구 변경은 해시에 자동 반영됨
+ANALYSIS_PARSER_VERSION = 1
+
+ANALYSIS_SYSTEM_PROMPT = """
+                    당신은 학술 논문 분석 전문가입니다. 
+                    논문의 각 섹션을 분석하고 다음 형식으로 구조화된 요약을 제공해주세요:
+                    1. 핵심 주장
+                    2. 각 섹션별 주요 내용
+                    3. 연구 방법론
+                    4. 주요 발견
+                    5. 사용된 시각적 자료 목록 (표, 그림)
+                    6. 향후 연구 방향
+                    """
+
+ANALYSIS_USER_TEMPLATE = """
+        제목: {title}
+        초록: {abstract}
+        
+        이 논문을 분석하여 다음 사항들을 포함한 구조화된 요약을 제공해주세요:
+        1. 논문의 핵심 주장과 의의
+        2. 각 섹션별 주요 내용 요약
+        3. 사용된 연구 방법론 설명
+        4. 주요 발견 사항들
+        5. 논문에 포함된 표와 그림들의 목록과 각각의 핵심 내용
+        6. 저자들이 제시한 향후 연구 방향
+        
+        가능한 한 구체적이고 명확하게 분석해주세요.
+        """
+
+def _sha256(payload: Dict) -> str:
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+# 프롬프트 템플릿과 생성 설정의 지문. 템플릿을 고치면 값이 바뀌어 이전 분석 결과를 더 이상 쓰지 않음
+ANALYSIS_PROMPT_VERSION = _sha256({
+    "system": ANALYSIS_SYSTEM_PROMPT,
+    "template": ANALYSIS_USER_TEMPLATE,
+    "temperature": ANALYSIS_TEMPERATURE,
+    "max_tokens": ANALYSIS_MAX_TOKENS,
+    "parser": ANALYSIS_PARSER_VERSION,
+})[:16]
+
 class GPTService:
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
@@ -19,22 +66,13 @@ class GPTService:
         
         try:
             response = await openai.ChatCompletion.acreate(
-                model="gpt-4",
+                model=ANALYSIS_MODEL,
                 messages=[
-                    {"role": "system", "content": """
-                    당신은 학술 논문 분석 전문가입니다. 
-                    논문의 각 섹션을 분석하고 다음 형식으로 구조화된 요약을 제공해주세요:
-                    1. 핵심 주장
-                    2. 각 섹션별 주요 내용
-                    3. 연구 방법론
-                    4. 주요 발견
-                    5. 사용된 시각적 자료 목록 (표, 그림)
-                    6. 향후 연구 방향
-                    """},
+                    {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3,
-                max_tokens=2000
+                temperature=ANALYSIS_TEMPERATURE,
+                max_tokens=ANALYSIS_MAX_TOKENS
             )
             
             return self._parse_gpt_response(response.choices[0].message.content)
@@ -46,20 +84,16 @@ class GPTService:
         """
         논문 데이터를 기반으로 GPT 프롬프트를 생성합니다.
         """
-        return f"""
-        제목: {paper_data['title']}
-        초록: {paper_data['abstract']}
-        
-        이 논문을 분석하여 다음 사항들을 포함한 구조화된 요약을 제공해주세요:
-        1. 논문의 핵심 주장과 의의
-        2. 각 섹션별 주요 내용 요약
-        3. 사용된 연구 방법론 설명
-        4. 주요 발견 사항들
-        5. 논문에 포함된 표와 그림들의 목록과 각각의 핵심 내용
-        6. 저자들이 제시한 향후 연구 방향
-        
-        가능한 한 구체적이고 명확하게 분석해주세요.
-        """
+        return ANALYSIS_USER_TEMPLATE.format(title=paper_data['title'], abstract=paper_data['abstract'])
+
+    def analysis_key(self, paper_data: Dict) -> str:
+        """분석 결과를 저장할 키. 프롬프트에 들어가는 입력, 모델, 프롬프트 버전이 같으면 같은 키가 됩니다."""
+        return _sha256({
+            "model": ANALYSIS_MODEL,
+            "prompt_version": ANALYSIS_PROMPT_VERSION,
+            "title": paper_data['title'],
+            "abstract": paper_data['abstract'],
+        })
 
     def _parse_gpt_response(self, response: str) -> Dict:
         """
@@ -0,0 +1,91 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import PAPER_ANALYSIS_CACHE_MAX_ENTRIES, PAPER_ANALYSIS_CACHE_TTL_SECONDS
+from ..models.async_database import AsyncSessionLocal
+from ..models.models import Paper, PaperAnalysis
+from ..utils.cache import LRUTTLCache
+from ..utils.singleflight import SingleFlight
+from .gpt_service import ANALYSIS_MODEL, ANALYSIS_PROMPT_VERSION, GPTService
+
+class PaperAnalysisService:
+    """GPT 논문 분석 결과를 입력 해시 기준으로 저장해 다시 쓰는 서비스.
+
+    키는 제목/초록, 모델, 프롬프트 버전의 해시이므로 같은 입력은 한 번만 분석하고, 프롬프트 템플릿을
+    바꾸면 키가 달라져 자연히 새로 분석합니다. 결과는 paper_analyses 테이블에 영구 저장하고
+    인메모리 캐시에도 올려 둡니다. 같은 논문 분석이 동시에 들어오면 GPT는 한 번만 호출합니다.
+    """
+
+    def __init__(self, gpt_service: GPTService, cache_size: int, cache_ttl: float):
+        self._gpt = gpt_service
+        # 키가 내용 해시라 저장된 결과는 바뀌지 않으므로 무효화가 필요 없음
+        self._cache = LRUTTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+        self.store_hits = 0
+        self.gpt_calls = 0
+        self.gpt_errors = 0
+
+    async def _analyze_and_store(self, key: str, paper_id: Optional[int], paper_data: Dict) -> Dict[str, Any]:
+        with self._lock:
+            self.gpt_calls += 1
+        try:
+            result = await self._gpt.analyze_paper(paper_data)
+        except Exception:
+            with self._lock:
+                self.gpt_errors += 1
+            raise
+
+        # 먼저 요청한 쪽이 취소되어도 저장은 끝나도록 요청 세션 대신 별도 세션을 씀
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                pg_insert(PaperAnalysis)
+                .values(
+                    input_hash=key,
+                    paper_id=paper_id,
+                    model=ANALYSIS_MODEL,
+                    prompt_version=ANALYSIS_PROMPT_VERSION,
+                    result=result
+                )
+                .on_conflict_do_nothing(index_elements=[PaperAnalysis.input_hash])
+            )
+            await db.commit()
+        self._cache.set(key, result)
+        return result
+
+    async def analyze(self, db: AsyncSession, paper: Paper) -> Tuple[Dict[str, Any], str]:
+        """논문 분석 결과와 출처("cache", "store", "gpt")를 반환합니다."""
+        paper_data = {"title": paper.title or "", "abstract": paper.abstract or ""}
+        key = self._gpt.analysis_key(paper_data)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached, "cache"
+
+        stored = await db.get(PaperAnalysis, key)
+        if stored is not None:
+            with self._lock:
+                self.store_hits += 1
+            self._cache.set(key, stored.result)
+            return stored.result, "store"
+
+        result = await self._flights.do(key, lambda: self._analyze_and_store(key, paper.id, paper_data))
+        return result, "gpt"
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {"store_hits": self.store_hits, "gpt_calls": self.gpt_calls, "gpt_errors": self.gpt_errors}
+        return {
+            "model": ANALYSIS_MODEL,
+            "prompt_version": ANALYSIS_PROMPT_VERSION,
+            **counters,
+            "single_flight": self._flights.stats(),
+            "memory_cache": self._cache.stats(),
+        }
+
+paper_analysis_service = PaperAnalysisService(
+    GPTService(), PAPER_ANALYSIS_CACHE_MAX_ENTRIES, PAPER_ANALYSIS_CACHE_TTL_SECONDS
+)
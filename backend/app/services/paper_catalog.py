@@ -0,0 +1,43 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import Session, load_only
+
+from ..models.models import PAPER_SEARCH_CONFIG, Paper
+
+class PaperCatalogService:
+    @staticmethod
+    def search(db: Session, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """로컬 papers 카탈로그를 전문 검색해 arXiv 실시간 검색과 같은 형태로 반환합니다.
+
+        제목(A)과 초록(B)으로 만든 search_vector GIN 인덱스를 사용하며 관련도 순으로 limit개까지 반환합니다.
+        """
+        query = (query or "").strip()
+        if not query:
+            return []
+
+        ts_query = func.websearch_to_tsquery(PAPER_SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(Paper.search_vector, ts_query)
+        papers = db.scalars(
+            select(Paper)
+            .options(load_only(
+                Paper.id, Paper.title, Paper.authors, Paper.abstract, Paper.published_date,
+                Paper.url, Paper.arxiv_id, Paper.categories
+            ))
+            .where(Paper.search_vector.op("@@")(ts_query), Paper.arxiv_id.isnot(None))
+            .order_by(desc(rank), desc(Paper.id))
+            .limit(limit)
+        ).all()
+
+        return [
+            {
+                'title': paper.title,
+                'authors': paper.authors or [],
+                'summary': paper.abstract,
+                'published_date': paper.published_date,
+                'url': paper.url,
+                'arxiv_id': paper.arxiv_id,
+                'categories': paper.categories or []
+            }
+            for paper in papers
+        ]
@@ -0,0 +1,20 @@
+from ..config import POST_CACHE_MAX_ENTRIES, POST_CACHE_TTL_SECONDS
+from ..utils.cache import LRUTTLCache
+
+# 조회자와 무관한 PostDetail 부분(본문, 작성자 카드, 카운트)을 포스트 ID별로 캐시
+post_detail_cache = LRUTTLCache(maxsize=POST_CACHE_MAX_ENTRIES, ttl=POST_CACHE_TTL_SECONDS)
+
+def author_tag(author_id: int) -> str:
+    return f"author:{author_id}"
+
+def invalidate_posts(*post_ids: int) -> None:
+    """포스트 내용이나 카운트가 바뀌었을 때 호출합니다."""
+    post_detail_cache.invalidate(*post_ids)
+
+def invalidate_author(author_id: int) -> None:
+    """작성자 프로필(이름, 프로필 이미지)이 바뀌었을 때 호출합니다."""
+    post_detail_cache.invalidate_tag(author_tag(author_id))
+
+def invalidate_all() -> None:
+    """카운터 일괄 보정처럼 어떤 포스트가 바뀌었는지 모를 때 호출합니다."""
+    post_detail_cache.clear()
@@ -1,10 +1,16 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from typing import List, Optional
+from sqlalchemy import desc, func, literal, or_, select, true
+from sqlalchemy.exc import IntegrityError
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-from ..models.models import Post, PostLike, PostSave, PostComment, User, Follow
+from ..models.models import Post, PostLike, PostSave, PostComment, User
 from ..schemas.post_schemas import PostCreate, PostUpdate
+from .timeline_service import TimelineService
+from ..utils.pagination import keyset_after, encode_cursor
+from .counter_service import engagement_counters
+from .post_cache import post_detail_cache, author_tag, invalidate_posts
+from .trending_service import TrendingService, trending_deltas
 
 class PostService:
     @staticmethod
@@ -16,9 +22,15 @@ class PostService:
             paper_title=post.paper_title,
             key_insights=post.key_insights,
             paper_id=post.paper_id,
-            author_id=user_id
+            author_id=user_id,
+            timeline_pull=TimelineService.is_pull_author(db, user_id)
         )
         db.add(db_post)
+        db.flush()
+
+        # 팔로워들의 홈 타임라인에 포스트 추가
+        TimelineService.fan_out_post(db, db_post)
+        TrendingService.record(db, db_post.paper_id, "post_count", 1, at=db_post.created_at)
         db.commit()
         db.refresh(db_post)
         return db_post
@@ -29,25 +41,21 @@ class PostService:
         return db.query(Post).filter(Post.id == post_id).first()
     
     @staticmethod
-    def get_posts_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[dict]:
-        """특정 사용자의 포스트를 조회합니다."""
-        posts = db.query(Post).filter(Post.author_id == user_id).order_by(desc(Post.created_at)).offset(skip).limit(limit).all()
-        
-        # 포스트 작성자 정보 추가
-        result = []
-        for post in posts:
-            author = db.query(User).filter(User.id == post.author_id).first()
-            
-            # 좋아요, 저장, 댓글 수 계산
-            like_count = db.query(func.count(PostLike.id)).filter(PostLike.post_id == post.id).scalar()
-            save_count = db.query(func.count(PostSave.id)).filter(PostSave.post_id == post.id).scalar()
-            comment_count = db.query(func.count(PostComment.id)).filter(PostComment.post_id == post.id).scalar()
-            
-            # 현재 사용자가 좋아요/저장했는지 확인
-            is_liked = db.query(PostLike).filter(PostLike.post_id == post.id, PostLike.user_id == user_id).first() is not None
-            is_saved = db.query(PostSave).filter(PostSave.post_id == post.id, PostSave.user_id == user_id).first() is not None
-            
-            post_dict = {
+    def _load_post_cards(db: Session, post_ids: List[int]) -> Dict[int, dict]:
+        """조회자와 무관한 포스트 정보(본문, 작성자 카드, 카운트)를 캐시에서 찾고, 없는 것만 한 번에 조회합니다."""
+        cards = post_detail_cache.get_many(post_ids)
+        missing = [post_id for post_id in post_ids if post_id not in cards]
+        if not missing:
+            return cards
+
+        rows = (
+            db.query(Post, User.full_name, User.profile_image_url)
+            .outerjoin(User, User.id == Post.author_id)
+            .filter(Post.id.in_(missing))
+            .all()
+        )
+        for post, author_name, author_profile_image in rows:
+            card = {
                 "id": post.id,
                 "title": post.title,
                 "content": post.content,
@@ -57,63 +65,104 @@ class PostService:
                 "updated_at": post.updated_at,
                 "author_id": post.author_id,
                 "paper_id": post.paper_id,
-                "author_name": author.full_name if author else "Unknown",
-                "author_profile_image": author.profile_image_url if author else None,
-                "like_count": like_count,
-                "save_count": save_count,
-                "comment_count": comment_count,
-                "is_liked": is_liked,
-                "is_saved": is_saved
+                "author_name": author_name or "Unknown",
+                "author_profile_image": author_profile_image,
+                "like_count": post.like_count,
+                "save_count": post.save_count,
+                "comment_count": post.comment_count,
             }
-            result.append(post_dict)
-        
+            post_detail_cache.set(post.id, card, tags=(author_tag(post.author_id),))
+            cards[post.id] = card
+
+        return cards
+
+    @staticmethod
+    def get_viewer_state(db: Session, user_id: int, post_ids: List[int]) -> Dict[int, Dict[str, bool]]:
+        """여러 포스트에 대한 사용자의 좋아요/저장 여부를 테이블당 IN 쿼리 한 번으로 조회합니다."""
+        if not post_ids:
+            return {}
+
+        liked_ids = {
+            row[0] for row in db.query(PostLike.post_id)
+            .filter(PostLike.user_id == user_id, PostLike.post_id.in_(post_ids))
+            .all()
+        }
+        saved_ids = {
+            row[0] for row in db.query(PostSave.post_id)
+            .filter(PostSave.user_id == user_id, PostSave.post_id.in_(post_ids))
+            .all()
+        }
+
+        return {
+            post_id: {"is_liked": post_id in liked_ids, "is_saved": post_id in saved_ids}
+            for post_id in post_ids
+        }
+
+    @staticmethod
+    def get_post_details(db: Session, post_ids: List[int], viewer_id: int) -> List[dict]:
+        """포스트 ID 목록을 순서대로 PostDetail 형태로 채웁니다.
+
+        포스트 수와 관계없이 고정된 횟수의 쿼리(캐시 미스 포스트+작성자 1, 플래그 2)만 실행합니다.
+        카운트는 캐시된 카운터 값에 버퍼의 미반영 증감분을 더하고, 조회자 플래그는 요청마다 새로 계산합니다.
+        """
+        if not post_ids:
+            return []
+
+        cards = PostService._load_post_cards(db, post_ids)
+        found_ids = [post_id for post_id in post_ids if post_id in cards]
+
+        # 아직 DB에 반영되지 않은 카운터 증감분
+        pending = engagement_counters.pending(found_ids)
+
+        # 현재 사용자의 좋아요/저장 여부
+        viewer_state = PostService.get_viewer_state(db, viewer_id, found_ids)
+
+        result = []
+        for post_id in found_ids:
+            card = cards[post_id]
+            deltas = pending.get(post_id, {})
+            result.append({
+                **card,
+                "like_count": card["like_count"] + deltas.get("like_count", 0),
+                "save_count": card["save_count"] + deltas.get("save_count", 0),
+                "comment_count": card["comment_count"] + deltas.get("comment_count", 0),
+                **viewer_state[post_id]
+            })
+
         return result
+
+    @staticmethod
+    def get_posts_by_user(
+        db: Session,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        viewer_id: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[dict]:
+        """특정 사용자의 포스트를 조회합니다. cursor가 주어지면 offset 대신 keyset으로 페이지를 넘깁니다."""
+        query = db.query(Post.id).filter(Post.author_id == user_id)
+        if cursor:
+            query = query.filter(keyset_after(Post.created_at, Post.id, cursor))
+        # offset은 order_by 뒤에 적용해야 함
+        query = query.order_by(desc(Post.created_at), desc(Post.id))
+        if not cursor:
+            query = query.offset(skip)
+        post_ids = [row.id for row in query.limit(limit).all()]
+        return PostService.get_post_details(db, post_ids, viewer_id if viewer_id is not None else user_id)
     
     @staticmethod
-    def get_feed_posts(db: Session, user_id: int, skip: int = 0, limit: int = 20) -> List[dict]:
+    def get_feed_posts(
+        db: Session,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[dict]:
         """사용자가 팔로우하는 사용자들의 포스트를 조회합니다."""
-        # 사용자가 팔로우하는 사용자 ID 목록 조회
-        following_ids = db.query(Follow.following_id).filter(Follow.follower_id == user_id).all()
-        following_ids = [id[0] for id in following_ids]
-        
-        # 팔로우하는 사용자들의 포스트 조회
-        posts = db.query(Post).filter(Post.author_id.in_(following_ids)).order_by(desc(Post.created_at)).offset(skip).limit(limit).all()
-        
-        # 포스트 작성자 정보 추가
-        result = []
-        for post in posts:
-            author = db.query(User).filter(User.id == post.author_id).first()
-            
-            # 좋아요, 저장, 댓글 수 계산
-            like_count = db.query(func.count(PostLike.id)).filter(PostLike.post_id == post.id).scalar()
-            save_count = db.query(func.count(PostSave.id)).filter(PostSave.post_id == post.id).scalar()
-            comment_count = db.query(func.count(PostComment.id)).filter(PostComment.post_id == post.id).scalar()
-            
-            # 현재 사용자가 좋아요/저장했는지 확인
-            is_liked = db.query(PostLike).filter(PostLike.post_id == post.id, PostLike.user_id == user_id).first() is not None
-            is_saved = db.query(PostSave).filter(PostSave.post_id == post.id, PostSave.user_id == user_id).first() is not None
-            
-            post_dict = {
-                "id": post.id,
-                "title": post.title,
-                "content": post.content,
-                "paper_title": post.paper_title,
-                "key_insights": post.key_insights,
-                "created_at": post.created_at,
-                "updated_at": post.updated_at,
-                "author_id": post.author_id,
-                "paper_id": post.paper_id,
-                "author_name": author.full_name if author else "Unknown",
-                "author_profile_image": author.profile_image_url if author else None,
-                "like_count": like_count,
-                "save_count": save_count,
-                "comment_count": comment_count,
-                "is_liked": is_liked,
-                "is_saved": is_saved
-            }
-            result.append(post_dict)
-        
-        return result
+        # 미리 펼쳐 둔 홈 타임라인에서 조회
+        post_ids = TimelineService.get_timeline_post_ids(db, user_id=user_id, skip=skip, limit=limit, cursor=cursor)
+        return PostService.get_post_details(db, post_ids, user_id)
     
     @staticmethod
     def update_post(db: Session, post_id: int, post_update: PostUpdate, user_id: int) -> Optional[Post]:
@@ -123,12 +172,17 @@ class PostService:
             return None
         
         update_data = post_update.dict(exclude_unset=True)
+        if "paper_id" in update_data and update_data["paper_id"] != db_post.paper_id:
+            # 연결된 논문이 바뀌면 트렌딩 롤업도 옮김
+            TrendingService.record(db, db_post.paper_id, "post_count", -1, at=db_post.created_at)
+            TrendingService.record(db, update_data["paper_id"], "post_count", 1, at=db_post.created_at)
         for key, value in update_data.items():
             setattr(db_post, key, value)
         
         db_post.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(db_post)
+        invalidate_posts(post_id)
         return db_post
     
     @staticmethod
@@ -138,8 +192,12 @@ class PostService:
         if not db_post:
             return False
         
+        TimelineService.remove_post(db, post_id)
+        TrendingService.record(db, db_post.paper_id, "post_count", -1, at=db_post.created_at)
+        TrendingService.remove_post_likes(db, db_post.paper_id, post_id)
         db.delete(db_post)
         db.commit()
+        invalidate_posts(post_id)
         return True
     
     @staticmethod
@@ -155,10 +213,22 @@ class PostService:
             return existing_like
         
         # 새 좋아요 생성
-        new_like = PostLike(post_id=post_id, user_id=user_id)
+        new_like = PostLike(post_id=post_id, user_id=user_id, created_at=datetime.utcnow())
         db.add(new_like)
-        db.commit()
+        paper_id = db.query(Post.paper_id).filter(Post.id == post_id).scalar()
+        try:
+            db.commit()
+        except IntegrityError:
+            # 동시에 들어온 같은 요청이 먼저 반영된 경우
+            db.rollback()
+            return db.query(PostLike).filter(
+                PostLike.post_id == post_id,
+                PostLike.user_id == user_id
+            ).first()
         db.refresh(new_like)
+        engagement_counters.increment(post_id, "like_count", 1)
+        trending_deltas.add(paper_id, "like_count", 1, at=new_like.created_at)
+        invalidate_posts(post_id)
         return new_like
     
     @staticmethod
@@ -172,8 +242,13 @@ class PostService:
         if not like:
             return False
         
+        paper_id = db.query(Post.paper_id).filter(Post.id == post_id).scalar()
+        liked_at = like.created_at
         db.delete(like)
         db.commit()
+        engagement_counters.increment(post_id, "like_count", -1)
+        trending_deltas.add(paper_id, "like_count", -1, at=liked_at)
+        invalidate_posts(post_id)
         return True
     
     @staticmethod
@@ -191,8 +266,18 @@ class PostService:
         # 새 저장 생성
         new_save = PostSave(post_id=post_id, user_id=user_id)
         db.add(new_save)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            # 동시에 들어온 같은 요청이 먼저 반영된 경우
+            db.rollback()
+            return db.query(PostSave).filter(
+                PostSave.post_id == post_id,
+                PostSave.user_id == user_id
+            ).first()
         db.refresh(new_save)
+        engagement_counters.increment(post_id, "save_count", 1)
+        invalidate_posts(post_id)
         return new_save
     
     @staticmethod
@@ -208,6 +293,8 @@ class PostService:
         
         db.delete(save)
         db.commit()
+        engagement_counters.increment(post_id, "save_count", -1)
+        invalidate_posts(post_id)
         return True
     
     @staticmethod
@@ -222,12 +309,141 @@ class PostService:
         db.add(comment)
         db.commit()
         db.refresh(comment)
+        engagement_counters.increment(post_id, "comment_count", 1)
+        invalidate_posts(post_id)
         return comment
     
     @staticmethod
-    def get_comments(db: Session, post_id: int) -> List[PostComment]:
-        """포스트의 댓글을 조회합니다."""
-        return db.query(PostComment).filter(
-            PostComment.post_id == post_id,
-            PostComment.parent_id.is_(None)  # 최상위 댓글만 조회
-        ).order_by(PostComment.created_at).all() 
\ No newline at end of file
+    def get_comment_thread(
+        db: Session,
+        post_id: int,
+        parent_id: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        max_depth: int = 5,
+        replies_limit: int = 20,
+        max_nodes: int = 500
+    ) -> Tuple[List[dict], Optional[str]]:
+        """댓글 트리를 재귀 CTE 한 번으로 조회해 중첩된 형태로 반환합니다.
+
+        parent_id가 없으면 최상위 댓글부터, 있으면 해당 댓글의 답글부터 트리를 만듭니다.
+        시작 댓글은 cursor 이후 limit개, 각 댓글의 답글은 replies_limit개, 깊이는 max_depth까지 포함하며,
+        시작 댓글 아래의 답글은 전체 max_nodes개까지만 포함합니다(얕은 답글 우선).
+        어떤 이유로든 답글이 잘린 댓글에는 has_more_replies와 replies_cursor(보여준 마지막 답글 이후,
+        보여준 답글이 없으면 None)가 채워지며, 시작 댓글의 다음 페이지 커서를 함께 반환합니다.
+        """
+        comments = PostComment.__table__
+
+        # 시작 댓글 페이지 (비재귀 항). limit + 1번째는 다음 페이지가 있는지 확인하는 용도로만 사용
+        start = select(
+            comments.c.id,
+            comments.c.parent_id,
+            (func.row_number().over(order_by=(comments.c.created_at, comments.c.id)) > limit).label("is_extra")
+        ).where(comments.c.post_id == post_id)
+        if parent_id is None:
+            start = start.where(comments.c.parent_id.is_(None))
+        else:
+            start = start.where(comments.c.parent_id == parent_id)
+        if cursor:
+            start = start.where(keyset_after(comments.c.created_at, comments.c.id, cursor, descending=False))
+        start = start.order_by(comments.c.created_at, comments.c.id).limit(limit + 1).subquery("start")
+
+        tree = select(
+            start.c.id, start.c.parent_id, literal(0).label("depth"), start.c.is_extra
+        ).cte("tree", recursive=True)
+        # 부모마다 답글을 replies_limit + 1개까지만 인덱스로 읽음. 마지막 하나와 max_depth + 1 단계는
+        # 답글이 더 있는지 세는 용도로만 사용하고 그 아래로는 내려가지 않음
+        children = (
+            select(
+                comments.c.id,
+                comments.c.parent_id,
+                (func.row_number().over(order_by=(comments.c.created_at, comments.c.id)) > replies_limit)
+                .label("is_extra")
+            )
+            .where(comments.c.parent_id == tree.c.id)
+            .order_by(comments.c.created_at, comments.c.id)
+            .limit(replies_limit + 1)
+            .lateral("children")
+        )
+        tree = tree.union_all(
+            select(children.c.id, children.c.parent_id, (tree.c.depth + 1).label("depth"), children.c.is_extra)
+            .select_from(tree.join(children, true()))
+            .where(tree.c.depth <= max_depth, ~tree.c.is_extra)
+        )
+
+        # 트리에서 읽은 답글 수. 응답에 담긴 답글 수보다 많으면 잘린 것
+        reply_counts = (
+            select(tree.c.parent_id, func.count().label("reply_count"))
+            .where(tree.c.depth > 0)
+            .group_by(tree.c.parent_id)
+            .subquery("reply_counts")
+        )
+
+        # 작성자 카드를 같은 쿼리에서 조인하고, 답글에는 얕은 것부터 전체 순번을 매김
+        ranked = (
+            select(
+                tree.c.depth,
+                comments,
+                User.full_name.label("user_name"),
+                User.profile_image_url.label("user_profile_image"),
+                func.coalesce(reply_counts.c.reply_count, 0).label("reply_count"),
+                func.row_number().over(
+                    partition_by=tree.c.depth == 0,
+                    order_by=(tree.c.depth, comments.c.created_at, comments.c.id)
+                ).label("node_rn")
+            )
+            .select_from(tree)
+            .join(comments, comments.c.id == tree.c.id)
+            .outerjoin(User, User.id == comments.c.user_id)
+            .outerjoin(reply_counts, reply_counts.c.parent_id == tree.c.id)
+            .where(tree.c.depth <= max_depth, or_(tree.c.depth == 0, ~tree.c.is_extra))
+            .subquery("ranked")
+        )
+        rows = db.execute(
+            select(ranked)
+            .where(or_(ranked.c.depth == 0, ranked.c.node_rn <= max_nodes))
+            .order_by(ranked.c.depth, ranked.c.created_at, ranked.c.id)
+        ).all()
+
+        nodes: Dict[int, dict] = {}
+        reply_counts_by_id: Dict[int, int] = {}
+        roots: List[dict] = []
+        for row in rows:
+            node = {
+                "id": row.id,
+                "content": row.content,
+                "post_id": row.post_id,
+                "user_id": row.user_id,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+                "parent_id": row.parent_id,
+                "user_name": row.user_name,
+                "user_profile_image": row.user_profile_image,
+                "depth": row.depth,
+                "replies": [],
+                "has_more_replies": False,
+                "replies_cursor": None,
+            }
+            reply_counts_by_id[row.id] = row.reply_count
+
+            if row.depth == 0:
+                roots.append(node)
+            else:
+                # 얕은 답글부터 순서대로 읽으므로 부모는 항상 먼저 나옴
+                nodes[row.parent_id]["replies"].append(node)
+            nodes[row.id] = node
+
+        next_cursor = None
+        if len(roots) > limit:
+            roots = roots[:limit]
+            next_cursor = encode_cursor(roots[-1]["created_at"], roots[-1]["id"])
+
+        # 답글 수 제한, 깊이 제한, 전체 노드 제한 중 어느 것으로 잘렸든 이어서 조회할 수 있게 표시
+        for node in nodes.values():
+            replies = node["replies"]
+            if reply_counts_by_id[node["id"]] > len(replies):
+                node["has_more_replies"] = True
+                if replies:
+                    node["replies_cursor"] = encode_cursor(replies[-1]["created_at"], replies[-1]["id"])
+
+        return roots, next_cursor
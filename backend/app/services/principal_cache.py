@@ -0,0 +1,38 @@
+import copy
+from typing import Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..config import (
+    AUTH_CLAIMS_CACHE_MAX_ENTRIES, AUTH_CLAIMS_CACHE_TTL_SECONDS,
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES, AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+)
+from ..models import models
+from ..utils.cache import LRUTTLCache
+
+# 토큰 문자열 -> 검증된 클레임 (JWT 서명 검증 생략)
+claims_cache = LRUTTLCache(maxsize=AUTH_CLAIMS_CACHE_MAX_ENTRIES, ttl=AUTH_CLAIMS_CACHE_TTL_SECONDS)
+
+# 사용자 ID -> User 컬럼 값 스냅샷 (사용자 SELECT 생략)
+principal_cache = LRUTTLCache(maxsize=AUTH_PRINCIPAL_CACHE_MAX_ENTRIES, ttl=AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
+
+def _user_columns():
+    return [attr.key for attr in inspect(models.User).column_attrs]
+
+def cache_principal(user: models.User) -> None:
+    principal_cache.set(user.id, {key: copy.deepcopy(getattr(user, key)) for key in _user_columns()})
+
+def cached_principal(user_id: int) -> Optional[models.User]:
+    """캐시된 스냅샷으로 세션에 붙지 않은(detached) User를 만듭니다. 없으면 None."""
+    snapshot = principal_cache.get(user_id)
+    if snapshot is None:
+        return None
+    user = models.User(**copy.deepcopy(snapshot))
+    # 모든 컬럼을 DB에서 읽은 값으로 간주 (변경 내역 없음)
+    make_transient_to_detached(user)
+    return user
+
+def invalidate_principal(user_id: int) -> None:
+    """사용자 프로필이 바뀌거나 삭제되었을 때 호출합니다."""
+    principal_cache.invalidate(user_id)
@@ -0,0 +1,75 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import desc, exists, func, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+from ..models.models import SCRAP_SEARCH_CONFIG, Scrap, ScrapTag, Tag
+from ..utils.pagination import cursor_score
+
+# 검색어 주변을 잘라 강조 표시한 조각 옵션
+HEADLINE_OPTIONS = "StartSel=<b>, StopSel=</b>, MaxWords=30, MinWords=10, MaxFragments=2"
+
+def _escape_html(column):
+    """강조 태그 외에는 사용자 입력이 HTML로 해석되지 않도록 &, <, >를 이스케이프합니다."""
+    return func.replace(func.replace(func.replace(column, "&", "&amp;"), "<", "&lt;"), ">", "&gt;")
+
+class ScrapService:
+    @staticmethod
+    def set_tags(db: Session, scrap: Scrap, user_id: int, tag_ids: Optional[List[int]]) -> None:
+        """스크랩의 태그를 tag_ids로 바꿉니다. 다른 사용자의 태그는 무시합니다."""
+        db.query(ScrapTag).filter(ScrapTag.scrap_id == scrap.id).delete(synchronize_session=False)
+        if not tag_ids:
+            return
+        owned_ids = [
+            row.id for row in db.query(Tag.id).filter(Tag.id.in_(set(tag_ids)), Tag.user_id == user_id).all()
+        ]
+        db.add_all(ScrapTag(scrap_id=scrap.id, tag_id=tag_id) for tag_id in owned_ids)
+
+    @staticmethod
+    def search(
+        db: Session,
+        user_id: int,
+        query: str,
+        tag_ids: Optional[List[int]] = None,
+        limit: int = 20,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Scrap]:
+        """사용자의 스크랩을 전문 검색해 관련도 순으로 반환합니다.
+
+        search_vector GIN 인덱스로 후보를 찾고, 태그 조건은 같은 쿼리의 EXISTS로 거릅니다.
+        강조 표시(ts_headline)는 비용이 크므로 잘라낸 페이지의 행에만 계산합니다.
+        반환하는 Scrap에는 rank, content_highlight, note_highlight 속성이 채워집니다.
+        강조 조각은 원문을 HTML 이스케이프한 뒤 만들므로 <b> 태그 외의 마크업은 들어 있지 않습니다.
+        """
+        query = (query or "").strip()
+        ts_query = func.websearch_to_tsquery(SCRAP_SEARCH_CONFIG, query) if query else None
+        rank = cursor_score(func.ts_rank_cd(Scrap.search_vector, ts_query) if ts_query is not None else literal(0.0))
+
+        page = select(Scrap.id, rank.label("rank")).where(Scrap.user_id == user_id)
+        if ts_query is not None:
+            page = page.where(Scrap.search_vector.op("@@")(ts_query))
+        if tag_ids:
+            page = page.where(exists().where(ScrapTag.scrap_id == Scrap.id, ScrapTag.tag_id.in_(tag_ids)))
+        if cursor:
+            page = page.where(tuple_(rank, Scrap.id) < tuple_(*cursor))
+        page = page.order_by(desc(rank), desc(Scrap.id)).limit(limit).subquery("page")
+
+        if ts_query is not None:
+            content_highlight = func.ts_headline(SCRAP_SEARCH_CONFIG, _escape_html(Scrap.content), ts_query, HEADLINE_OPTIONS)
+            note_highlight = func.ts_headline(SCRAP_SEARCH_CONFIG, _escape_html(Scrap.note), ts_query, HEADLINE_OPTIONS)
+        else:
+            content_highlight = note_highlight = literal(None)
+
+        rows = db.execute(
+            select(Scrap, page.c.rank, content_highlight.label("content_highlight"), note_highlight.label("note_highlight"))
+            .join(page, page.c.id == Scrap.id)
+            .order_by(desc(page.c.rank), desc(Scrap.id))
+        ).all()
+
+        scraps = []
+        for scrap, rank_value, content_hl, note_hl in rows:
+            scrap.rank = rank_value
+            scrap.content_highlight = content_hl
+            scrap.note_highlight = note_hl
+            scraps.append(scrap)
+        return scraps
@@ -0,0 +1,139 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, desc, select, literal, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+from ..models.models import Post, Follow, TimelineEntry
+from ..config import TIMELINE_FANOUT_MAX_FOLLOWERS, TIMELINE_BACKFILL_LIMIT
+from ..utils.pagination import keyset_after
+
+class TimelineService:
+    """팔로워별 홈 타임라인을 관리합니다.
+
+    포스트 작성 시 팔로워들의 타임라인에 미리 펼쳐 두고(fan-out-on-write),
+    팔로워가 너무 많은 작성자의 포스트는 조회 시점에 가져옵니다(pull).
+    커밋은 호출자가 담당합니다.
+    """
+
+    @staticmethod
+    def is_pull_author(db: Session, author_id: int) -> bool:
+        """작성자의 포스트를 조회 시점에 가져와야 하는지 확인합니다."""
+        follower_count = db.query(func.count(Follow.id)).filter(Follow.following_id == author_id).scalar()
+        return follower_count > TIMELINE_FANOUT_MAX_FOLLOWERS
+
+    @staticmethod
+    def fan_out_post(db: Session, post: Post) -> None:
+        """작성자의 모든 팔로워 타임라인에 포스트를 추가합니다."""
+        if post.timeline_pull:
+            return
+
+        rows = select(
+            Follow.follower_id,
+            literal(post.id),
+            literal(post.author_id),
+            literal(post.created_at),
+        ).where(Follow.following_id == post.author_id)
+
+        db.execute(
+            pg_insert(TimelineEntry)
+            .from_select(["user_id", "post_id", "author_id", "created_at"], rows)
+            .on_conflict_do_nothing()
+        )
+
+    @staticmethod
+    def remove_post(db: Session, post_id: int) -> None:
+        """모든 타임라인에서 포스트를 제거합니다."""
+        db.query(TimelineEntry).filter(TimelineEntry.post_id == post_id).delete(synchronize_session=False)
+
+    @staticmethod
+    def add_author(db: Session, user_id: int, author_id: int) -> None:
+        """새로 팔로우한 작성자의 최근 포스트를 타임라인에 채워 넣습니다."""
+        rows = (
+            select(literal(user_id), Post.id, Post.author_id, Post.created_at)
+            .where(Post.author_id == author_id, Post.timeline_pull.is_(False))
+            .order_by(desc(Post.created_at))
+            .limit(TIMELINE_BACKFILL_LIMIT)
+        )
+
+        db.execute(
+            pg_insert(TimelineEntry)
+            .from_select(["user_id", "post_id", "author_id", "created_at"], rows)
+            .on_conflict_do_nothing()
+        )
+
+    @staticmethod
+    def remove_author(db: Session, user_id: int, author_id: int) -> None:
+        """언팔로우한 작성자의 포스트를 타임라인에서 제거합니다."""
+        db.query(TimelineEntry).filter(
+            TimelineEntry.user_id == user_id,
+            TimelineEntry.author_id == author_id
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def get_timeline_post_ids(
+        db: Session,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[int]:
+        """타임라인 범위 조회와 pull 대상 작성자의 포스트를 합쳐 최신순 포스트 ID로 반환합니다.
+
+        cursor가 주어지면 skip은 무시하고 (created_at, id) 커서 이후부터 조회합니다.
+        """
+        if cursor:
+            skip = 0
+        window = skip + limit
+
+        # 미리 펼쳐 둔 타임라인: (user_id, created_at, post_id) 인덱스 범위 스캔
+        pushed = (
+            db.query(TimelineEntry.post_id.label("id"), TimelineEntry.created_at)
+            .filter(TimelineEntry.user_id == user_id)
+        )
+        if cursor:
+            pushed = pushed.filter(keyset_after(TimelineEntry.created_at, TimelineEntry.post_id, cursor))
+        pushed = (
+            pushed.order_by(desc(TimelineEntry.created_at), desc(TimelineEntry.post_id))
+            .limit(window)
+            .all()
+        )
+
+        # 팔로워가 많은 작성자의 포스트는 조회 시점에 가져옴
+        following_ids = db.query(Follow.following_id).filter(Follow.follower_id == user_id)
+        pulled = db.query(Post.id, Post.created_at).filter(and_(Post.timeline_pull.is_(True), Post.author_id.in_(following_ids)))
+        if cursor:
+            pulled = pulled.filter(keyset_after(Post.created_at, Post.id, cursor))
+        pulled = (
+            pulled.order_by(desc(Post.created_at), desc(Post.id))
+            .limit(window)
+            .all()
+        )
+
+        if not pulled:
+            return [row.id for row in pushed[skip:window]]
+
+        merged = sorted(
+            {row.id: row for row in pushed + pulled}.values(),
+            key=lambda row: (row.created_at, row.id),
+            reverse=True
+        )
+        return [row.id for row in merged[skip:window]]
+
+    @staticmethod
+    def rebuild(db: Session) -> None:
+        """팔로우 관계와 포스트로부터 모든 타임라인을 다시 만듭니다."""
+        db.query(TimelineEntry).delete(synchronize_session=False)
+
+        rows = (
+            select(Follow.follower_id, Post.id, Post.author_id, Post.created_at)
+            .select_from(Follow)
+            .join(Post, Post.author_id == Follow.following_id)
+            .where(Post.timeline_pull.is_(False))
+        )
+
+        db.execute(
+            pg_insert(TimelineEntry)
+            .from_select(["user_id", "post_id", "author_id", "created_at"], rows)
+            .on_conflict_do_nothing()
+        )
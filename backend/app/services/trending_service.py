@@ -0,0 +1,227 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import desc, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..models.models import Paper, Post, PostLike, Scrap, PaperEngagementHourly
+from ..config import TRENDING_WINDOW_HOURS, TRENDING_WEIGHTS
+
+# 롤업 테이블에 시간 단위로 쌓는 신호
+SIGNALS = ("post_count", "like_count", "scrap_count")
+
+_cache_lock = threading.Lock()
+_cache: Dict[Tuple[datetime, int], List[dict]] = {}
+
+def hour_bucket(at: datetime) -> datetime:
+    """시각을 해당 시간 버킷의 시작 시각으로 내립니다."""
+    return at.replace(minute=0, second=0, microsecond=0)
+
+def window_start() -> datetime:
+    """트렌딩 집계에 포함되는 가장 오래된 버킷을 반환합니다."""
+    return hour_bucket(datetime.utcnow()) - timedelta(hours=TRENDING_WINDOW_HOURS - 1)
+
+def _upsert_rollup():
+    stmt = pg_insert(PaperEngagementHourly)
+    return stmt.on_conflict_do_update(
+        index_elements=[PaperEngagementHourly.paper_id, PaperEngagementHourly.bucket],
+        set_={signal: getattr(PaperEngagementHourly, signal) + stmt.excluded[signal] for signal in SIGNALS}
+    )
+
+class TrendingDeltaBuffer:
+    """좋아요/스크랩처럼 요청마다 생기는 신호 증감분을 프로세스 메모리에 모았다가 일괄 upsert로 반영합니다.
+
+    같은 (논문, 시간 버킷) 행에 요청마다 upsert하면 인기 논문의 현재 버킷 행에 잠금이 몰리므로,
+    참여 카운터와 함께 주기적으로 flush해 버킷당 한 건으로 합쳐서 기록합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[int, datetime], Dict[str, int]] = {}
+
+    def add(self, paper_id: Optional[int], signal: str, delta: int = 1, at: Optional[datetime] = None) -> None:
+        """신호 증감분을 버퍼에 더합니다. 커밋한 뒤에 호출합니다."""
+        if paper_id is None or delta == 0:
+            return
+        if signal not in SIGNALS:
+            raise ValueError(f"Unknown trending signal: {signal}")
+
+        bucket = hour_bucket(at or datetime.utcnow())
+        # 집계 구간을 벗어난 버킷은 이미 정리 대상이므로 기록하지 않음
+        if bucket < window_start():
+            return
+        with self._lock:
+            deltas = self._pending.setdefault((paper_id, bucket), dict.fromkeys(SIGNALS, 0))
+            deltas[signal] += delta
+
+    def _drain(self) -> Dict[Tuple[int, datetime], Dict[str, int]]:
+        with self._lock:
+            drained, self._pending = self._pending, {}
+        return drained
+
+    def _restore(self, drained: Dict[Tuple[int, datetime], Dict[str, int]]) -> None:
+        with self._lock:
+            for key, deltas in drained.items():
+                current = self._pending.setdefault(key, dict.fromkeys(SIGNALS, 0))
+                for signal, delta in deltas.items():
+                    current[signal] += delta
+
+    def flush(self, db: Session) -> int:
+        """버퍼에 쌓인 증감분을 executemany upsert 한 번으로 반영하고, 반영한 버킷 수를 반환합니다."""
+        drained = self._drain()
+        start = window_start()
+        rows = [
+            {"paper_id": paper_id, "bucket": bucket, **deltas}
+            for (paper_id, bucket), deltas in drained.items()
+            if bucket >= start and any(deltas.values())
+        ]
+        if not rows:
+            return 0
+
+        try:
+            db.execute(_upsert_rollup(), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            self._restore(drained)
+            raise
+        return len(rows)
+
+trending_deltas = TrendingDeltaBuffer()
+
+class TrendingService:
+    """논문별 참여 신호를 시간 버킷 롤업 테이블에 증분으로 쌓고, 최근 구간 합으로 트렌딩을 계산합니다.
+
+    쓰기 함수는 커밋하지 않으므로 호출자의 트랜잭션과 함께 반영됩니다.
+    요청마다 생기는 좋아요/스크랩 신호는 record 대신 trending_deltas 버퍼에 더합니다.
+    """
+
+    @staticmethod
+    def record(db: Session, paper_id: Optional[int], signal: str, delta: int = 1, at: Optional[datetime] = None) -> None:
+        """논문의 시간 버킷에 신호 증감분을 더합니다. 집계 구간을 벗어난 버킷은 건너뜁니다."""
+        if paper_id is None or delta == 0:
+            return
+        if signal not in SIGNALS:
+            raise ValueError(f"Unknown trending signal: {signal}")
+
+        bucket = hour_bucket(at or datetime.utcnow())
+        if bucket < window_start():
+            return
+        db.execute(_upsert_rollup(), {"paper_id": paper_id, "bucket": bucket, **dict.fromkeys(SIGNALS, 0), signal: delta})
+
+    @staticmethod
+    def remove_post_likes(db: Session, paper_id: Optional[int], post_id: int) -> None:
+        """삭제되는 포스트에 달린 좋아요를 롤업에서 뺍니다."""
+        if paper_id is None:
+            return
+
+        bucket = func.date_trunc("hour", PostLike.created_at)
+        rows = (
+            db.query(bucket, func.count(PostLike.id))
+            .filter(PostLike.post_id == post_id, PostLike.created_at >= window_start())
+            .group_by(bucket)
+            .all()
+        )
+        for at, count in rows:
+            TrendingService.record(db, paper_id, "like_count", -count, at=at)
+
+    @staticmethod
+    def get_trending(db: Session, limit: int = 3) -> List[dict]:
+        """최근 TRENDING_WINDOW_HOURS개 버킷의 가중 합이 큰 논문을 반환합니다.
+
+        결과는 다음 버킷 경계까지 프로세스 메모리에 캐시됩니다.
+        """
+        current = hour_bucket(datetime.utcnow())
+        start = current - timedelta(hours=TRENDING_WINDOW_HOURS - 1)
+        key = (current, limit)
+        with _cache_lock:
+            if key in _cache:
+                return _cache[key]
+
+        rollup = PaperEngagementHourly
+        score = sum(
+            func.coalesce(func.sum(getattr(rollup, signal)), 0) * TRENDING_WEIGHTS[signal]
+            for signal in SIGNALS
+        ).label("score")
+        post_count = func.coalesce(func.sum(rollup.post_count), 0).label("post_count")
+
+        rows = (
+            db.query(Paper, post_count, score)
+            .join(rollup, rollup.paper_id == Paper.id)
+            .filter(rollup.bucket >= start)
+            .group_by(Paper.id)
+            .having(score > 0)
+            .order_by(desc(score), Paper.id)
+            .limit(limit)
+            .all()
+        )
+
+        result = [{
+            "id": paper.id,
+            "title": paper.title,
+            "authors": paper.authors,
+            "abstract": paper.abstract,
+            "published_date": paper.published_date,
+            "arxiv_id": paper.arxiv_id,
+            "url": paper.url,
+            "categories": paper.categories,
+            "created_at": paper.created_at,
+            "updated_at": paper.updated_at,
+            "user_id": paper.user_id,
+            "post_count": int(paper_post_count),
+            "score": float(paper_score),
+        } for paper, paper_post_count, paper_score in rows]
+
+        with _cache_lock:
+            # 지난 버킷의 결과는 버림
+            for stale in [k for k in _cache if k[0] != current]:
+                del _cache[stale]
+            _cache[key] = result
+        return result
+
+    @staticmethod
+    def prune(db: Session) -> int:
+        """집계 구간을 벗어난 버킷 행을 지우고, 지운 행 수를 반환합니다."""
+        return (
+            db.query(PaperEngagementHourly)
+            .filter(PaperEngagementHourly.bucket < window_start())
+            .delete(synchronize_session=False)
+        )
+
+    @staticmethod
+    def rebuild(db: Session) -> None:
+        """포스트, 좋아요, 스크랩 원본으로부터 최근 구간의 롤업을 다시 계산합니다. 이전 버킷은 모두 지웁니다."""
+        start = window_start()
+        db.query(PaperEngagementHourly).delete(synchronize_session=False)
+
+        post_bucket = func.date_trunc("hour", Post.created_at)
+        like_bucket = func.date_trunc("hour", PostLike.created_at)
+        scrap_bucket = func.date_trunc("hour", Scrap.created_at)
+        signals = union_all(
+            select(Post.paper_id, post_bucket.label("bucket"), literal(1).label("post_count"), literal(0).label("like_count"), literal(0).label("scrap_count"))
+            .where(Post.paper_id.isnot(None), Post.created_at >= start),
+            select(Post.paper_id, like_bucket, literal(0), literal(1), literal(0))
+            .select_from(PostLike)
+            .join(Post, Post.id == PostLike.post_id)
+            .where(Post.paper_id.isnot(None), PostLike.created_at >= start),
+            select(Scrap.paper_id, scrap_bucket, literal(0), literal(0), literal(1))
+            .where(Scrap.paper_id.isnot(None), Scrap.created_at >= start),
+        ).subquery("signals")
+
+        db.execute(
+            pg_insert(PaperEngagementHourly).from_select(
+                ["paper_id", "bucket", "post_count", "like_count", "scrap_count"],
+                select(
+                    signals.c.paper_id,
+                    signals.c.bucket,
+                    func.sum(signals.c.post_count),
+                    func.sum(signals.c.like_count),
+                    func.sum(signals.c.scrap_count),
+                ).group_by(signals.c.paper_id, signals.c.bucket)
+            )
+        )
+
+        with _cache_lock:
+            _cache.clear()
@@ -0,0 +1,44 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy import desc, func, literal, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from ..models.models import USER_SEARCH_COLUMNS, User
+from ..utils.pagination import cursor_score
+
+class UserSearchService:
+    @staticmethod
+    def search(
+        db: Session,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[User]:
+        """이름, 소속, 부서, 연구 분야에서 사용자를 찾아 유사도 순으로 limit명까지 반환합니다.
+
+        검색어가 컬럼의 어느 단어(또는 단어 앞부분)와 비슷하면 일치로 보며(pg_trgm의 <% 연산자),
+        각 컬럼의 트라이그램 GIN 인덱스로 후보를 찾습니다. 점수는 네 컬럼의 word_similarity 중 최댓값이고,
+        반환하는 User에는 search_score 속성이 채워집니다. 다음 페이지는 (점수, id) 커서로 이어서 조회합니다.
+        """
+        query = (query or "").strip()
+        if not query:
+            return []
+
+        term = literal(query)
+        columns = [getattr(User, name) for name in USER_SEARCH_COLUMNS]
+        # greatest는 NULL(비어 있는 컬럼)을 무시함
+        score = cursor_score(func.greatest(*(func.word_similarity(term, column) for column in columns)))
+
+        statement = (
+            select(User, score.label("search_score"))
+            .where(or_(*(term.op("<%")(column) for column in columns)))
+        )
+        if cursor:
+            statement = statement.where(tuple_(score, User.id) < tuple_(*cursor))
+        rows = db.execute(statement.order_by(desc(score), desc(User.id)).limit(limit)).all()
+
+        users = []
+        for user, search_score in rows:
+            user.search_score = search_score
+            users.append(user)
+        return users
@@ -0,0 +1,158 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, desc, exists, func, literal, literal_column, select, tuple_, union, update
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..config import WORKSPACE_RECOMMENDATION_CANDIDATES
+from ..models.models import WORKSPACE_ACTIVITY_SQL, WORKSPACE_SEARCH_CONFIG, Follow, Workspace, WorkspaceMember
+from ..utils.pagination import cursor_score
+
+class WorkspaceService:
+    @staticmethod
+    def add_member(db: Session, workspace_id: int, user_id: int, role: str = "member") -> bool:
+        """워크스페이스에 멤버를 추가하고 member_count를 DB에서 원자적으로 1 늘립니다.
+
+        (workspace_id, user_id) 유니크 제약으로 중복 가입을 막으며, 이미 멤버면 False를 반환합니다.
+        동시에 가입해도 카운터는 UPDATE ... SET member_count = member_count + 1 로만 바뀌므로 유실되지 않습니다.
+        커밋은 호출 측에서 합니다.
+        """
+        member_id = db.execute(
+            pg_insert(WorkspaceMember)
+            .values(workspace_id=workspace_id, user_id=user_id, role=role, joined_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=["workspace_id", "user_id"])
+            .returning(WorkspaceMember.id)
+        ).scalar()
+        if member_id is None:
+            return False
+
+        db.execute(
+            update(Workspace)
+            .where(Workspace.id == workspace_id)
+            .values(member_count=func.coalesce(Workspace.member_count, 0) + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return True
+
+    @staticmethod
+    def get_recommended_workspace_ids(
+        db: Session,
+        user_id: int,
+        research_field: Optional[str] = None,
+        interests: Optional[List[str]] = None,
+        limit: int = 10,
+        candidates_per_source: int = WORKSPACE_RECOMMENDATION_CANDIDATES
+    ) -> List[int]:
+        """가입하지 않은 공개 워크스페이스를 점수 순으로 limit개 반환합니다.
+
+        점수는 한 번의 쿼리에서 집계로 계산합니다.
+        - 팔로우한 사용자가 멤버인 경우 한 명당 5점
+        - 연구 분야 일치 3점
+        - 관심사와 겹치는 연구 주제 하나당 1점
+        - 활성도: 멤버 5명당 1점(최대 3점), 논문 3편당 1점(최대 2점)
+
+        전체 워크스페이스를 훑지 않도록 점수를 받을 수 있는 후보만 인덱스로 출처마다
+        candidates_per_source개까지 모은 뒤 그 안에서 점수를 매깁니다. 후보는 팔로우한 사용자가
+        속한 곳, 같은 연구 분야의 활성도 상위, 관심 주제가 겹치는 곳, 전체 활성도 상위입니다.
+        비용은 사용자의 팔로우 그래프와 후보 수에만 비례하고 카탈로그 크기와는 무관합니다.
+        """
+        activity = literal_column(f"({WORKSPACE_ACTIVITY_SQL})")
+        already_joined = exists().where(
+            WorkspaceMember.workspace_id == Workspace.id,
+            WorkspaceMember.user_id == user_id
+        )
+
+        # 내가 팔로우하는 사용자의 워크스페이스별 멤버 수 (팔로우 목록 크기에만 비례)
+        followed_members = (
+            select(WorkspaceMember.workspace_id, func.count().label("followed_count"))
+            .join(Follow, Follow.following_id == WorkspaceMember.user_id)
+            .where(Follow.follower_id == user_id)
+            .group_by(WorkspaceMember.workspace_id)
+            .subquery("followed_members")
+        )
+
+        def public_candidates(*criteria, order_by=()):
+            return (
+                select(Workspace.id)
+                .where(Workspace.is_public.is_(True), ~already_joined, *criteria)
+                .order_by(*order_by)
+                .limit(candidates_per_source)
+            )
+
+        # 기존 파이썬 비교(==)와 같이 둘 다 NULL이어도 일치로 봄. 인덱스를 타도록 값이 있으면 = 로 비교
+        if research_field is None:
+            field_matches = Workspace.research_field.is_(None)
+        else:
+            field_matches = Workspace.research_field == research_field
+        sources = [
+            public_candidates(order_by=(desc(activity), Workspace.id)),
+            public_candidates(field_matches, order_by=(desc(activity), Workspace.id)),
+            select(followed_members.c.workspace_id.label("id"))
+            .join(Workspace, Workspace.id == followed_members.c.workspace_id)
+            .where(Workspace.is_public.is_(True), ~already_joined)
+            .order_by(desc(followed_members.c.followed_count), followed_members.c.workspace_id)
+            .limit(candidates_per_source),
+        ]
+        if interests:
+            sources.append(public_candidates(
+                Workspace.research_topics.op("&&")(array(interests)),
+                order_by=(desc(activity), Workspace.id)
+            ))
+        candidates = union(*(source.subquery().select() for source in sources)).subquery("candidates")
+
+        if interests:
+            topics = func.unnest(Workspace.research_topics).table_valued("topic").render_derived()
+            topic_overlap = (
+                select(func.count(func.distinct(topics.c.topic)))
+                .select_from(topics)
+                .where(topics.c.topic.in_(interests))
+                .scalar_subquery()
+            )
+        else:
+            topic_overlap = literal(0)
+
+        score = (
+            func.coalesce(followed_members.c.followed_count, 0) * 5
+            + case((field_matches, 3), else_=0)
+            + topic_overlap
+            + activity
+        ).label("score")
+
+        rows = db.execute(
+            select(Workspace.id, score)
+            .join(candidates, candidates.c.id == Workspace.id)
+            .outerjoin(followed_members, followed_members.c.workspace_id == Workspace.id)
+            .order_by(desc(score), Workspace.id)
+            .limit(limit)
+        ).all()
+        return [row.id for row in rows]
+
+    @staticmethod
+    def search_workspace_ids(
+        db: Session,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple[int, float]]:
+        """공개 워크스페이스를 전문 검색해 관련도 순으로 (id, 점수)를 limit개 반환합니다.
+
+        search_vector GIN 인덱스로 후보를 찾고 이름 > 주제/분야 > 설명 가중치로 순위를 매깁니다.
+        검색어가 비어 있으면 모든 공개 워크스페이스를 최신 id 순으로 반환합니다.
+        상세 정보는 호출 측에서 반환할 페이지의 id만 로드합니다.
+        """
+        query = (query or "").strip()
+        statement = select(Workspace.id)
+        if query:
+            ts_query = func.websearch_to_tsquery(WORKSPACE_SEARCH_CONFIG, query)
+            rank = cursor_score(func.ts_rank_cd(Workspace.search_vector, ts_query))
+            statement = statement.where(Workspace.search_vector.op("@@")(ts_query))
+        else:
+            rank = cursor_score(literal(0.0))
+
+        statement = statement.add_columns(rank.label("rank")).where(Workspace.is_public.is_(True))
+        if cursor:
+            statement = statement.where(tuple_(rank, Workspace.id) < tuple_(*cursor))
+        rows = db.execute(statement.order_by(desc(rank), desc(Workspace.id)).limit(limit)).all()
+        return [(row.id, row.rank) for row in rows]
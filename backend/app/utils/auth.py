@@ -1,16 +1,20 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from ..models.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.async_database import get_async_db
 from ..models import models
+from ..services.principal_cache import claims_cache, cache_principal, cached_principal
+from .password_hasher import password_hasher
+from ..config import DIAGNOSTICS_ALLOWED_EMAILS
 import os
+import time
 
-# 비밀번호 해싱을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해싱을 위한 설정 (요청 처리 중에는 password_hasher의 비동기 메서드를 사용)
+pwd_context = password_hasher.context
 # OAuth2 스키마 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -35,24 +39,65 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _decode_claims(token: str) -> Optional[dict]:
+    """토큰을 검증하고 sub/uid 클레임을 반환합니다. 검증된 클레임은 토큰 만료 전까지 캐시합니다."""
+    claims = claims_cache.get(token)
+    if claims is not None:
+        if claims["exp"] > time.time():
+            return claims
+        claims_cache.invalidate(token)
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("sub") is None:
+        return None
+
+    claims = {"sub": payload["sub"], "uid": payload.get("uid"), "exp": payload.get("exp", 0)}
+    remaining = claims["exp"] - time.time()
+    if remaining > 0:
+        claims_cache.set(token, claims, ttl=min(claims_cache.ttl, remaining))
+    return claims
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> models.User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+    claims = _decode_claims(token)
+    if claims is None:
         raise credentials_exception
-        
-    user = db.query(models.User).filter(models.User.email == email).first()
-    if user is None:
+    email, user_id = claims["sub"], claims["uid"]
+
+    # uid 클레임이 있으면 캐시된 사용자 정보를 SELECT 없이 세션에 붙여서 사용
+    if user_id is not None:
+        cached = cached_principal(user_id)
+        if cached is not None and cached.email == email:
+            return await db.merge(cached, load=False)
+
+    # uid가 없는 이전 토큰은 이메일로 조회
+    if user_id is not None:
+        user = await db.get(models.User, user_id)
+    else:
+        result = await db.execute(select(models.User).where(models.User.email == email))
+        user = result.scalars().first()
+    if user is None or user.email != email:
         raise credentials_exception
-    return user 
\ No newline at end of file
+    cache_principal(user)
+    return user
+
+async def get_diagnostics_user(
+    current_user: models.User = Depends(get_current_user)
+) -> models.User:
+    """운영 진단 엔드포인트용. DIAGNOSTICS_ALLOWED_EMAILS에 있는 사용자만 통과시킵니다."""
+    if (current_user.email or "").lower() not in DIAGNOSTICS_ALLOWED_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="진단 정보를 조회할 권한이 없습니다."
+        )
+    return current_user
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+class JSONDiskCache:
+    """값을 키별 JSON 파일로 저장하는 만료 시간(TTL) 캐시입니다. 프로세스를 재시작해도 유지됩니다.
+
+    파일 입출력을 하므로 이벤트 루프에서는 executor로 호출해야 합니다.
+    만료된 항목도 max_stale_age까지는 남겨 두어, 원본 호출이 실패했을 때 get(allow_stale=True)로 꺼내 쓸 수 있습니다.
+    키가 사용자 입력이라 항목 수에 끝이 없으므로, 쓰기 때 sweep_interval초마다 한 번 디렉토리를 훑어
+    max_stale_age보다 오래된 파일을 지우고 max_entries를 넘으면 오래된 것부터 지웁니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float,
+        max_stale_age: float,
+        max_entries: int,
+        sweep_interval: float = 300.0
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_stale_age = max(max_stale_age, ttl)
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.writes = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # 해시 충돌이나 손상된 파일은 없는 것으로 취급
+        if entry.get("key") != key:
+            return None
+        return entry["stored_at"], entry["value"]
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        entry = self._read(key)
+        age = time.time() - entry[0] if entry is not None else None
+        if age is not None and age >= self.max_stale_age:
+            # 아직 청소되지 않았을 뿐 보관 기간이 지난 항목
+            entry = None
+        fresh = entry is not None and age < self.ttl
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            elif entry is not None and allow_stale:
+                self.stale_hits += 1
+            else:
+                self.misses += 1
+        if entry is None or not (fresh or allow_stale):
+            return None
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        payload = {"key": key, "stored_at": time.time(), "value": value}
+        # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            self.writes += 1
+            now = time.time()
+            sweep = now - self._last_sweep >= self.sweep_interval
+            if sweep:
+                self._last_sweep = now
+        if sweep:
+            self.sweep()
+
+    def sweep(self) -> int:
+        """보관 기간이 지난 파일과 max_entries를 넘는 오래된 파일, 남은 임시 파일을 지우고 지운 항목 수를 반환합니다."""
+        now = time.time()
+        entries = []
+        expired = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # 쓰던 중 죽은 프로세스가 남긴 임시 파일
+                    if now - mtime >= self.sweep_interval:
+                        expired.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    if now - mtime >= self.max_stale_age:
+                        expired.append(entry.path)
+                    else:
+                        entries.append((mtime, entry.path))
+
+        if len(entries) > self.max_entries:
+            entries.sort()
+            expired.extend(path for _, path in entries[:len(entries) - self.max_entries])
+
+        removed = 0
+        for path in expired:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                # 다른 프로세스가 먼저 지움
+                continue
+            if path.endswith(".json"):
+                removed += 1
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.stale_hits
+            return {
+                "directory": self.directory,
+                "ttl": self.ttl,
+                "max_stale_age": self.max_stale_age,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
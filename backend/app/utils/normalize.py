@@ -0,0 +1,39 @@
+from typing import Any, Callable, Dict, List, Literal, Optional
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from .pagination import cursor_headers
+
+# format=normalized 응답 형식
+#   {"data": [...], "included": {"users": {"3": {...}}, "papers": {"7": {...}}}}
+# 목록 항목은 사용자/논문을 id로만 참조하고, 참조된 객체는 included에 한 번씩만 담습니다.
+ResponseFormat = Literal["full", "normalized"]
+FORMAT_DESCRIPTION = "normalized이면 사용자/논문을 id로만 참조하고 included에 한 번씩만 담아 응답합니다."
+
+class Included:
+    """응답에 함께 보낼 참조 객체를 종류별로 중복 없이 모읍니다."""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[int, Any]] = {}
+
+    def add(self, kind: str, id_: Optional[int], build: Callable[[], Any]) -> None:
+        # 처음 보는 객체만 직렬화
+        if id_ is None:
+            return
+        entries = self._entries.setdefault(kind, {})
+        if id_ not in entries:
+            entries[id_] = build()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            kind: {str(id_): value for id_, value in entries.items()}
+            for kind, entries in self._entries.items()
+        }
+
+def normalized_response(data: List[Any], included: Included, response: Optional[Response] = None) -> JSONResponse:
+    """정규화 응답을 만듭니다. Response를 직접 반환하면 주입된 response의 헤더가 버려지므로 커서 헤더를 옮겨 담습니다."""
+    return JSONResponse(
+        jsonable_encoder({"data": data, "included": included.to_dict()}),
+        headers=cursor_headers(response)
+    )
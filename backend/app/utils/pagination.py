@@ -0,0 +1,91 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from fastapi import HTTPException, Response, status
+from sqlalchemy import cast, tuple_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들을 불투명한 커서 문자열로 인코딩합니다."""
+    payload = [
+        {"t": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 문자열을 정렬 키 값들로 디코딩합니다. 잘못된 커서는 400 오류를 발생시킵니다."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != size:
+            raise ValueError("cursor size mismatch")
+        return [
+            datetime.fromisoformat(value["t"]) if isinstance(value, dict) else value
+            for value in payload
+        ]
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다."
+        )
+
+def decode_time_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """(created_at, id) 커서를 디코딩합니다."""
+    if not cursor:
+        return None
+    created_at, id_ = decode_cursor(cursor, 2)
+    if not isinstance(created_at, datetime) or not isinstance(id_, int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다."
+        )
+    return created_at, id_
+
+def decode_score_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """검색 결과 정렬에 쓰는 (점수, id) 커서를 디코딩합니다."""
+    if not cursor:
+        return None
+    score, id_ = decode_cursor(cursor, 2)
+    if not isinstance(score, (int, float)) or isinstance(score, bool) or not isinstance(id_, int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다."
+        )
+    return float(score), id_
+
+def cursor_score(expr):
+    """검색 점수 식을 커서로 쓸 수 있게 double precision으로 바꿉니다.
+
+    ts_rank_cd, word_similarity 등은 real(float4)을 반환하는데, 드라이버는 이를 가장 짧은 십진 표현(0.8)으로
+    돌려주므로 커서로 되돌아온 값이 원래 값(0.800000011920929)과 같지 않아 동점 행이 반복되거나 빠집니다.
+    선택, 정렬, 커서 조건에 모두 이 식을 써야 커서 값과 비교 대상이 정확히 같아집니다.
+    """
+    return cast(expr, DOUBLE_PRECISION)
+
+def keyset_after(created_col, id_col, cursor: Tuple[datetime, int], descending: bool = True):
+    """커서 이후의 행만 남기는 조건을 만듭니다. (created_at, id) 복합 인덱스를 그대로 탑니다."""
+    if descending:
+        return tuple_(created_col, id_col) < tuple_(*cursor)
+    return tuple_(created_col, id_col) > tuple_(*cursor)
+
+def set_next_cursor(
+    response: Response,
+    items: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], Sequence[Any]]
+) -> None:
+    """페이지가 가득 찼으면 마지막 항목으로 다음 페이지 커서를 헤더에 담습니다."""
+    if items and len(items) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(items[-1]))
+
+def cursor_headers(response: Optional[Response]) -> Dict[str, str]:
+    """주입된 response에 담긴 커서 헤더. Response를 직접 만들어 반환할 때 옮겨 담는 용도입니다."""
+    if response is not None and NEXT_CURSOR_HEADER in response.headers:
+        return {NEXT_CURSOR_HEADER: response.headers[NEXT_CURSOR_HEADER]}
+    return {}
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from ..config import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING
+
+class PasswordHasherBusy(Exception):
+    """대기 중인 해싱 요청이 한도를 넘었을 때 발생합니다."""
+
+def make_crypt_context(rounds: int) -> CryptContext:
+    # min/max를 같은 값으로 두면 비용이 다른 기존 해시는 needs_update로 판정되어 로그인 시 다시 저장됨
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+class PasswordHasher:
+    """bcrypt 해싱/검증을 전용 스레드풀에서 실행해 이벤트 루프를 막지 않습니다.
+
+    대기열 길이는 max_pending으로 제한되며, 넘치면 PasswordHasherBusy를 발생시킵니다.
+    """
+
+    def __init__(self, rounds: int, workers: int, max_pending: int):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self.context = make_crypt_context(rounds)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+        self._lock = threading.Lock()
+        self._pending = 0  # 대기 중 + 실행 중
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_run_time = 0.0
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    async def _submit(self, func: Callable, *args) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+        submitted_at = time.perf_counter()
+
+        def job():
+            started_at = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                waited = started_at - submitted_at
+                self.total_queue_wait += waited
+                self.max_queue_wait = max(self.max_queue_wait, waited)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self.total_run_time += time.perf_counter() - started_at
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """비밀번호를 검증하고, 해시의 비용이 현재 설정과 다르면 새 해시도 함께 반환합니다."""
+        return await self._submit(self.context.verify_and_update, password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rounds": self.rounds,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "queue_depth": self._pending - self._running,
+                "running": self._running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_run_ms": self.total_run_time / self.completed * 1000 if self.completed else 0.0,
+                "avg_queue_wait_ms": self.total_queue_wait / self.completed * 1000 if self.completed else 0.0,
+                "max_queue_wait_ms": self.max_queue_wait * 1000,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+password_hasher = PasswordHasher(BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from fastapi import HTTPException, status
+
+@dataclass(frozen=True)
+class Projection:
+    """목록 응답에서 내려줄 필드(fields=)와 함께 포함할 관계(include=)."""
+    fields: Tuple[str, ...]
+    include: FrozenSet[str]
+
+    def includes(self, relation: str) -> bool:
+        return relation in self.include
+
+def _split(raw: str) -> List[str]:
+    return [part.strip() for part in raw.split(",") if part.strip()]
+
+def _reject_unknown(values: Iterable[str], allowed: Sequence[str], label: str) -> None:
+    unknown = [value for value in values if value not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 {label} 값입니다: {', '.join(unknown)} (가능한 값: {', '.join(allowed)})"
+        )
+
+def parse_projection(
+    fields: Optional[str],
+    include: Optional[str],
+    *,
+    allowed_fields: Sequence[str],
+    default_fields: Sequence[str],
+    allowed_include: Sequence[str],
+    required_fields: Sequence[str] = ("id",)
+) -> Optional[Projection]:
+    """쉼표로 구분된 fields=/include= 쿼리 파라미터를 해석합니다.
+
+    둘 다 없으면 None을 반환하며, 호출 측은 기존 전체 응답을 그대로 내려줍니다.
+    fields=만 없으면 default_fields(카드 필드)를 사용합니다.
+    """
+    if fields is None and include is None:
+        return None
+
+    requested = _split(fields) if fields is not None else list(default_fields)
+    _reject_unknown(requested, allowed_fields, "fields")
+    relations = _split(include) if include else []
+    _reject_unknown(relations, allowed_include, "include")
+
+    # 응답 키 순서를 요청 순서와 무관하게 고정
+    selected = list(required_fields) + [
+        name for name in allowed_fields if name in requested and name not in required_fields
+    ]
+    return Projection(tuple(selected), frozenset(relations))
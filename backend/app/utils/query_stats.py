@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, raiseload
+
+from ..config import QUERY_N_PLUS_ONE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time-Ms"
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 쿼리 수와 DB 시간을 모읍니다."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        self.statements[statement] += 1
+
+    def repeated_statements(self, threshold: int = QUERY_N_PLUS_ONE_THRESHOLD) -> Dict[str, int]:
+        """같은 SQL이 threshold번 이상 반복된 경우 (N+1 의심)."""
+        return {statement: count for statement, count in self.statements.items() if count >= threshold}
+
+# 스레드풀(동기 핸들러)과 run_sync 그린렛에도 컨텍스트가 복사되므로
+# 같은 객체를 변경하면 요청 단위로 집계됨
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+def current_query_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+class QueryMetrics:
+    """라우트별 쿼리 수, DB 시간, N+1 의심 횟수를 누적합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, route: str, stats: RequestQueryStats, n_plus_one: int) -> None:
+        with self._lock:
+            metrics = self._routes.setdefault(route, {
+                "requests": 0,
+                "queries": 0,
+                "max_queries": 0,
+                "db_time_ms": 0.0,
+                "n_plus_one_requests": 0,
+            })
+            metrics["requests"] += 1
+            metrics["queries"] += stats.count
+            metrics["max_queries"] = max(metrics["max_queries"], stats.count)
+            metrics["db_time_ms"] += stats.total_time * 1000
+            if n_plus_one:
+                metrics["n_plus_one_requests"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                route: {
+                    **metrics,
+                    "avg_queries": metrics["queries"] / metrics["requests"],
+                    "avg_db_time_ms": metrics["db_time_ms"] / metrics["requests"],
+                }
+                for route, metrics in self._routes.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+query_metrics = QueryMetrics()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+def instrument_engine(engine) -> None:
+    """엔진의 커서 실행 이벤트에 쿼리 집계를 연결합니다. 비동기 엔진은 sync_engine을 넘깁니다."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+def _raise_on_lazy_load(orm_execute_state) -> None:
+    # 관계/컬럼 지연 로딩 자체와 명시적 옵션은 그대로 두고, 최상위 SELECT에만 적용
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+def enable_strict_loading() -> None:
+    """명시적으로 eager load하지 않은 관계에 접근하면 예외가 나도록 합니다 (테스트/개발용)."""
+    if not event.contains(Session, "do_orm_execute", _raise_on_lazy_load):
+        event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
+
+def _route_name(scope) -> str:
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return f"{scope['method']} {route.path}"
+    endpoint = scope.get("endpoint")
+    if endpoint is not None:
+        return f"{scope['method']} {endpoint.__name__}"
+    return f"{scope['method']} {scope['path']}"
+
+class QueryStatsMiddleware:
+    """요청별 쿼리 수와 DB 시간을 응답 헤더로 붙이고, 같은 SQL의 반복(N+1 의심)을 경고합니다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()))
+                headers.append((QUERY_TIME_HEADER.lower().encode(), f"{stats.total_time * 1000:.1f}".encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+            route = _route_name(scope)
+            repeated = stats.repeated_statements()
+            for statement, count in repeated.items():
+                logger.warning(f"Possible N+1 in {route}: {count} executions of {statement[:200]!r}")
+            query_metrics.record(route, stats, len(repeated))
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 비동기 호출을 한 번의 실행으로 합칩니다.
+
+    먼저 온 호출이 작업을 태스크로 시작하고, 끝나기 전에 같은 키로 온 호출은 그 결과(또는 예외)를 함께 받습니다.
+    작업은 shield로 감싸므로 기다리던 요청 하나가 취소되어도 다른 요청의 작업은 계속됩니다.
+    결과를 저장하지는 않으므로 끝난 뒤의 호출은 새로 실행합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        with self._lock:
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func())
+                self._inflight[key] = task
+                task.add_done_callback(lambda done, key=key: self._finish(key, done))
+                self.executions += 1
+            else:
+                self.shared += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        with self._lock:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 처리되지 않았다는 경고가 남지 않도록 읽어 둠
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._inflight),
+                "executions": self.executions,
+                "shared": self.shared,
+            }
@@ -0,0 +1,33 @@
+import itertools
+import random
+from typing import List
+
+def zipf_weights(n: int, s: float) -> List[float]:
+    """순위 k(1..n)의 가중치가 1/k^s인 누적 가중치 목록 (random.choices의 cum_weights용)."""
+    return list(itertools.accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+
+def zipf_sample(rng: random.Random, cum_weights: List[float], k: int) -> List[int]:
+    """누적 가중치에 따라 0-based 인덱스 k개를 복원 추출합니다."""
+    return rng.choices(range(len(cum_weights)), cum_weights=cum_weights, k=k)
+
+def split_total(rng: random.Random, total: int, cum_weights: List[float], cap: int) -> List[int]:
+    """total개를 가중치 비율로 나누되 항목당 cap을 넘지 않게 배분합니다.
+
+    인기 포스트의 좋아요 수처럼 몇몇 항목에 몰리는 분포를 만들 때 사용합니다.
+    """
+    weight_sum = cum_weights[-1]
+    counts = []
+    previous = 0.0
+    for cumulative in cum_weights:
+        expected = total * (cumulative - previous) / weight_sum
+        previous = cumulative
+        # 소수 부분은 확률적으로 올림해서 전체 합이 total에 가깝게 유지되도록 함
+        count = int(expected) + (1 if rng.random() < expected - int(expected) else 0)
+        counts.append(min(count, cap))
+    # 인기 순위와 ID 순서가 겹치지 않도록 섞음
+    rng.shuffle(counts)
+    return counts
+
+def pareto_int(rng: random.Random, alpha: float, minimum: int, maximum: int) -> int:
+    """팔로우 수처럼 긴 꼬리를 갖는 정수를 [minimum, maximum] 범위에서 뽑습니다."""
+    return max(minimum, min(maximum, int(minimum * rng.paretovariate(alpha))))
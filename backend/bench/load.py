@@ -0,0 +1,236 @@
+"""시나리오 기반 부하 측정기.
+
+FastAPI 앱을 httpx ASGITransport로 프로세스 안에서 직접 호출하고, 엔드포인트별
+지연 시간 백분위수와 처리량을 측정합니다. 결과는 bench/results/에 JSON으로 저장되며
+두 실행 결과를 비교해 회귀를 찾을 수 있습니다.
+
+    python -m bench.load run read_heavy --concurrency 32 --duration 60
+    python -m bench.load compare bench/results/a.json bench/results/b.json
+
+앱의 startup 이벤트(스키마 버전 확인, 카운터 작업)는 실행하지 않습니다. 데이터는 bench.seed로 미리 넣어 둡니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.main import app
+from app.utils.auth import create_access_token
+from app.utils.query_stats import QUERY_COUNT_HEADER
+
+from .distributions import zipf_sample, zipf_weights
+from .scenarios import SCENARIOS
+from .seed import SCALES, SEED_MANIFEST, WORDS
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+class RequestContext:
+    """가상 사용자 한 명의 요청 파라미터를 뽑습니다."""
+
+    def __init__(self, rng: random.Random, counts: dict, post_weights: List[float]):
+        self.rng = rng
+        self.counts = counts
+        self._post_weights = post_weights
+
+    def user_id(self) -> int:
+        return self.rng.randint(1, self.counts["users"])
+
+    def author_id(self) -> int:
+        return self.user_id()
+
+    def post_id(self) -> int:
+        return self.rng.randint(1, self.counts["posts"])
+
+    def hot_post_id(self) -> int:
+        # 가중치 상위 포스트에 요청이 몰리도록 함
+        return zipf_sample(self.rng, self._post_weights, 1)[0] + 1
+
+    def workspace_id(self) -> int:
+        return self.rng.randint(1, self.counts["workspaces"])
+
+    def word(self) -> str:
+        return self.rng.choice(WORDS)
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summarize(latencies: List[float], errors: int, queries: List[int], elapsed: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "throughput_rps": len(values) / elapsed if elapsed else 0.0,
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "p50_ms": _percentile(values, 50) * 1000,
+        "p90_ms": _percentile(values, 90) * 1000,
+        "p95_ms": _percentile(values, 95) * 1000,
+        "p99_ms": _percentile(values, 99) * 1000,
+        "max_ms": values[-1] * 1000 if values else 0.0,
+        "avg_queries": sum(queries) / len(queries) if queries else None,
+    }
+
+async def run_scenario(name: str, counts: dict, concurrency: int, duration: float,
+                       max_requests: Optional[int], rng_seed: int) -> dict:
+    operations = SCENARIOS[name]
+    op_weights = [weight for _, weight, _ in operations]
+    post_weights = zipf_weights(min(counts["posts"], 100_000), 1.1)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    queries: Dict[str, List[int]] = defaultdict(list)
+    issued = 0
+    deadline = time.perf_counter() + duration
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+
+        async def worker(worker_id: int):
+            nonlocal issued
+            rng = random.Random(rng_seed + worker_id)
+            user_id = rng.randint(1, counts["users"])
+            headers = {"Authorization": f"Bearer {create_access_token({'sub': f'bench{user_id}@test.com', 'uid': user_id})}"}
+            ctx = RequestContext(rng, counts, post_weights)
+
+            while time.perf_counter() < deadline and (max_requests is None or issued < max_requests):
+                issued += 1
+                op_name, _, build = rng.choices(operations, weights=op_weights, k=1)[0]
+                method, path, params, body = build(ctx)
+                start = time.perf_counter()
+                try:
+                    response = await client.request(method, path, params=params, json=body, headers=headers)
+                except Exception:
+                    errors[op_name] += 1
+                    continue
+                latencies[op_name].append(time.perf_counter() - start)
+                statuses[op_name][response.status_code] += 1
+                if response.status_code >= 500:
+                    errors[op_name] += 1
+                query_count = response.headers.get(QUERY_COUNT_HEADER)
+                if query_count is not None:
+                    queries[op_name].append(int(query_count))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    endpoints = {
+        op_name: {
+            **summarize(latencies[op_name], errors[op_name], queries[op_name], elapsed),
+            "status_codes": dict(statuses[op_name]),
+        }
+        for op_name, _, _ in operations
+    }
+    all_latencies = [value for values in latencies.values() for value in values]
+    all_queries = [value for values in queries.values() for value in values]
+    return {
+        "scenario": name,
+        "started_at": datetime.utcnow().isoformat(),
+        "git_commit": _git_commit(),
+        "config": {"concurrency": concurrency, "duration": duration, "max_requests": max_requests,
+                   "seed": rng_seed, "counts": counts},
+        "elapsed_s": elapsed,
+        "total": summarize(all_latencies, sum(errors.values()), all_queries, elapsed),
+        "endpoints": endpoints,
+    }
+
+def load_counts(scale: Optional[str]) -> dict:
+    """--scale이 없으면 bench.seed가 남긴 manifest의 규모를 사용합니다."""
+    if scale is None and os.path.exists(SEED_MANIFEST):
+        with open(SEED_MANIFEST) as f:
+            return json.load(f)["counts"]
+    return SCALES[scale or "small"]
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+def save_result(result: dict, output: Optional[str]) -> str:
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}_{result['scenario']}.json")
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    return output
+
+def print_result(result: dict) -> None:
+    print(f"\nScenario {result['scenario']} ({result['elapsed_s']:.1f}s, commit {result['git_commit']})")
+    header = f"{'endpoint':<34}{'reqs':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'queries':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result["endpoints"].items()) + [("TOTAL", result["total"])]
+    for name, stats in rows:
+        avg_queries = stats["avg_queries"]
+        print(f"{name:<34}{stats['requests']:>8}{stats['errors']:>6}{stats['throughput_rps']:>9.1f}"
+              f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+              f"{avg_queries if avg_queries is None else round(avg_queries, 1)!s:>9}")
+
+def compare(base_path: str, new_path: str, threshold: float) -> int:
+    """두 실행 결과의 p95와 처리량을 비교하고, threshold 비율 이상 나빠진 엔드포인트 수를 반환합니다."""
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    regressions = 0
+    print(f"{'endpoint':<34}{'p95 base':>10}{'p95 new':>10}{'change':>9}{'rps base':>10}{'rps new':>10}")
+    names = list(new["endpoints"]) + ["TOTAL"]
+    for name in names:
+        old_stats = base["total"] if name == "TOTAL" else base["endpoints"].get(name)
+        new_stats = new["total"] if name == "TOTAL" else new["endpoints"][name]
+        if not old_stats or not old_stats["requests"] or not new_stats["requests"]:
+            continue
+        change = (new_stats["p95_ms"] - old_stats["p95_ms"]) / old_stats["p95_ms"] if old_stats["p95_ms"] else 0.0
+        regressed = change > threshold
+        regressions += regressed
+        print(f"{name:<34}{old_stats['p95_ms']:>10.1f}{new_stats['p95_ms']:>10.1f}{change:>+9.0%}"
+              f"{old_stats['throughput_rps']:>10.1f}{new_stats['throughput_rps']:>10.1f}"
+              f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="API 부하 측정")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="시나리오 실행")
+    run_parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    run_parser.add_argument("--scale", choices=sorted(SCALES), default=None,
+                            help="ID 범위를 정할 데이터 규모 (기본값: 마지막 bench.seed 실행 규모)")
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--duration", type=float, default=30.0, help="실행 시간 (초)")
+    run_parser.add_argument("--requests", type=int, default=None, help="최대 요청 수")
+    run_parser.add_argument("--seed", type=int, default=1)
+    run_parser.add_argument("--output", default=None)
+
+    compare_parser = subparsers.add_parser("compare", help="두 실행 결과 비교")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="p95가 이 비율 이상 늘면 회귀로 판단")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        result = asyncio.run(run_scenario(args.scenario, load_counts(args.scale), args.concurrency,
+                                          args.duration, args.requests, args.seed))
+        print_result(result)
+        print(f"\nSaved to {save_result(result, args.output)}")
+    else:
+        regressions = compare(args.base, args.new, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
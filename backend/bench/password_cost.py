@@ -0,0 +1,52 @@
+"""bcrypt 비용(BCRYPT_ROUNDS) 선택용 벤치마크.
+
+비용별로 해시 한 번의 시간을 재고, 로그인 지연 목표(SLO)와 해싱 스레드 수에서
+감당할 수 있는 초당 로그인 수를 추정합니다.
+
+    python -m bench.password_cost --slo-ms 300 --rounds 10 14 --workers 4
+"""
+import argparse
+import statistics
+import time
+from typing import List, Optional
+
+from app.utils.password_hasher import make_crypt_context
+
+def measure(rounds: int, samples: int) -> List[float]:
+    context = make_crypt_context(rounds)
+    hashed = context.hash("benchmark-password")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("benchmark-password", hashed)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="bcrypt 비용별 로그인 검증 시간 측정")
+    parser.add_argument("--rounds", type=int, nargs=2, default=[10, 14], metavar=("MIN", "MAX"))
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4, help="PASSWORD_HASH_WORKERS 값")
+    parser.add_argument("--slo-ms", type=float, default=300.0, help="로그인 응답 시간 목표 중 해싱에 쓸 수 있는 시간")
+    args = parser.parse_args(argv)
+
+    print(f"{'rounds':>6}{'p50 ms':>10}{'p95 ms':>10}{'logins/s':>10}  within SLO")
+    recommended = None
+    for rounds in range(args.rounds[0], args.rounds[1] + 1):
+        timings = measure(rounds, args.samples)
+        p50 = statistics.median(timings) * 1000
+        p95 = timings[min(len(timings) - 1, int(0.95 * len(timings)))] * 1000
+        # 스레드마다 하나씩 동시에 검증한다고 가정한 최대 처리량 (GIL을 해제하는 bcrypt 구현 기준)
+        throughput = args.workers * 1000 / p50
+        within = p95 <= args.slo_ms
+        if within:
+            recommended = rounds
+        print(f"{rounds:>6}{p50:>10.1f}{p95:>10.1f}{throughput:>10.1f}  {'yes' if within else 'no'}")
+
+    if recommended is None:
+        print(f"\nNo cost fits a {args.slo_ms:.0f} ms SLO on this machine")
+    else:
+        print(f"\nHighest cost within {args.slo_ms:.0f} ms: BCRYPT_ROUNDS={recommended}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""부하 시나리오 정의.
+
+시나리오는 (이름, 가중치, 요청 생성 함수) 목록입니다. 요청 생성 함수는 ctx를 받아
+(method, path, params, json) 튜플을 반환합니다. ctx.post_id()는 인기 포스트에 몰리는
+분포로, ctx.user_id()는 균등 분포로 ID를 뽑습니다.
+"""
+from typing import Callable, Dict, List, Tuple
+
+Operation = Tuple[str, float, Callable]
+
+def _get(path: str, **params):
+    return ("GET", path, params, None)
+
+def _comment(ctx):
+    post_id = ctx.hot_post_id()
+    return ("POST", f"/posts/{post_id}/comments", {}, {"post_id": post_id, "content": "bench comment"})
+
+SCENARIOS: Dict[str, List[Operation]] = {
+    # 앱을 여는 일반 사용자: 피드 위주의 읽기
+    "read_heavy": [
+        ("GET /posts/feed", 40, lambda ctx: _get("/posts/feed", limit=20)),
+        ("GET /posts/{id}", 20, lambda ctx: _get(f"/posts/{ctx.post_id()}")),
+        ("GET /posts/{id}/comments", 15, lambda ctx: _get(f"/posts/{ctx.post_id()}/comments", limit=20)),
+        ("GET /posts?user_id", 10, lambda ctx: _get("/posts/", user_id=ctx.author_id(), limit=20)),
+        ("GET /papers/trending", 5, lambda ctx: _get("/papers/trending")),
+        ("GET /workspaces/my", 5, lambda ctx: _get("/workspaces/my")),
+        ("GET /profile/me/stats", 5, lambda ctx: _get("/profile/me/stats")),
+    ],
+    # 인기 포스트에 좋아요와 댓글이 몰리는 상황
+    "hot_post_writes": [
+        ("POST /posts/{id}/like", 40, lambda ctx: ("POST", f"/posts/{ctx.hot_post_id()}/like", {}, None)),
+        ("DELETE /posts/{id}/like", 20, lambda ctx: ("DELETE", f"/posts/{ctx.hot_post_id()}/like", {}, None)),
+        ("POST /posts/{id}/comments", 10, _comment),
+        ("GET /posts/{id}", 30, lambda ctx: _get(f"/posts/{ctx.hot_post_id()}")),
+    ],
+    # 검색과 워크스페이스 탐색
+    "search": [
+        ("GET /workspaces/search", 30, lambda ctx: _get("/workspaces/search", query=ctx.word())),
+        ("GET /workspaces/users/search", 25, lambda ctx: _get("/workspaces/users/search", query=ctx.word())),
+        ("GET /scraps/search", 25, lambda ctx: _get("/scraps/search", query=ctx.word())),
+        ("GET /workspaces/recommended", 10, lambda ctx: _get("/workspaces/recommended")),
+        ("GET /workspaces/{id}", 10, lambda ctx: _get(f"/workspaces/{ctx.workspace_id()}")),
+    ],
+}
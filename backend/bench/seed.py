@@ -0,0 +1,397 @@
+"""대량 합성 데이터 생성기.
+
+기존 데이터를 모두 지우고, 팔로우/좋아요/워크스페이스 규모가 멱법칙(power-law)을 따르는
+데이터를 PostgreSQL COPY로 적재합니다.
+
+    python -m bench.seed --scale large
+    python -m bench.seed --users 20000 --likes 2000000 --seed 7
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy import text
+
+from app.models.database import Base, SessionLocal, engine
+from app.models.migrate import migrate
+from app.models.seed import SEED_PASSWORD, seed_password_hash
+from app.services.counter_service import reconcile_engagement_counters
+from app.services.timeline_service import TimelineService
+from app.services.trending_service import TrendingService
+from app.config import TIMELINE_FANOUT_MAX_FOLLOWERS
+
+from .distributions import pareto_int, split_total, zipf_sample, zipf_weights
+
+SCALES = {
+    "small": dict(users=1_000, papers=500, posts=5_000, likes=50_000, saves=5_000,
+                  comments=10_000, workspaces=200, scraps=5_000, avg_follows=20),
+    "medium": dict(users=20_000, papers=10_000, posts=200_000, likes=2_000_000, saves=200_000,
+                   comments=400_000, workspaces=4_000, scraps=100_000, avg_follows=30),
+    "large": dict(users=100_000, papers=50_000, posts=1_000_000, likes=10_000_000, saves=1_000_000,
+                  comments=2_000_000, workspaces=20_000, scraps=500_000, avg_follows=30),
+}
+
+FIELDS = [
+    "AI Healthcare", "Quantum Computing", "Genetics", "Materials Science", "Robotics",
+    "Data Science", "Brain Mapping", "Climate Change", "Behavioral Science", "Financial Technology",
+]
+TOPICS = [
+    "Machine Learning", "Deep Learning", "Computer Vision", "NLP", "Reinforcement Learning",
+    "Quantum Algorithms", "Genomics", "Nanotechnology", "Control Systems", "Statistics",
+    "Neuroscience", "Sustainability", "Econometrics", "Graph Theory", "Optimization",
+]
+INSTITUTIONS = ["MIT", "Stanford", "Harvard", "Berkeley", "Caltech", "Princeton", "Yale", "Columbia", "Oxford", "Cambridge", "KAIST", "SNU"]
+WORDS = (
+    "model data learning network analysis method result system approach performance "
+    "training inference graph signal robust efficient scalable neural quantum protein "
+    "climate sensor benchmark dataset transformer attention diffusion sampling"
+).split()
+
+# 마지막으로 생성한 데이터 규모 (bench.load가 ID 범위를 정할 때 사용)
+SEED_MANIFEST = os.path.join(os.path.dirname(__file__), "results", "seed_manifest.json")
+
+def _pg_array(values: Sequence[str]) -> str:
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for v in values)
+    return "{" + ",".join(f'"{v}"' for v in escaped) + "}"
+
+def _csv_value(value):
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (list, tuple)):
+        return _pg_array(value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
+class CopyWriter:
+    """행을 CSV 버퍼에 모았다가 chunk_rows마다 COPY FROM STDIN으로 보냅니다."""
+
+    def __init__(self, connection, table: str, columns: Sequence[str], chunk_rows: int = 100_000):
+        self.connection = connection
+        self.sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        self.table = table
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self._pending = 0
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def write(self, row: Iterable) -> None:
+        self._writer.writerow([_csv_value(value) for value in row])
+        self._pending += 1
+        self.rows += 1
+        if self._pending >= self.chunk_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        self._buffer.seek(0)
+        with self.connection.cursor() as cursor:
+            cursor.copy_expert(self.sql, self._buffer)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._pending = 0
+
+    def close(self) -> int:
+        self._flush()
+        return self.rows
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+class Seeder:
+    def __init__(self, connection, rng: random.Random, now: datetime, **counts):
+        self.connection = connection
+        self.rng = rng
+        self.now = now
+        self.counts = counts
+        self.follower_counts: List[int] = []
+        self.post_created: List[datetime] = []
+
+    def _copy(self, table: str, columns: Sequence[str], rows: Iterable) -> int:
+        start = time.perf_counter()
+        writer = CopyWriter(self.connection, table, columns)
+        for row in rows:
+            writer.write(row)
+        written = writer.close()
+        self.connection.commit()
+        print(f"  {table}: {written:,} rows in {time.perf_counter() - start:.1f}s")
+        return written
+
+    def _past(self, days: int) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randrange(days * 86400))
+
+    def users(self):
+        # 비밀번호 해시는 한 번만 계산해서 모든 사용자가 공유
+        hashed_password = seed_password_hash()
+        rng = self.rng
+
+        def rows():
+            for user_id in range(1, self.counts["users"] + 1):
+                field = rng.choice(FIELDS)
+                yield (
+                    user_id, f"bench{user_id}@test.com", hashed_password, f"Bench User {user_id}",
+                    self._past(365), rng.choice(INSTITUTIONS), field, field,
+                    rng.sample(TOPICS, 3), _sentence(rng, 6),
+                )
+
+        self._copy("users", ["id", "email", "hashed_password", "full_name", "created_at", "institution",
+                             "department", "research_field", "research_interests", "bio"], rows())
+
+    def follows(self):
+        n_users = self.counts["users"]
+        rng = self.rng
+        # 인기 순위(멱법칙)와 사용자 ID를 섞어서 소수의 유명 사용자가 팔로워 대부분을 갖게 함
+        popularity = list(range(1, n_users + 1))
+        rng.shuffle(popularity)
+        cum_weights = zipf_weights(n_users, 1.0)
+        self.follower_counts = [0] * (n_users + 1)
+        min_follows = max(1, self.counts["avg_follows"] // 3)
+
+        def rows():
+            follow_id = 0
+            for follower_id in range(1, n_users + 1):
+                wanted = pareto_int(rng, 1.5, min_follows, min(n_users - 1, 5_000))
+                targets = {popularity[i] for i in zipf_sample(rng, cum_weights, wanted)}
+                targets.discard(follower_id)
+                for following_id in targets:
+                    follow_id += 1
+                    self.follower_counts[following_id] += 1
+                    yield (follow_id, follower_id, following_id, self._past(365))
+
+        self._copy("follows", ["id", "follower_id", "following_id", "created_at"], rows())
+
+    def papers(self):
+        rng = self.rng
+
+        def rows():
+            for paper_id in range(1, self.counts["papers"] + 1):
+                created = self._past(365)
+                yield (
+                    paper_id, _sentence(rng, 8), [f"Author {rng.randrange(10_000)}" for _ in range(rng.randint(1, 6))],
+                    _sentence(rng, 60), created.date().isoformat(), f"bench.{paper_id:07d}",
+                    f"https://arxiv.org/abs/bench.{paper_id:07d}", rng.sample(TOPICS, 2),
+                    created, created, rng.randint(1, self.counts["users"]),
+                )
+
+        self._copy("papers", ["id", "title", "authors", "abstract", "published_date", "arxiv_id", "url",
+                              "categories", "created_at", "updated_at", "user_id"], rows())
+
+    def posts(self):
+        rng = self.rng
+        n_users = self.counts["users"]
+        author_weights = zipf_weights(n_users, 0.8)
+        paper_weights = zipf_weights(self.counts["papers"], 1.0)
+        self.post_created = [self.now]
+
+        def rows():
+            chunk = 100_000
+            post_id = 0
+            remaining = self.counts["posts"]
+            while remaining:
+                size = min(chunk, remaining)
+                remaining -= size
+                authors = zipf_sample(rng, author_weights, size)
+                papers = zipf_sample(rng, paper_weights, size)
+                for author_index, paper_index in zip(authors, papers):
+                    post_id += 1
+                    author_id = author_index + 1
+                    created = self._past(90)
+                    self.post_created.append(created)
+                    yield (
+                        post_id, _sentence(rng, 6), _sentence(rng, 40), _sentence(rng, 8),
+                        [_sentence(rng, 5) for _ in range(3)], created, created, author_id,
+                        paper_index + 1 if rng.random() < 0.8 else None,
+                        self.follower_counts[author_id] > TIMELINE_FANOUT_MAX_FOLLOWERS,
+                    )
+
+        self._copy("posts", ["id", "title", "content", "paper_title", "key_insights", "created_at",
+                             "updated_at", "author_id", "paper_id", "timeline_pull"], rows())
+
+    def _engagement(self, table: str, total: int, skew: float):
+        """포스트별 좋아요/저장 수를 멱법칙으로 나누고, 포스트마다 서로 다른 사용자를 뽑습니다."""
+        rng = self.rng
+        n_users = self.counts["users"]
+        per_post = split_total(rng, total, zipf_weights(self.counts["posts"], skew), cap=n_users)
+
+        def rows():
+            row_id = 0
+            for post_index, count in enumerate(per_post):
+                if not count:
+                    continue
+                post_id = post_index + 1
+                created = self.post_created[post_id]
+                age = max(1, int((self.now - created).total_seconds()))
+                for user_id in rng.sample(range(1, n_users + 1), count):
+                    row_id += 1
+                    yield (row_id, post_id, user_id, created + timedelta(seconds=rng.randrange(age)))
+
+        self._copy(table, ["id", "post_id", "user_id", "created_at"], rows())
+
+    def likes(self):
+        self._engagement("post_likes", self.counts["likes"], 1.1)
+
+    def saves(self):
+        self._engagement("post_saves", self.counts["saves"], 1.0)
+
+    def comments(self):
+        rng = self.rng
+        n_users = self.counts["users"]
+        per_post = split_total(rng, self.counts["comments"], zipf_weights(self.counts["posts"], 1.0), cap=10_000)
+
+        def rows():
+            comment_id = 0
+            for post_index, count in enumerate(per_post):
+                post_id = post_index + 1
+                created = self.post_created[post_id]
+                thread: List[int] = []
+                for _ in range(count):
+                    comment_id += 1
+                    created = created + timedelta(seconds=rng.randrange(1, 3600))
+                    # 30%는 같은 포스트의 앞선 댓글에 대한 답글
+                    parent_id = rng.choice(thread) if thread and rng.random() < 0.3 else None
+                    thread.append(comment_id)
+                    yield (comment_id, _sentence(rng, 12), post_id, rng.randint(1, n_users), created, created, parent_id)
+
+        self._copy("post_comments", ["id", "content", "post_id", "user_id", "created_at", "updated_at", "parent_id"], rows())
+
+    def workspaces(self):
+        rng = self.rng
+        n_users = self.counts["users"]
+        n_workspaces = self.counts["workspaces"]
+        # 대부분은 소규모, 일부는 수천 명 규모
+        sizes = [pareto_int(rng, 1.2, 2, min(n_users, 5_000)) for _ in range(n_workspaces)]
+
+        def workspace_rows():
+            for index, size in enumerate(sizes):
+                created = self._past(365)
+                field = rng.choice(FIELDS)
+                yield (
+                    index + 1, f"{field} Lab {index + 1}", _sentence(rng, 15), field, rng.sample(TOPICS, 3),
+                    rng.randint(1, n_users), rng.random() < 0.8, created, created, size,
+                )
+
+        self._copy("workspaces", ["id", "name", "description", "research_field", "research_topics",
+                                  "owner_id", "is_public", "created_at", "updated_at", "member_count"],
+                   workspace_rows())
+
+        def member_rows():
+            member_id = 0
+            for index, size in enumerate(sizes):
+                for position, user_id in enumerate(rng.sample(range(1, n_users + 1), size)):
+                    member_id += 1
+                    yield (member_id, index + 1, user_id, "maintainer" if position == 0 else "member", self._past(365))
+
+        self._copy("workspace_members", ["id", "workspace_id", "user_id", "role", "joined_at"], member_rows())
+
+        def paper_rows():
+            paper_row_id = 0
+            for index in range(n_workspaces):
+                count = pareto_int(rng, 1.5, 1, min(self.counts["papers"], 200))
+                for paper_id in rng.sample(range(1, self.counts["papers"] + 1), count):
+                    paper_row_id += 1
+                    yield (paper_row_id, index + 1, paper_id, rng.randint(1, n_users), self._past(180),
+                           rng.choice(["in_progress", "completed", "archived"]))
+
+        self._copy("workspace_papers", ["id", "workspace_id", "paper_id", "added_by", "added_at", "status"], paper_rows())
+
+    def scraps(self):
+        rng = self.rng
+        user_weights = zipf_weights(self.counts["users"], 0.8)
+        paper_weights = zipf_weights(self.counts["papers"], 1.0)
+        total = self.counts["scraps"]
+
+        def rows():
+            users = zipf_sample(rng, user_weights, total)
+            papers = zipf_sample(rng, paper_weights, total)
+            for scrap_id, (user_index, paper_index) in enumerate(zip(users, papers), start=1):
+                created = self._past(90)
+                yield (scrap_id, _sentence(rng, 30), "text", _sentence(rng, 8), created, created,
+                       rng.random() < 0.3, user_index + 1, paper_index + 1)
+
+        self._copy("scraps", ["id", "content", "scrap_type", "note", "created_at", "updated_at",
+                              "is_public", "user_id", "paper_id"], rows())
+
+SEEDED_TABLES = [
+    "users", "follows", "papers", "posts", "post_likes", "post_saves", "post_comments",
+    "workspaces", "workspace_members", "workspace_papers", "scraps",
+]
+
+def _reset_sequences(connection) -> None:
+    with connection.cursor() as cursor:
+        for table in SEEDED_TABLES:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+            )
+    connection.commit()
+
+def _rebuild_derived() -> None:
+    """타임라인, 트렌딩 롤업, 참여 카운터처럼 원본에서 파생되는 데이터를 다시 만듭니다."""
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        TimelineService.rebuild(db)
+        TrendingService.rebuild(db)
+        db.commit()
+        reconcile_engagement_counters(db)
+        print(f"  derived data rebuilt in {time.perf_counter() - start:.1f}s")
+    finally:
+        db.close()
+
+def seed(counts: dict, rng_seed: int = 42) -> None:
+    print("Resetting schema...")
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS schema_version"))
+    migrate()
+
+    connection = engine.raw_connection()
+    try:
+        seeder = Seeder(connection, random.Random(rng_seed), datetime.utcnow(), **counts)
+        print("Seeding tables...")
+        for step in (seeder.users, seeder.follows, seeder.papers, seeder.posts, seeder.likes,
+                     seeder.saves, seeder.comments, seeder.workspaces, seeder.scraps):
+            step()
+        _reset_sequences(connection)
+    finally:
+        connection.close()
+
+    _rebuild_derived()
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+
+    os.makedirs(os.path.dirname(SEED_MANIFEST), exist_ok=True)
+    with open(SEED_MANIFEST, "w") as f:
+        json.dump({"counts": counts, "seed": rng_seed, "created_at": datetime.utcnow().isoformat()}, f, indent=2)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터를 생성합니다 (기존 데이터는 삭제됨).")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    for name in SCALES["small"]:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 시드면 같은 데이터)")
+    args = parser.parse_args(argv)
+
+    counts = dict(SCALES[args.scale])
+    for name in counts:
+        value = getattr(args, name)
+        if value is not None:
+            counts[name] = value
+
+    start = time.perf_counter()
+    seed(counts, args.seed)
+    print(f"Done in {time.perf_counter() - start:.1f}s (password for every user: {SEED_PASSWORD!r})")
+
+if __name__ == "__main__":
+    main()
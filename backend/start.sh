@@ -5,6 +5,16 @@ echo "Cleaning media directory..."
 rm -rf /app/app/media/*
 mkdir -p /app/app/media/profile_images
 
+# 스키마 마이그레이션 적용
+echo "Applying database migrations..."
+python -m app.manage migrate
+
+# 개발 환경에서만 시드 데이터 삽입 (이미 있으면 건너뜀)
+if [ "$SEED_DEMO_DATA" = "true" ]; then
+    echo "Seeding demo data..."
+    python -m app.manage seed
+fi
+
 # FastAPI 애플리케이션 실행
 echo "Starting FastAPI application..."
 uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload 
\ No newline at end of file